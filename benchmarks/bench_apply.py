@@ -0,0 +1,65 @@
+"""Compare redeploying a mostly unchanged cluster by resubmitting every unit with Client.apply()
+
+    $ python benchmarks/bench_apply.py [units] [latency ms]
+
+The cluster starts with ``units`` units.  The desired set changes the options of 2% of them and the desired state
+of another 2%.  Fleet can't change the options of an existing unit, so resubmitting means destroying and creating
+every unit; apply() only touches the ones that differ.
+"""
+from __future__ import print_function
+
+import os, sys, time  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from stub_server import StubFleetServer, make_units  # NOQA
+from fleet.v1 import Client, Unit  # NOQA
+
+
+def desired_units(count):
+    units = {}
+    for (i, data) in enumerate(make_units(count)):
+        options = data['options']
+        desired_state = data['desiredState']
+
+        if i % 50 == 1:
+            options = options + [{'section': 'Service', 'name': 'Restart', 'value': 'always'}]
+        elif i % 50 == 2:
+            desired_state = 'loaded'
+
+        units[data['name']] = Unit(options=[dict(x) for x in options], desired_state=desired_state)
+
+    return units
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    desired = desired_units(count)
+
+    print('{0} units, {1}ms latency per request'.format(count, latency))
+    print('{0:<12} {1:>10} {2:>10}'.format('method', 'seconds', 'requests'))
+
+    for method in ('resubmit', 'apply'):
+        server = StubFleetServer(latency=latency / 1000.0, units=count).start()
+
+        try:
+            client = Client(server.endpoint, engine='native')
+            server.requests = 0
+
+            start = time.time()
+            if method == 'resubmit':
+                assert client.destroy_units(list(desired)).ok
+                assert client.create_units(desired).ok
+            else:
+                assert client.apply(desired).ok
+            elapsed = time.time() - start
+
+            print('{0:<12} {1:>10.2f} {2:>10}'.format(method, elapsed, server.requests))
+        finally:
+            server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Compare AsyncClient against Client calls pushed into a thread pool executor
+
+    $ python benchmarks/bench_async.py [operations]
+
+Requires python 3.6.  The stub server adds a little latency to each request, as a real fleet would.
+"""
+from __future__ import print_function
+
+import asyncio, concurrent.futures, os, sys, time  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from stub_server import StubFleetServer  # NOQA
+from fleet.v1 import Client, AsyncClient  # NOQA
+
+
+async def with_executor(endpoint, operations, workers):
+    client = Client(endpoint, engine='native')
+    loop = asyncio.get_event_loop()
+
+    with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+        await asyncio.gather(*[
+            loop.run_in_executor(executor, client.get_unit, 'app-1.service') for _ in range(operations)
+        ])
+
+
+async def with_async_client(endpoint, operations, workers):
+    async with AsyncClient(endpoint, max_connections=workers) as client:
+        await asyncio.gather(*[client.get_unit('app-1.service') for _ in range(operations)])
+
+
+def main():
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    workers = 32
+
+    server = StubFleetServer(units=10, latency=0.002).start()
+
+    try:
+        print('{0} operations, {1} connections/threads'.format(operations, workers))
+        print('{0:<16} {1:>10} {2:>10}'.format('client', 'seconds', 'ops/s'))
+
+        for (label, func) in (('executor', with_executor), ('AsyncClient', with_async_client)):
+            start = time.time()
+            asyncio.get_event_loop().run_until_complete(func(server.endpoint, operations, workers))
+            elapsed = time.time() - start
+
+            print('{0:<16} {1:>10.2f} {2:>10.0f}'.format(label, elapsed, operations / elapsed))
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Compare creating units one at a time with create_units()
+
+    $ python benchmarks/bench_bulk.py [units] [latency ms]
+
+The stub server adds ``latency`` to every request to stand in for a remote fleet, which is where running requests
+concurrently pays off.
+"""
+from __future__ import print_function
+
+import os, sys, time  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from stub_server import StubFleetServer  # NOQA
+from fleet.v1 import Client, Unit  # NOQA
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    server = StubFleetServer(latency=latency / 1000.0).start()
+
+    unit = Unit(from_string='[Service]\nExecStart=/usr/bin/sleep 1d\n[X-Fleet]\nConflicts=bench-*.service')
+
+    try:
+        client = Client(server.endpoint, engine='native', read_back=False)
+
+        print('{0} units created, {1}ms latency per request'.format(count, latency))
+        print('{0:<24} {1:>10} {2:>10}'.format('method', 'seconds', 'units/s'))
+
+        start = time.time()
+        for i in range(count):
+            client.create_unit('bench-serial-{0}.service'.format(i), unit)
+        elapsed = time.time() - start
+
+        print('{0:<24} {1:>10.2f} {2:>10.1f}'.format('create_unit', elapsed, count / elapsed))
+
+        for concurrency in (1, 10, 50):
+            units = [('bench-{0}-{1}.service'.format(concurrency, i), unit) for i in range(count)]
+            result = client.create_units(units, concurrency=concurrency)
+            assert result.ok, result.errors
+
+            print('{0:<24} {1:>10.2f} {2:>10.1f}'.format(
+                'create_units({0})'.format(concurrency), result.elapsed, result.throughput
+            ))
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
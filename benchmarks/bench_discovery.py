@@ -0,0 +1,48 @@
+"""Compare cold vs. warm Client() construction with and without a DiscoveryCache
+
+    $ python benchmarks/bench_discovery.py [iterations] [latency]
+
+"""
+from __future__ import print_function
+
+import os, shutil, sys, tempfile, timeit  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from stub_server import StubFleetServer  # NOQA
+from fleet.v1 import Client, DiscoveryCache  # NOQA
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.005
+
+    server = StubFleetServer(latency=latency).start()
+    tmpdir = tempfile.mkdtemp()
+
+    try:
+        fresh = DiscoveryCache(path=tmpdir, max_age=3600)
+        stale = DiscoveryCache(path=tmpdir, max_age=0)
+        swr = DiscoveryCache(path=tmpdir, max_age=0, stale_while_revalidate=True)
+
+        # prime the cache
+        Client(server.endpoint, discovery_cache=fresh)
+
+        cases = [
+            ('no cache (GET + parse)', lambda: Client(server.endpoint)),
+            ('warm cache (file read)', lambda: Client(server.endpoint, discovery_cache=fresh)),
+            ('stale cache (304 revalidation)', lambda: Client(server.endpoint, discovery_cache=stale)),
+            ('stale-while-revalidate', lambda: Client(server.endpoint, discovery_cache=swr)),
+        ]
+
+        print('{0} iterations, {1:.1f}ms server latency'.format(iterations, latency * 1000))
+        for (label, func) in cases:
+            elapsed = timeit.timeit(func, number=iterations)
+            print('{0:<32} {1:8.3f} ms/Client()'.format(label, elapsed / iterations * 1000))
+    finally:
+        server.shutdown()
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Compare the memory held by a snapshot of a cluster's units and unit states with and without intern_strings
+
+    $ python benchmarks/bench_interning.py [units]
+
+Memory is measured with tracemalloc (python 3.4+) once the listings have been read, so only what the returned
+objects keep alive is counted.
+"""
+from __future__ import print_function
+
+import gc, os, sys, time, tracemalloc  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from stub_server import StubFleetServer  # NOQA
+from fleet.v1 import Client  # NOQA
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    server = StubFleetServer(units=count, states=count, machines=50, page_size=1000).start()
+
+    try:
+        print('{0} units and {0} unit states on 50 machines'.format(count))
+        print('{0:<16} {1:>10} {2:>10}'.format('intern_strings', 'MiB', 'seconds'))
+
+        for intern_strings in (False, True):
+            client = Client(server.endpoint, engine='native', intern_strings=intern_strings)
+
+            gc.collect()
+            tracemalloc.start()
+            start = time.time()
+
+            snapshot = (list(client.list_units()), list(client.list_unit_states()), list(client.list_machines()))
+
+            elapsed = time.time() - start
+            gc.collect()
+            (size, _) = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print('{0!s:<16} {1:>10.1f} {2:>10.2f}'.format(intern_strings, size / 1024.0 / 1024.0, elapsed))
+
+            del snapshot, client
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Compare loading a directory of unit files serially, in a thread pool, and in a process pool
+
+    $ python benchmarks/bench_load_units.py [files] [workers]
+
+Uses the same generated units as bench_unit_parser.py.
+"""
+from __future__ import print_function
+
+import os, shutil, sys, tempfile, time  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from bench_unit_parser import make_unit  # NOQA
+from fleet.v1 import load_units  # NOQA
+
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        for i in range(files):
+            subdir = os.path.join(tmpdir, 'group-{0}'.format(i % 50))
+            if not os.path.isdir(subdir):
+                os.mkdir(subdir)
+
+            with open(os.path.join(subdir, 'bench-{0}.service'.format(i)), 'w') as fh:
+                fh.write(make_unit(100))
+
+        print('{0} unit files of ~100 options'.format(files))
+        print('{0:<24} {1:>10} {2:>10}'.format('mode', 'seconds', 'errors'))
+
+        for (label, kwargs) in (
+            ('serial', {'workers': 1}),
+            ('{0} threads'.format(workers), {'workers': workers}),
+            ('{0} processes'.format(workers), {'workers': workers, 'processes': True}),
+        ):
+            start = time.time()
+            result = load_units(tmpdir, **kwargs)
+            elapsed = time.time() - start
+
+            assert len(result.units) == files
+
+            print('{0:<24} {1:>10.2f} {2:>10}'.format(label, elapsed, len(result.errors)))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Compare the memory and speed of dict-backed FleetObjects and slot-backed UnitStates
+
+    $ python benchmarks/bench_objects.py [states]
+
+Memory is measured with tracemalloc (python 3.4+), and includes the decoded strings the objects hold.  UnitState
+still has the (empty) __dict__ slot it inherits from FleetObject, so it isn't quite as small as a class using only
+__slots__ would be.
+"""
+from __future__ import print_function
+
+import gc, json, os, sys, time, tracemalloc  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from stub_server import make_states  # NOQA
+from fleet.v1.objects import FleetObject, UnitState  # NOQA
+
+
+class DictUnitState(FleetObject):
+    """UnitState as it was, backed by a dict"""
+    pass
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+
+    page = json.dumps({'states': make_states(count)})
+
+    print('{0} unit states'.format(count))
+    print('{0:<16} {1:>10} {2:>12} {3:>14}'.format('class', 'MiB', 'build ms', 'access ms'))
+
+    for cls in (DictUnitState, UnitState):
+        # tracemalloc slows allocation down, so time and measure separately
+        decoded = json.loads(page)['states']
+        start = time.time()
+        states = [cls(data=x) for x in decoded]
+        build = time.time() - start
+        del states, decoded
+
+        gc.collect()
+        tracemalloc.start()
+
+        states = [cls(data=x) for x in json.loads(page)['states']]
+
+        gc.collect()
+        (size, _) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.time()
+        for state in states:
+            state.name, state.machineID, state['systemdSubState']
+        access = time.time() - start
+
+        print('{0:<16} {1:>10.1f} {2:>12.1f} {3:>14.1f}'.format(
+            cls.__name__, size / 1024.0 / 1024.0, build * 1000, access * 1000))
+
+        del states
+
+
+if __name__ == '__main__':
+    main()
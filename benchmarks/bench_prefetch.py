@@ -0,0 +1,53 @@
+"""Compare listing unit states with and without page prefetching
+
+    $ python benchmarks/bench_prefetch.py [states] [latency]
+
+The stub server waits ``latency`` seconds (default 0.02) before each response, and the consumer spends about the
+same time processing each page, so without prefetching the two wait on each other.
+"""
+from __future__ import print_function
+
+import os, sys, time  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from stub_server import StubFleetServer  # NOQA
+from fleet.v1 import Client  # NOQA
+
+
+def main():
+    states = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.02
+
+    server = StubFleetServer(states=states, page_size=100, latency=latency).start()
+
+    try:
+        print('{0} unit states, {1} per page, {2}s latency'.format(states, server.page_size, latency))
+        print('{0:<16} {1:>10} {2:>16}'.format('prefetch_pages', 'seconds', 'first result ms'))
+
+        for prefetch_pages in (0, 1, 4):
+            client = Client(server.endpoint, engine='native', prefetch_pages=prefetch_pages)
+
+            start = time.time()
+            first = None
+            count = 0
+
+            for (i, state) in enumerate(client.list_unit_states()):
+                if first is None:
+                    first = time.time() - start
+
+                # simulate doing something with each page
+                if i % server.page_size == 0:
+                    time.sleep(latency)
+
+                count += 1
+
+            assert count == states
+
+            print('{0:<16} {1:>10.2f} {2:>16.1f}'.format(prefetch_pages, time.time() - start, first * 1000))
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
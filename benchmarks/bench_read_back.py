@@ -0,0 +1,47 @@
+"""Compare writing units with and without reading them back
+
+    $ python benchmarks/bench_read_back.py [units] [latency ms]
+
+Each unit is created and then has it's desired state set, as a deploy would.  The stub server adds ``latency``
+to every request to stand in for a remote fleet.
+"""
+from __future__ import print_function
+
+import os, sys, time  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from stub_server import StubFleetServer  # NOQA
+from fleet.v1 import Client, Unit  # NOQA
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 2
+
+    server = StubFleetServer(latency=latency / 1000.0).start()
+
+    unit = Unit(from_string='[Service]\nExecStart=/usr/bin/sleep 1d\n[X-Fleet]\nConflicts=bench-*.service')
+
+    try:
+        print('{0} units created and started, {1}ms latency per request'.format(count, latency))
+        print('{0:<12} {1:>10} {2:>10}'.format('read_back', 'seconds', 'requests'))
+
+        for read_back in (True, False):
+            client = Client(server.endpoint, engine='native', read_back=read_back)
+            server.requests = 0
+
+            start = time.time()
+            for i in range(count):
+                name = 'bench-{0}-{1}.service'.format(read_back, i)
+                client.create_unit(name, unit)
+                client.set_unit_desired_state(name, 'launched')
+            elapsed = time.time() - start
+
+            print('{0!s:<12} {1:>10.2f} {2:>10}'.format(read_back, elapsed, server.requests))
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
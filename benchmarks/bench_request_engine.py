@@ -0,0 +1,63 @@
+"""Compare per-call overhead of the discovery and native request engines
+
+    $ python benchmarks/bench_request_engine.py [iterations]
+
+The stub server runs in the same process, so CPU time includes it's share of each request; that share is the
+same for both engines, so the difference between them is the client's overhead.
+"""
+from __future__ import print_function
+
+import os, sys, time  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from stub_server import StubFleetServer  # NOQA
+from fleet.v1 import Client  # NOQA
+
+try:  # pragma: no cover
+    cpu_time = time.process_time
+except AttributeError:  # pragma: no cover
+    # python 2
+    cpu_time = time.clock
+
+
+def measure(func, iterations):
+    wall_start = time.time()
+    cpu_start = cpu_time()
+
+    for _ in range(iterations):
+        func()
+
+    return ((time.time() - wall_start) / iterations, (cpu_time() - cpu_start) / iterations)
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    server = StubFleetServer(units=10, machines=10).start()
+
+    try:
+        print('{0} iterations'.format(iterations))
+        print('{0:<10} {1:<16} {2:>12} {3:>12}'.format('engine', 'call', 'wall us', 'cpu us'))
+
+        for engine in Client._ENGINES:
+            client = Client(server.endpoint, engine=engine)
+
+            cases = [
+                ('Machines.List', lambda: client._single_request('Machines.List')),
+                ('Units.Get', lambda: client._single_request('Units.Get', unitName='app-1.service')),
+                ('UnitState.List', lambda: client._single_request('UnitState.List', machineID=None)),
+            ]
+
+            for (label, func) in cases:
+                # warm up connections and any caches
+                func()
+
+                (wall, cpu) = measure(func, iterations)
+                print('{0:<10} {1:<16} {2:>12.1f} {3:>12.1f}'.format(engine, label, wall * 1e6, cpu * 1e6))
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
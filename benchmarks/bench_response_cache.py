@@ -0,0 +1,53 @@
+"""Compare repeated reads of the same units and machines with and without a ResponseCache
+
+    $ python benchmarks/bench_response_cache.py [reads] [latency ms]
+
+Each read looks up a unit and lists the machines, as a control loop checking on a service would.  Every tenth read
+also sets the unit's desired state, which drops it from the cache.
+"""
+from __future__ import print_function
+
+import os, sys, time  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from stub_server import StubFleetServer  # NOQA
+from fleet.v1 import Client, ResponseCache  # NOQA
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 2
+
+    server = StubFleetServer(latency=latency / 1000.0, units=100, machines=50).start()
+
+    try:
+        print('{0} reads, {1}ms latency per request'.format(count, latency))
+        print('{0:<16} {1:>10} {2:>10}'.format('cache', 'seconds', 'requests'))
+
+        for cache in (None, ResponseCache(ttl=5)):
+            client = Client(server.endpoint, engine='native', read_back=False, response_cache=cache)
+            server.requests = 0
+
+            start = time.time()
+            for i in range(count):
+                name = 'app-{0}.service'.format(i % 10)
+                client.get_unit(name)
+                list(client.list_machines())
+
+                if i % 10 == 9:
+                    client.set_unit_desired_state(name, 'launched')
+            elapsed = time.time() - start
+
+            print('{0:<16} {1:>10.2f} {2:>10}'.format(
+                'ResponseCache' if cache else 'None', elapsed, server.requests
+            ))
+
+            if cache:
+                print(cache.stats)
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Compare a scripted rolling update, each unit polling for itself, with Client.rolling_update()
+
+    $ python benchmarks/bench_rollout.py [units] [window] [start delay ms]
+
+Both replace ``units`` units, ``window`` at a time, each taking ``start delay`` to come up after it's created, and
+check on them every 50ms.  The script polls list_unit_states(unit_name=...) once per unit in flight;
+rolling_update() lists unit states once for all of them.
+"""
+from __future__ import print_function
+
+import os, sys, time  # NOQA
+
+import multiprocessing.pool
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from stub_server import StubFleetServer  # NOQA
+from fleet.v1 import APIError, Client, Unit  # NOQA
+
+POLL_INTERVAL = 0.05
+
+
+def scripted(client, name, unit):
+    """Replace one unit and wait for it to come up, the way we did before rolling_update()"""
+    try:
+        client.destroy_unit(name)
+    except APIError:
+        pass
+
+    client.create_unit(name, unit, read_back=False)
+
+    while True:
+        time.sleep(POLL_INTERVAL)
+        states = list(client.list_unit_states(unit_name=name))
+        if states and all(x.systemdSubState == 'running' for x in states):
+            return
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    window = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    delay = float(sys.argv[3]) if len(sys.argv) > 3 else 200
+
+    units = [('app-{0}.service'.format(i), Unit(from_string='[Service]\nExecStart=/usr/bin/app {0}\n'.format(i)))
+             for i in range(count)]
+
+    print('{0} units, {1} at a time, {2}ms to start'.format(count, window, delay))
+    print('{0:<16} {1:>10} {2:>10}'.format('method', 'seconds', 'requests'))
+
+    for method in ('scripted', 'rolling_update'):
+        server = StubFleetServer(units=count, start_delay=delay / 1000.0).start()
+
+        try:
+            client = Client(server.endpoint, engine='native')
+            server.requests = 0
+
+            start = time.time()
+            if method == 'scripted':
+                pool = multiprocessing.pool.ThreadPool(window)
+                pool.map(lambda item: scripted(client, *item), units)
+                pool.close()
+                pool.join()
+            else:
+                assert client.rolling_update(units, max_unavailable=window, poll_interval=POLL_INTERVAL).ok
+            elapsed = time.time() - start
+
+            print('{0:<16} {1:>10.2f} {2:>10}'.format(method, elapsed, server.requests))
+        finally:
+            server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
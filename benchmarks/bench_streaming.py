@@ -0,0 +1,49 @@
+"""Compare time to first result and peak memory when listing with and without streaming
+
+    $ python benchmarks/bench_streaming.py [states]
+
+All states are returned in a single page, as large pages are where streaming helps.  Peak memory is measured
+with tracemalloc (python 3.4+) and includes the stub server's share, which is the same for both.
+"""
+from __future__ import print_function
+
+import os, sys, time, tracemalloc  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from stub_server import StubFleetServer  # NOQA
+from fleet.v1 import Client  # NOQA
+
+
+def main():
+    states = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+
+    server = StubFleetServer(states=states, page_size=states).start()
+
+    try:
+        print('{0} unit states in one page'.format(states))
+        print('{0:<12} {1:>10} {2:>16} {3:>12}'.format('streaming', 'seconds', 'first result ms', 'peak MiB'))
+
+        for streaming in (False, True):
+            client = Client(server.endpoint, engine='native', streaming=streaming)
+
+            tracemalloc.start()
+            start = time.time()
+            first = None
+
+            for state in client.list_unit_states():
+                if first is None:
+                    first = time.time() - start
+
+            elapsed = time.time() - start
+            (_, peak) = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print('{0!s:<12} {1:>10.2f} {2:>16.1f} {3:>12.1f}'.format(
+                streaming, elapsed, first * 1000, peak / 1024.0 / 1024.0))
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Compare one Client shared by many threads against one Client per thread
+
+    $ python benchmarks/bench_threads.py [threads] [requests per thread]
+
+The stub server adds a little latency to each request, so threads spend most of their time waiting on it as they
+would against a real fleet.
+"""
+from __future__ import print_function
+
+import os, sys, threading, time  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from stub_server import StubFleetServer  # NOQA
+from fleet.v1 import Client  # NOQA
+
+
+def run(threads, requests, get_client):
+    def work():
+        client = get_client()
+        for _ in range(requests):
+            client.get_unit('app-1.service')
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+
+    start = time.time()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    return time.time() - start
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    server = StubFleetServer(units=10, latency=0.005).start()
+
+    try:
+        print('{0} threads, {1} requests each'.format(threads, requests))
+        print('{0:<20} {1:>10} {2:>16} {3:>10}'.format('client', 'seconds', 'server requests', 'req/s'))
+
+        shared = Client(server.endpoint)
+        cases = [
+            ('per thread', lambda: Client(server.endpoint)),
+            ('shared', lambda: shared),
+        ]
+
+        for (label, get_client) in cases:
+            before = server.requests
+            elapsed = run(threads, requests, get_client)
+            print('{0:<20} {1:>10.2f} {2:>16} {3:>10.0f}'.format(
+                label, elapsed, server.requests - before, threads * requests / elapsed))
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
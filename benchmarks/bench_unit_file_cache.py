@@ -0,0 +1,57 @@
+"""Compare repeatedly loading unchanged unit files with Unit(from_file=...) and a UnitFileCache
+
+    $ python benchmarks/bench_unit_file_cache.py [files] [passes]
+
+Simulates a reconciler reading the same directory of units on every pass.  Uses the same generated units as
+bench_unit_parser.py.
+"""
+from __future__ import print_function
+
+import os, shutil, sys, tempfile, time  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from bench_unit_parser import make_unit  # NOQA
+from fleet.v1 import Unit, UnitFileCache  # NOQA
+
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    passes = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        paths = []
+        for i in range(files):
+            paths.append(os.path.join(tmpdir, 'bench-{0}.service'.format(i)))
+            with open(paths[-1], 'w') as fh:
+                fh.write(make_unit(100))
+
+        print('{0} unit files of ~100 options, {1} passes'.format(files, passes))
+        print('{0:<26} {1:>12} {2:>14}'.format('loader', 'first ms', 'per pass ms'))
+
+        loaders = (
+            ('Unit(from_file=...)', lambda path: Unit(from_file=path)),
+            ('UnitFileCache', UnitFileCache(max_entries=files).load),
+            ('UnitFileCache on disk', UnitFileCache(max_entries=files, path=os.path.join(tmpdir, 'cache')).load),
+        )
+
+        for (label, load) in loaders:
+            start = time.time()
+            for path in paths:
+                load(path)
+            first = time.time() - start
+
+            start = time.time()
+            for _ in range(passes):
+                for path in paths:
+                    load(path)
+            per_pass = (time.time() - start) / passes
+
+            print('{0:<26} {1:>12.1f} {2:>14.1f}'.format(label, first * 1000, per_pass * 1000))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Compare adding, looking up, and removing options on a Unit with many of them, with and without the option index
+
+    $ python benchmarks/bench_unit_options.py [options]
+
+``ScanningUnit`` is Unit as it was: lookups scan every option, and remove_option calls list.remove per match.
+"""
+from __future__ import print_function
+
+import os, sys, time  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from fleet.v1.objects import Unit  # NOQA
+
+
+class ScanningUnit(Unit):
+    def get_option_values(self, section, name):
+        return [x['value'] for x in self._data['options'] if x['section'] == section and x['name'] == name]
+
+    def add_option(self, section, name, value):
+        self._data['options'].append({'section': section, 'name': name, 'value': value})
+        return True
+
+    def remove_option(self, section, name, value=None):
+        removed = 0
+        for option in list(self._data['options']):
+            if option['section'] == section and option['name'] == name:
+                if value is None or option['value'] == value:
+                    self._data['options'].remove(option)
+                    removed += 1
+
+        return removed > 0
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    print('{0} Environment= and {0} ExecStartPre= options'.format(count))
+    print('{0:<14} {1:>10} {2:>12} {3:>12}'.format('class', 'add ms', 'lookup ms', 'remove ms'))
+
+    for cls in (ScanningUnit, Unit):
+        unit = cls()
+
+        start = time.time()
+        for i in range(count):
+            unit.add_option('Service', 'Environment', 'VAR{0}=value'.format(i))
+            unit.add_option('Service', 'ExecStartPre', '/usr/bin/true {0}'.format(i))
+        added = time.time() - start
+
+        start = time.time()
+        for _ in range(100):
+            unit.get_option_values('Service', 'Environment')
+            unit.get_option_values('Unit', 'Description')
+        looked_up = time.time() - start
+
+        start = time.time()
+        for i in range(0, count, 10):
+            unit.remove_option('Service', 'ExecStartPre', '/usr/bin/true {0}'.format(i))
+        unit.remove_option('Service', 'Environment')
+        removed = time.time() - start
+
+        print('{0:<14} {1:>10.1f} {2:>12.1f} {3:>12.1f}'.format(
+            cls.__name__, added * 1000, looked_up * 1000, removed * 1000))
+
+
+if __name__ == '__main__':
+    main()
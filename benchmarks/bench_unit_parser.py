@@ -0,0 +1,102 @@
+"""Compare parsing a generated corpus of large unit files with the old and new unit file parsers
+
+    $ python benchmarks/bench_unit_parser.py [files] [options per file]
+
+Each file has a few sections, comments, and multi-line values.  Both parsers read the same files from disk.
+"""
+from __future__ import print_function
+
+import os, shutil, sys, tempfile, time  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from fleet.v1.objects import parse_unit_file  # NOQA
+
+
+def old_parse_unit_file(file_handle):
+    """Unit._set_options_from_file as it was"""
+    options = []
+    line_number = 0
+    section = None
+    for line in file_handle.read().splitlines():
+        line_number += 1
+        orig_line = line
+        line = line.strip()
+
+        if not line or line.startswith('#'):
+            continue
+
+        if line.startswith('[') and line.endswith(']'):
+            section = line.strip('[]')
+            continue
+
+        if not section:
+            raise ValueError('outside of a section')
+
+        continuation = False
+        try:
+            if options[-1]['value'].endswith('\\'):
+                options[-1]['value'] = options[-1]['value'][:-1]
+                continuation = True
+        except IndexError:
+            pass
+
+        if continuation:
+            options[-1]['value'] += orig_line
+            continue
+
+        name, value = line.split('=', 1)
+        options.append({'section': section, 'name': name, 'value': value})
+
+    return options
+
+
+def make_unit(options):
+    """Return the text of a unit file with roughly ``options`` options"""
+    lines = ['# generated for bench_unit_parser.py', '[Unit]', 'Description=benchmark unit', 'After=docker.service',
+             '', '[Service]']
+
+    for i in range(options):
+        if i % 10 == 0:
+            lines.append('# environment block {0}'.format(i))
+        if i % 25 == 0:
+            lines.append('ExecStartPre=/usr/bin/docker run --rm \\')
+            lines.append('    -e VAR{0}=1 \\'.format(i))
+            lines.append('    busybox /bin/true')
+        else:
+            lines.append('Environment=VAR{0}=value-{0}'.format(i))
+
+    lines.extend(['', '[X-Fleet]', 'Conflicts=bench-*.service'])
+
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    options = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        paths = []
+        for i in range(files):
+            paths.append(os.path.join(tmpdir, 'bench-{0}.service'.format(i)))
+            with open(paths[-1], 'w') as fh:
+                fh.write(make_unit(options))
+
+        print('{0} unit files of ~{1} options'.format(files, options))
+        print('{0:<22} {1:>10} {2:>14}'.format('parser', 'seconds', 'files/second'))
+
+        for parse in (old_parse_unit_file, parse_unit_file):
+            start = time.time()
+            for path in paths:
+                with open(path, 'r') as fh:
+                    parse(fh)
+            elapsed = time.time() - start
+
+            print('{0:<22} {1:>10.2f} {2:>14.0f}'.format(parse.__name__, elapsed, files / elapsed))
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Compare rendering large units with str() before and after the single-pass renderer
+
+    $ python benchmarks/bench_unit_render.py [options] [sections]
+
+``SectionScanningUnit`` is Unit.__str__ as it was: a set of sections, then a scan of every option per section.
+"""
+from __future__ import print_function
+
+import os, sys, time  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from fleet.v1.objects import Unit  # NOQA
+
+
+class SectionScanningUnit(Unit):
+    def __str__(self):
+        output = []
+        for section in set([x['section'] for x in self._data['options']]):
+            output.append(u'[{0}]'.format(section))
+            for option in self._data['options']:
+                if option['section'] == section:
+                    output.append(u'{0}={1}'.format(option['name'], option['value']))
+
+        return u"\n".join(output)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    sections = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    options = [{'section': 'Section{0}'.format(i % sections), 'name': 'Environment', 'value': 'VAR{0}=1'.format(i)}
+               for i in range(count)]
+
+    print('{0} options in {1} sections, rendered 20 times'.format(count, sections))
+    print('{0:<20} {1:>12} {2:>16}'.format('class', 'first ms', 'repeated ms'))
+
+    for cls in (SectionScanningUnit, Unit):
+        unit = cls(options=list(options))
+
+        start = time.time()
+        str(unit)
+        first = time.time() - start
+
+        start = time.time()
+        for _ in range(20):
+            str(unit)
+        repeated = time.time() - start
+
+        print('{0:<20} {1:>12.2f} {2:>16.2f}'.format(cls.__name__, first * 1000, repeated * 1000))
+
+
+if __name__ == '__main__':
+    main()
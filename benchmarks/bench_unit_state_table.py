@@ -0,0 +1,52 @@
+"""Compare counting failed units per machine with UnitState objects and with a UnitStateTable
+
+    $ python benchmarks/bench_unit_state_table.py [states]
+"""
+from __future__ import print_function
+
+import collections, os, sys, time  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from stub_server import make_states  # NOQA
+from fleet.v1.objects import UnitState, UnitStateTable  # NOQA
+
+
+def timed(func, repeat=5):
+    start = time.time()
+    for _ in range(repeat):
+        result = func()
+    return (result, (time.time() - start) / repeat)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    states = make_states(count, machines=100)
+
+    (objects, load_objects) = timed(lambda: [UnitState(data=x) for x in states], 1)
+    (table, load_table) = timed(lambda: UnitStateTable(states), 1)
+
+    def with_objects():
+        counts = collections.defaultdict(int)
+        for state in objects:
+            if state.systemdSubState == 'failed':
+                counts[state.machineID] += 1
+        return dict(counts)
+
+    def with_table():
+        return table.filter(systemdSubState='failed').count('machineID')
+
+    (expected, objects_time) = timed(with_objects)
+    (result, table_time) = timed(with_table)
+
+    assert result == expected
+
+    print('{0} unit states, failed units per machine'.format(count))
+    print('{0:<16} {1:>10} {2:>10}'.format('', 'load ms', 'query ms'))
+    print('{0:<16} {1:>10.1f} {2:>10.1f}'.format('UnitState', load_objects * 1000, objects_time * 1000))
+    print('{0:<16} {1:>10.1f} {2:>10.1f}'.format('UnitStateTable', load_table * 1000, table_time * 1000))
+
+
+if __name__ == '__main__':
+    main()
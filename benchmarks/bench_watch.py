@@ -0,0 +1,74 @@
+"""Compare diffing whole snapshots of UnitState objects with a UnitStateWatcher
+
+    $ python benchmarks/bench_watch.py [states] [polls]
+
+Between polls 1% of the states change.  The snapshot approach lists UnitStates, indexes them by (name, machineID)
+and compares each one's as_dict() with the last poll's, as consumers did before watch_unit_states().  The watcher
+compares a tuple of the fields that matter and only builds UnitStates for the changes.
+"""
+from __future__ import print_function
+
+import os, sys, time  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from stub_server import StubFleetServer  # NOQA
+from fleet.v1 import Client  # NOQA
+
+
+def churn(server, poll):
+    """Flip 1% of the states between running and failed"""
+    for state in server.states[poll % 100::100]:
+        running = state['systemdSubState'] == 'running'
+        state['systemdActiveState'] = 'failed' if running else 'active'
+        state['systemdSubState'] = 'failed' if running else 'running'
+
+
+def snapshot_diff(client, previous):
+    current = dict(((x.name, x.machineID), x.as_dict()) for x in client.list_unit_states())
+
+    changed = [key for (key, value) in current.items() if previous.get(key) != value]
+    removed = [key for key in previous if key not in current]
+
+    return (current, len(changed) + len(removed))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    polls = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    server = StubFleetServer(states=count, page_size=1000).start()
+
+    try:
+        client = Client(server.endpoint, engine='native')
+
+        print('{0} unit states, {1} polls, 1% changing between polls'.format(count, polls))
+        print('{0:<16} {1:>12} {2:>10}'.format('method', 'ms per poll', 'events'))
+
+        previous = snapshot_diff(client, {})[0]
+        events = 0
+        start = time.time()
+        for poll in range(polls):
+            churn(server, poll)
+            (previous, n) = snapshot_diff(client, previous)
+            events += n
+        elapsed = time.time() - start
+
+        print('{0:<16} {1:>12.1f} {2:>10}'.format('snapshot diff', elapsed * 1000 / polls, events))
+
+        watcher = client.watch_unit_states(initial=False)
+        watcher.poll()
+        events = 0
+        start = time.time()
+        for poll in range(polls):
+            churn(server, poll)
+            events += len(watcher.poll())
+        elapsed = time.time() - start
+
+        print('{0:<16} {1:>12.1f} {2:>10}'.format('watcher', elapsed * 1000 / polls, events))
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+"""A minimal in-memory fleet v1 API server for benchmarking python-fleet
+
+This is not a fleet implementation, it only understands enough of the API to exercise the client:
+discovery (with ETag support), machines, units, and unit state, with pagination and optional latency.  Units
+created can optionally report a unit state that comes up after a delay.
+"""
+
+try:  # pragma: no cover
+    # python 2
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    import urlparse
+except ImportError:  # pragma: no cover
+    # python 3
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    import urllib.parse as urlparse
+
+import json, os, sys, threading, time  # NOQA
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from fleet.v1.objects import unit_hash  # NOQA
+
+DISCOVERY = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'fleet', 'v1', 'tests', 'fixtures',
+                         'fleet_v1.json')
+
+
+def make_states(count, machines=10):
+    """Generate ``count`` plausible unit states spread over ``machines`` machines"""
+    states = []
+    for i in range(count):
+        states.append({
+            'name': 'app-{0}.service'.format(i),
+            'hash': '{0:040x}'.format(i),
+            'machineID': '{0:032x}'.format(i % machines),
+            'systemdLoadState': 'loaded',
+            'systemdActiveState': 'active' if i % 50 else 'failed',
+            'systemdSubState': 'running' if i % 50 else 'failed'
+        })
+    return states
+
+
+def make_units(count, machines=10):
+    """Generate ``count`` plausible units spread over ``machines`` machines"""
+    units = []
+    for i in range(count):
+        units.append({
+            'name': 'app-{0}.service'.format(i),
+            'desiredState': 'launched',
+            'currentState': 'launched',
+            'machineID': '{0:032x}'.format(i % machines),
+            'options': [
+                {'section': 'Unit', 'name': 'Description', 'value': 'app {0}'.format(i)},
+                {'section': 'Service', 'name': 'ExecStart', 'value': '/usr/bin/sleep 1d'},
+                {'section': 'X-Fleet', 'name': 'Conflicts', 'value': 'app-*.service'},
+            ]
+        })
+    return units
+
+
+class FleetHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    # send each response in a single write, otherwise delayed ACKs add 40ms to every keep-alive request
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=None, headers=None):
+        content = b''
+        if body is not None:
+            content = json.dumps(body).encode('utf-8')
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _page(self, key, items, query):
+        page_size = self.server.page_size
+        start = int(query.get('nextPageToken', ['0'])[0])
+
+        body = {key: items[start:start + page_size]}
+        if start + page_size < len(items):
+            body['nextPageToken'] = str(start + page_size)
+
+        return body
+
+    def _route(self, method):
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        parsed = urlparse.urlparse(self.path)
+        path = parsed.path
+        query = urlparse.parse_qs(parsed.query)
+
+        self.server.requests += 1
+
+        if path == '/fleet/v1/discovery':
+            if self.headers.get('If-None-Match') == self.server.discovery_etag:
+                return self._send(304, headers={'ETag': self.server.discovery_etag})
+
+            content = self.server.discovery
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(content)))
+            self.send_header('ETag', self.server.discovery_etag)
+            self.end_headers()
+            self.wfile.write(content)
+            return
+
+        if path == '/fleet/v1/machines':
+            return self._send(200, self._page('machines', self.server.machines, query))
+
+        if path == '/fleet/v1/state':
+            states = self.server.states + self.server.started_states()
+            for (param, key) in (('machineID', 'machineID'), ('unitName', 'name')):
+                if param in query:
+                    states = [x for x in states if x[key] == query[param][0]]
+            return self._send(200, self._page('states', states, query))
+
+        if path == '/fleet/v1/units':
+            return self._send(200, self._page('units', list(self.server.units.values()), query))
+
+        if path.startswith('/fleet/v1/units/'):
+            name = path[len('/fleet/v1/units/'):]
+
+            if method == 'GET':
+                if name not in self.server.units:
+                    return self._send(404, {'error': {'code': 404, 'message': 'unit does not exist'}})
+                return self._send(200, self.server.units[name])
+
+            if method == 'DELETE':
+                self.server.starting.pop(name, None)
+                if self.server.units.pop(name, None) is None:
+                    return self._send(404, {'error': {'code': 404, 'message': 'unit does not exist'}})
+                return self._send(204)
+
+            if method == 'PUT':
+                length = int(self.headers.get('Content-Length', 0))
+                body = json.loads(self.rfile.read(length).decode('utf-8'))
+
+                unit = self.server.units.get(name)
+                if unit is None:
+                    unit = {'name': name, 'currentState': 'inactive', 'machineID': '{0:032x}'.format(0)}
+                    self.server.units[name] = unit
+                unit.update(body)
+
+                if self.server.start_delay is not None and body.get('options'):
+                    self.server.starting[name] = (unit_hash(body['options']), time.time())
+
+                return self._send(204)
+
+        return self._send(404, {'error': {'code': 404, 'message': 'not found'}})
+
+    def do_GET(self):
+        self._route('GET')
+
+    def do_PUT(self):
+        self._route('PUT')
+
+    def do_DELETE(self):
+        self._route('DELETE')
+
+
+class StubFleetServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    # the default of 5 drops connections when many clients connect at once
+    request_queue_size = 1024
+
+    def __init__(self, address=('127.0.0.1', 0), latency=0, page_size=100, units=0, states=0, machines=10,
+                 start_delay=None):
+        HTTPServer.__init__(self, address, FleetHandler)
+
+        with open(DISCOVERY, 'rb') as fh:
+            self.discovery = fh.read()
+        self.discovery_etag = '"stub-discovery"'
+
+        self.latency = latency
+        self.page_size = page_size
+        self.requests = 0
+
+        self.machines = [{'id': '{0:032x}'.format(i), 'primaryIP': '198.51.100.{0}'.format(i)}
+                         for i in range(machines)]
+        self.units = dict((x['name'], x) for x in make_units(units, machines))
+        self.states = make_states(states, machines)
+
+        # if start_delay is set, units created report a state that becomes active/running start_delay seconds later
+        self.start_delay = start_delay
+        self.starting = {}
+
+    def started_states(self):
+        """States for the units created since we started, see start_delay"""
+        now = time.time()
+        states = []
+        for (name, (hash, created)) in list(self.starting.items()):
+            running = now - created >= self.start_delay
+            states.append({
+                'name': name,
+                'hash': hash,
+                'machineID': '{0:032x}'.format(0),
+                'systemdLoadState': 'loaded',
+                'systemdActiveState': 'active' if running else 'activating',
+                'systemdSubState': 'running' if running else 'start'
+            })
+        return states
+
+    @property
+    def endpoint(self):
+        return 'http://{0}:{1}'.format(*self.server_address[:2])
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+        return self
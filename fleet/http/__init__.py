@@ -1,2 +1,3 @@
 from .unix_socket import *  # NOQA
 from .ssh_tunnel import *  # NOQA
+from .pool import *  # NOQA
@@ -0,0 +1,344 @@
+try:  # pragma: no cover
+    # python 2
+    import httplib
+except ImportError:  # pragma: no cover
+    # python 3
+    import http.client as httplib
+
+import select
+import socket
+import threading
+import time
+
+
+class SocketPool(object):
+    """A pool of idle, connected sockets (or socket-like objects) that can be reused for HTTP/1.1 keep-alive
+
+    Sockets are handed out with checkout(), and given back with checkin() once the response on them has
+    been read. Idle sockets are health checked before they are handed out again, and are closed once
+    they have been idle for longer than ``idle_timeout``.
+
+        >>> pool = SocketPool(connect=lambda: socket.create_connection(('127.0.0.1', 49153)))
+        >>> sock = pool.checkout()
+        >>> # ... make a request and read the response ...
+        >>> pool.checkin(sock)
+
+    """
+
+    def __init__(self, connect, max_size=10, idle_timeout=30, max_active=None, limiter=None):
+        """
+        Args:
+            connect (callable): Called with no arguments to create a new connected socket
+            max_size (int): The maximum number of idle sockets to keep, defaults to 10.
+                            0 disables pooling, sockets are closed as soon as they are checked in.
+            idle_timeout (float): Close sockets that have been idle for this many seconds, defaults to 30.
+            max_active (int, optional): The maximum number of sockets that can be checked out at once.
+                                        checkout() blocks until one is returned. Defaults to None (no limit).
+            limiter (threading.Semaphore, optional): A semaphore shared with other pools, to limit the number of
+                                                     sockets checked out across all of them. Overrides max_active.
+
+        """
+
+        self._connect = connect
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+
+        self._active = limiter
+        if self._active is None and max_active:
+            self._active = threading.BoundedSemaphore(max_active)
+
+        # (socket, time it was checked in); most recently used sockets are at the end
+        self._idle = []
+        self._lock = threading.Lock()
+
+        self.stats = {
+            'created': 0,
+            'reused': 0,
+            'discarded': 0,
+            'evicted': 0
+        }
+
+    def __len__(self):
+        """Return the number of idle sockets in the pool"""
+        return len(self._idle)
+
+    def is_healthy(self, sock):
+        """Determine if an idle socket can be reused
+
+        An idle keep-alive socket should have nothing to read; if it's readable the peer either closed
+        it or sent data we weren't expecting, and either way it's no good to us.
+
+        Args:
+            sock (socket-like): The socket to check
+
+        Returns:
+            True: The socket can be reused
+            False: The socket should be discarded
+        """
+        try:
+            (readable, _, _) = select.select([sock], [], [], 0)
+        except (select.error, socket.error, ValueError, TypeError):
+            return False
+
+        return not readable
+
+    def _close(self, sock):
+        """Close a socket, ignoring any errors doing so"""
+        try:
+            sock.close()
+        except Exception:  # pragma: no cover
+            pass
+
+    def _evict(self, now):
+        """Remove idle sockets that have exceeded idle_timeout, or don't fit in max_size
+
+        Must be called with the lock held.
+
+        Returns:
+            list: The sockets that should be closed
+        """
+        expired = [sock for (sock, since) in self._idle if now - since >= self.idle_timeout]
+
+        if expired:
+            self._idle = [(sock, since) for (sock, since) in self._idle if now - since < self.idle_timeout]
+
+        # the oldest sockets are at the start
+        overflow = len(self._idle) - max(self.max_size, 0)
+        if overflow > 0:
+            expired.extend(sock for (sock, _) in self._idle[:overflow])
+            self._idle = self._idle[overflow:]
+
+        self.stats['evicted'] += len(expired)
+
+        return expired
+
+    def evict_idle(self):
+        """Close any sockets that have been idle for longer than idle_timeout, or don't fit in max_size
+
+        This happens automatically on checkout() and checkin(), but can be called to reclaim sockets
+        from a pool that isn't being used.
+        """
+        with self._lock:
+            expired = self._evict(time.time())
+
+        for sock in expired:
+            self._close(sock)
+
+    def checkout(self, connect=None):
+        """Get a connected socket, reusing an idle one if possible
+
+        Args:
+            connect (callable, optional): Called with no arguments instead of the pool's connect, if a new
+                                          socket is needed
+
+        Returns:
+            socket-like: A connected socket
+
+        Raises:
+            socket.error: Unable to create a new socket
+        """
+
+        if self._active:
+            self._active.acquire()
+
+        sock = None
+        unusable = []
+
+        with self._lock:
+            unusable.extend(self._evict(time.time()))
+
+            while self._idle:
+                (candidate, _) = self._idle.pop()
+
+                if self.is_healthy(candidate):
+                    sock = candidate
+                    self.stats['reused'] += 1
+                    break
+
+                unusable.append(candidate)
+                self.stats['discarded'] += 1
+
+        for candidate in unusable:
+            self._close(candidate)
+
+        if sock is not None:
+            return sock
+
+        try:
+            sock = (connect or self._connect)()
+        except Exception:
+            if self._active:
+                self._active.release()
+            raise
+
+        with self._lock:
+            self.stats['created'] += 1
+
+        return sock
+
+    def checkin(self, sock):
+        """Return a socket to the pool once the response on it has been completely read
+
+        The socket is closed instead if the pool is full.
+
+        Args:
+            sock (socket-like): A socket previously returned by checkout()
+        """
+
+        now = time.time()
+        with self._lock:
+            expired = self._evict(now)
+
+            keep = len(self._idle) < self.max_size
+            if keep:
+                self._idle.append((sock, now))
+
+        for candidate in expired:
+            self._close(candidate)
+
+        if not keep:
+            self._close(sock)
+
+        if self._active:
+            self._active.release()
+
+    def discard(self, sock):
+        """Close a socket previously returned by checkout() rather than returning it to the pool
+
+        Use this when the state of the socket is unknown, for example after an error.
+
+        Args:
+            sock (socket-like): A socket previously returned by checkout()
+        """
+
+        with self._lock:
+            self.stats['discarded'] += 1
+
+        self._close(sock)
+
+        if self._active:
+            self._active.release()
+
+    def close(self):
+        """Close all idle sockets"""
+        with self._lock:
+            idle = self._idle
+            self._idle = []
+
+        for (sock, _) in idle:
+            self._close(sock)
+
+
+class PooledSocket(object):
+    """A socket checked out of a SocketPool
+
+    Behaves like the underlying socket, except that it can be given back to the pool with release().
+    close() closes the underlying socket, so code that doesn't know about the pool works as it always has.
+
+    Attributes:
+        pool (SocketPool): The pool the socket was checked out of, to check out another once this one is gone
+    """
+
+    def __init__(self, sock, pool):
+        """
+        Args:
+            sock (socket-like): A socket returned by pool.checkout()
+            pool (SocketPool): The pool sock was checked out of
+
+        """
+        self._sock = sock
+        self._pool = pool
+        self.pool = pool
+
+    def __getattr__(self, name):
+        return getattr(self._sock, name)
+
+    def release(self):
+        """Return the socket to the pool, it must not be used after this"""
+        (pool, self._pool) = (self._pool, None)
+        if pool is not None:
+            pool.checkin(self._sock)
+
+    def close(self):
+        """Close the socket, rather than returning it to the pool"""
+        (pool, self._pool) = (self._pool, None)
+        if pool is not None:
+            pool.discard(self._sock)
+
+
+class KeepAliveMixin(object):
+    """Track whether an httplib.HTTPConnection's socket can be reused once it's closed
+
+    The socket can be reused if a response was read from it completely and that response didn't ask for
+    the connection to be closed.  On close(), the socket is passed to ``_release_socket``, which checks it back
+    in to ``_socket_pool`` (the SocketPool it was checked out of) if it can be reused, and discards it otherwise.
+    Classes whose sockets don't come straight from ``_socket_pool`` override ``_release_socket``.
+    """
+
+    _reusable = False
+    _response = None
+    _socket_pool = None
+
+    def _release_socket(self, sock, reusable):
+        """Dispose of our socket when we are closed
+
+        Args:
+            sock (socket-like): The socket, checked out of ``_socket_pool``
+            reusable (bool): True if the socket is ready for another request
+        """
+        if reusable:
+            self._socket_pool.checkin(sock)
+        else:
+            self._socket_pool.discard(sock)
+
+    def putrequest(self, *args, **kwargs):
+        # until we have read a response, we have no idea what state this socket is in
+        self._reusable = False
+        self._response = None
+        return httplib.HTTPConnection.putrequest(self, *args, **kwargs)
+
+    def getresponse(self, *args, **kwargs):
+        response = httplib.HTTPConnection.getresponse(self, *args, **kwargs)
+
+        # if the server is going to close the connection after this response, we can't reuse it
+        self._reusable = not response.will_close
+        self._response = response
+        return response
+
+    def close(self):
+        """Release our socket, then let the parent reset it's state"""
+        sock = self.sock
+        self.sock = None
+
+        # if the body wasn't read to the end, the rest of it is still on the socket
+        reusable = self._reusable and (self._response is None or self._response.isclosed())
+
+        if sock is not None:
+            self._release_socket(sock, reusable)
+
+        self._reusable = False
+        self._response = None
+
+        # the parent won't touch the socket as we've cleared it
+        httplib.HTTPConnection.close(self)
+
+
+def release_connections(http):
+    """Give the sockets of an httplib2.Http's pooled connections back to their pools
+
+    httplib2 keeps a connection open until it's closed, or the Http object is garbage collected, so sockets
+    from a pool would otherwise stay checked out between requests.  Call this once every response made
+    through http has been read: reusable sockets are checked back in and the rest are closed.  Either way the
+    connections check out another socket for their next request.  Other connections (http and https) keep
+    their sockets, as they have no pool to go back to.
+
+    Args:
+        http (httplib2.Http): The http object, anything without httplib2's ``connections`` is ignored
+    """
+    connections = getattr(http, 'connections', None)
+    if not isinstance(connections, dict):
+        return
+
+    for conn in list(connections.values()):
+        if isinstance(conn, KeepAliveMixin):
+            conn.close()
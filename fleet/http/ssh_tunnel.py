@@ -8,6 +8,8 @@ except ImportError:  # pragma: no cover
 import httplib2  # NOQA
 import sys
 
+from .pool import SocketPool, PooledSocket, KeepAliveMixin
+
 try:  # pragma: no cover
     # python 2
     import urllib
@@ -30,13 +32,45 @@ class SSHTunnelProxyInfo(httplib2.ProxyInfo):
         self.sock = sock
 
 
-class HTTPOverSSHTunnel(httplib.HTTPConnection):
+class ChannelPool(SocketPool):
+    """A SocketPool of SSH channels (paramiko.channel.Channel) forwarded to the same host and port"""
+
+    def is_healthy(self, channel):
+        """Determine if an idle channel can be reused
+
+        Channels that have been closed, half-closed by the remote end (EOF received), or that have data
+        waiting to be read, or whose transport is no longer active can not be reused.
+
+        Args:
+            channel (paramiko.channel.Channel): The channel to check
+
+        Returns:
+            True: The channel can be reused
+            False: The channel should be discarded
+        """
+        try:
+            if channel.closed or channel.eof_received or channel.eof_sent or channel.recv_ready():
+                return False
+
+            transport = channel.get_transport()
+            return transport is not None and transport.is_active()
+        except Exception:
+            return False
+
+
+class HTTPOverSSHTunnel(KeepAliveMixin, httplib.HTTPConnection):
     """
     A hack for httplib2 that expects proxy_info to be a socket already connected
     to our target, rather than having to call connect() ourselves. This is used
     to provide basic SSH Tunnelling support.
+
+    If the socket supports release() (see fleet.http.PooledSocket) it is returned to
+    it's pool when this connection is closed, so the channel can be reused, and another
+    is checked out of the same pool when the connection is next used.
     """
 
+    _proxy_info_factory = None
+
     def __init__(self, host, port=None, strict=None, timeout=None, proxy_info=None):
         """
             Setup an HTTP connection over an already connected socket.
@@ -58,22 +92,44 @@ class HTTPOverSSHTunnel(httplib.HTTPConnection):
         # python2, executables any callables and returns the result as proxy_info
         # python3 passes the callable directly to this function :(
         if hasattr(proxy_info, '__call__'):
+            # remember how to get another socket, for when this one is closed
+            self._proxy_info_factory = proxy_info
             proxy_info = proxy_info(None)
 
         # make sure we have a validate socket before we stash it
         if not proxy_info or not isinstance(proxy_info, SSHTunnelProxyInfo) or not proxy_info.sock:
             raise ValueError('This Connection must be suppplied an SSHTunnelProxyInfo via the proxy_info arg')
 
-        # keep it
+        # keep it, and where it came from
         self.sock = proxy_info.sock
+        self._socket_pool = getattr(proxy_info.sock, 'pool', None)
 
-    def connect(self):  # pragma: no cover
-        """Do nothing"""
+    def connect(self):
+        """Get a new socket from proxy_info, if our socket has been closed"""
         # we don't need to connect, this functions job is to make sure
         # self.sock exists and is connected.  We did that in __init__
         # This is just here to keep other code in the parent from fucking
         # with our already connected socket :)
-        pass
+        # If we've been closed since then, and we were given a callable, ask it for another
+        # otherwise (python2 only hands us the socket) check one out of the pool it came from
+        if self.sock is None:
+            if self._proxy_info_factory is not None:
+                self.sock = self._proxy_info_factory(None).sock
+            elif isinstance(self._socket_pool, SocketPool):
+                self.sock = PooledSocket(self._socket_pool.checkout(), self._socket_pool)
+
+        self._reusable = False
+
+    def _release_socket(self, sock, reusable):
+        """Return our socket to it's pool if it can be reused, otherwise close it
+
+        Our sockets are PooledSockets (or plain channels that have no pool), which know where they go back to.
+        """
+        if reusable and hasattr(sock, 'release'):
+            sock.release()
+        else:
+            sock.close()
+
 
 # Add our module to httplib2 via sorta monkey patching
 # When a request is made, the class responsible for the scheme is looked up in this dict
@@ -8,6 +8,9 @@ except ImportError:  # pragma: no cover
 import httplib2  # NOQA
 import socket
 import sys
+import threading
+
+from .pool import SocketPool, KeepAliveMixin
 
 try:  # pragma: no cover
     # python 2
@@ -56,7 +59,109 @@ class UnixConnectionWithTimeout(httplib.HTTPConnection):
 
             raise socket.error(msg)
 
+
+# unix socket path -> SocketPool shared by every PooledUnixConnection to that path
+_unix_socket_pools = {}
+_unix_socket_pools_lock = threading.Lock()
+
+# defaults for new pools, see configure_unix_socket_pool
+_unix_socket_pool_options = {
+    'max_size': 10,
+    'idle_timeout': 30
+}
+
+
+def _connect_unix_socket(path, timeout=None):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        if has_timeout(timeout):
+            sock.settimeout(timeout)
+
+        sock.connect(path)
+    except socket.error:
+        sock.close()
+        raise
+
+    return sock
+
+
+def get_unix_socket_pool(path):
+    """Return the SocketPool used for connections to a unix domain socket
+
+    Args:
+        path (str): The path to the unix domain socket
+
+    Returns:
+        fleet.http.SocketPool: The pool for path
+    """
+
+    with _unix_socket_pools_lock:
+        try:
+            return _unix_socket_pools[path]
+        except KeyError:
+            pool = SocketPool(
+                connect=lambda: _connect_unix_socket(path),
+                **_unix_socket_pool_options
+            )
+            _unix_socket_pools[path] = pool
+            return pool
+
+
+def configure_unix_socket_pool(max_size=None, idle_timeout=None):
+    """Configure the connection pools used for http+unix endpoints
+
+    Applies to existing pools, and to pools created later.
+
+    Args:
+        max_size (int, optional): The maximum number of idle connections to keep per socket.
+                                  0 disables pooling.
+        idle_timeout (float, optional): Close connections that have been idle for this many seconds.
+    """
+
+    with _unix_socket_pools_lock:
+        if max_size is not None:
+            _unix_socket_pool_options['max_size'] = max_size
+
+        if idle_timeout is not None:
+            _unix_socket_pool_options['idle_timeout'] = idle_timeout
+
+        for pool in _unix_socket_pools.values():
+            pool.max_size = _unix_socket_pool_options['max_size']
+            pool.idle_timeout = _unix_socket_pool_options['idle_timeout']
+
+    # apply a smaller max_size / idle_timeout to what's already idle
+    for pool in list(_unix_socket_pools.values()):
+        pool.evict_idle()
+
+
+class PooledUnixConnection(KeepAliveMixin, UnixConnectionWithTimeout):
+    """
+    HTTP over UNIX Domain Sockets, with HTTP/1.1 keep-alive connections shared between all connections
+    to the same socket.
+
+    When this connection is closed, the socket is returned to the pool if the last response on it allows
+    keep-alive. Idle sockets are health checked before they are reused.
+    """
+
+    def __init__(self, host, port=None, strict=None, timeout=None, proxy_info=None):
+        UnixConnectionWithTimeout.__init__(self, host, port, strict, timeout, proxy_info)
+
+        self._socket_pool = get_unix_socket_pool(unquote(self.host))
+
+    def connect(self):
+        """Check a socket out of the pool for the unix domain socket passed to us as self.host"""
+        path = unquote(self.host)
+        self.sock = self._socket_pool.checkout(connect=lambda: _connect_unix_socket(path, self.timeout))
+        self._reusable = False
+
+        # a reused socket has whatever timeout the connection that last had it set
+        if has_timeout(self.timeout):
+            self.sock.settimeout(self.timeout)
+        else:
+            self.sock.settimeout(None)
+
+
 # Add our module to httplib2 via sorta monkey patching
 # When a request is made, the class responsible for the scheme is looked up in this dict
 # So we inject our schemes and capture the Unix domain requests
-sys.modules['httplib2'].SCHEME_TO_CONNECTION['http+unix'] = UnixConnectionWithTimeout
+sys.modules['httplib2'].SCHEME_TO_CONNECTION['http+unix'] = PooledUnixConnection
@@ -1,3 +1,15 @@
+import sys
+
 from fleet.v1.objects import *  # NOQA
 from fleet.v1.client import Client  # NOQA
-from fleet.v1.errors import APIError  # NOQA
+from fleet.v1.errors import APIError, RolloutError, UnitFileError  # NOQA
+from fleet.v1.cache import DiscoveryCache, ResponseCache, UnitFileCache  # NOQA
+from fleet.v1.loader import load_units  # NOQA
+from fleet.v1.bulk import BulkResult  # NOQA
+from fleet.v1.apply import ApplyPlan  # NOQA
+from fleet.v1.rollout import RolloutResult  # NOQA
+from fleet.v1.watch import UnitStateEvent, UnitStateWatcher  # NOQA
+
+if sys.version_info >= (3, 6):  # pragma: no cover
+    # async generators are a syntax error before 3.6
+    from fleet.v1.aio import AsyncClient  # NOQA
@@ -0,0 +1,621 @@
+"""An asyncio client for the fleet v1 API
+
+Requires python 3.6 or later (for async generators).
+"""
+
+import asyncio
+import json
+
+import googleapiclient.errors
+import httplib2
+
+from fleet.v1.objects import Unit, UnitState, Machine
+from fleet.v1.errors import APIError
+from fleet.v1.engine import RequestEngine
+from fleet.v1.interning import Interner
+
+import urllib.parse as urlparse
+
+
+class AsyncConnection(object):
+    """A HTTP/1.1 connection made with asyncio streams
+
+    Attributes:
+        reader (asyncio.StreamReader): The read side of the connection
+        writer (asyncio.StreamWriter): The write side of the connection
+        reusable (bool): True if the last response was read completely, and the server didn't ask to close
+
+    """
+
+    # a read waiting for anything the server sends while we are idle, see idle()
+    _idle_read = None
+
+    def __init__(self, reader, writer):
+        """
+        Args:
+            reader (asyncio.StreamReader): The read side of the connection
+            writer (asyncio.StreamWriter): The write side of the connection
+
+        """
+        self.reader = reader
+        self.writer = writer
+        self.reusable = False
+
+    def idle(self):
+        """Start watching for anything the server sends while this connection isn't being used
+
+        Call this when putting the connection aside for reuse, see is_healthy().
+        """
+        self._idle_read = asyncio.ensure_future(self.reader.read(1))
+
+    async def is_healthy(self):
+        """Determine if an idle connection can be reused
+
+        An idle keep-alive connection should have nothing to read; if the server closed it, or sent data we
+        weren't expecting, it's no good to us.
+
+        Returns:
+            True: The connection can be reused
+            False: The connection should be closed
+        """
+        if self.reader.at_eof() or self.writer.transport.is_closing():
+            return False
+
+        (idle_read, self._idle_read) = (self._idle_read, None)
+        if idle_read is None:
+            return True
+
+        if not idle_read.done():
+            # stop it, so the next response can be read.  wait() doesn't raise the read's cancellation, only ours
+            idle_read.cancel()
+            await asyncio.wait([idle_read])
+
+        if idle_read.cancelled():
+            return not self.reader.at_eof()
+
+        # the read finished: the server closed the connection, sent us something we didn't ask for, or it failed
+        try:
+            idle_read.result()
+        except (OSError, asyncio.TimeoutError):
+            pass
+
+        return False
+
+    def close(self):
+        """Close the connection"""
+        self.reusable = False
+        self.writer.close()
+
+        if self._idle_read is not None:
+            self._idle_read.cancel()
+            self._idle_read = None
+
+    async def request(self, method, path, host, body=None, headers=None):
+        """Send a request and read the response
+
+        Args:
+            method (str): The HTTP method
+            path (str): The path and query string to request
+            host (str): The value for the Host header
+            body (str, optional): The request body
+            headers (dict, optional): Additional headers to send
+
+        Returns:
+            three item tuple: (status, headers, content), headers is a dict with lower cased keys
+
+        Raises:
+            ConnectionError: The connection was closed before a complete response was read
+        """
+
+        self.reusable = False
+
+        if body is not None:
+            body = body.encode('utf-8')
+
+        lines = ['{0} {1} HTTP/1.1'.format(method, path), 'Host: {0}'.format(host)]
+        for (name, value) in (headers or {}).items():
+            lines.append('{0}: {1}'.format(name, value))
+        lines.append('Content-Length: {0}'.format(len(body) if body else 0))
+
+        self.writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + (body or b''))
+        await self.writer.drain()
+
+        (status, response_headers) = await self._read_head()
+
+        # responses to HEAD, 1xx, 204 and 304 have no body no matter what the headers say
+        if method == 'HEAD' or status in (204, 304) or 100 <= status < 200:
+            content = b''
+            keep_alive = True
+        elif response_headers.get('transfer-encoding', '').lower() == 'chunked':
+            content = await self._read_chunked()
+            keep_alive = True
+        elif 'content-length' in response_headers:
+            content = await self.reader.readexactly(int(response_headers['content-length']))
+            keep_alive = True
+        else:
+            # no framing, the body ends when the server closes the connection
+            content = await self.reader.read()
+            keep_alive = False
+
+        self.reusable = keep_alive and response_headers.get('connection', '').lower() != 'close'
+
+        return (status, response_headers, content)
+
+    async def _read_line(self):
+        line = await self.reader.readline()
+        if not line.endswith(b'\n'):
+            raise ConnectionError('Connection closed while reading the response')
+
+        return line.rstrip(b'\r\n').decode('latin-1')
+
+    async def _read_head(self):
+        """Read the status line and headers of a response
+
+        Returns:
+            two item tuple: (status, headers), headers is a dict with lower cased keys
+        """
+        status_line = await self._read_line()
+
+        try:
+            status = int(status_line.split(' ', 2)[1])
+        except (IndexError, ValueError):
+            raise ConnectionError('Invalid status line: {0!r}'.format(status_line))
+
+        headers = {}
+        while True:
+            line = await self._read_line()
+            if not line:
+                break
+
+            (name, _, value) = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        return (status, headers)
+
+    async def _read_chunked(self):
+        """Read a body sent with Transfer-Encoding: chunked
+
+        Returns:
+            bytes: The decoded body
+        """
+        chunks = []
+        while True:
+            size = int((await self._read_line()).split(';', 1)[0], 16)
+            if size == 0:
+                break
+
+            chunks.append(await self.reader.readexactly(size))
+            await self._read_line()
+
+        # skip any trailers
+        while await self._read_line():
+            pass
+
+        return b''.join(chunks)
+
+
+class AsyncConnectionPool(object):
+    """A pool of keep-alive AsyncConnections to a single endpoint
+
+    Connections are handed out with acquire(), and given back with release() once the response on them has
+    been read.  The number of connections in use at once is limited, so thousands of concurrent operations can
+    be started without opening thousands of connections to fleet.
+    """
+
+    def __init__(self, open_connection, max_size=10, max_active=100):
+        """
+        Args:
+            open_connection (coroutine function): Called with no arguments, returns a (reader, writer) tuple
+            max_size (int): The maximum number of idle connections to keep, defaults to 10.
+            max_active (int): The maximum number of connections in use at once, defaults to 100.
+
+        """
+        self._open_connection = open_connection
+        self.max_size = max_size
+        self.max_active = max_active
+
+        # created on first use, so it belongs to the loop we are used from rather than whatever loop was
+        # current when we were constructed
+        self._active = None
+        self._idle = []
+
+        self.stats = {
+            'created': 0,
+            'reused': 0,
+            'discarded': 0
+        }
+
+    def __len__(self):
+        """Return the number of idle connections in the pool"""
+        return len(self._idle)
+
+    async def acquire(self):
+        """Get a connection, reusing an idle one if possible
+
+        Returns:
+            AsyncConnection: A connected connection
+        """
+        if self._active is None:
+            self._active = asyncio.Semaphore(self.max_active)
+
+        await self._active.acquire()
+
+        try:
+            while self._idle:
+                conn = self._idle.pop()
+
+                try:
+                    healthy = await conn.is_healthy()
+                except BaseException:
+                    # we were cancelled while checking it, and it's in no state to go back to the pool
+                    conn.close()
+                    raise
+
+                if healthy:
+                    self.stats['reused'] += 1
+                    return conn
+
+                self.stats['discarded'] += 1
+                conn.close()
+
+            conn = AsyncConnection(*(await self._open_connection()))
+        except BaseException:
+            self._active.release()
+            raise
+
+        self.stats['created'] += 1
+        return conn
+
+    def release(self, conn):
+        """Return a connection to the pool, it's closed instead if it can't be reused or the pool is full
+
+        Args:
+            conn (AsyncConnection): A connection returned by acquire()
+        """
+        if conn.reusable and len(self._idle) < self.max_size:
+            conn.idle()
+            self._idle.append(conn)
+        else:
+            conn.close()
+
+        self._active.release()
+
+    def close(self):
+        """Close all idle connections"""
+        (idle, self._idle) = (self._idle, [])
+        for conn in idle:
+            conn.close()
+
+
+class AsyncClient(object):
+    """An asyncio client for the fleet v1 API
+
+    AsyncClient has the same methods as Client, but they are coroutines, and the list_* methods are async
+    generators:
+
+        >>> client = AsyncClient('http+unix://%2Fvar%2Frun%2Ffleet.sock')
+        >>> async for unit in client.list_units():
+        ...     print(unit.name)
+        >>> await client.destroy_unit('foo.service')
+        >>> await client.close()
+
+    Requests are built from fleet's known routes (like Client's 'native' engine), so no discovery is performed.
+
+    """
+
+    _API = 'fleet'
+    _VERSION = 'v1'
+    _STATES = ['inactive', 'loaded', 'launched']
+    _SCHEMES = ['http', 'http+unix']
+
+    def __init__(self, endpoint, max_connections=100, max_idle_connections=10, timeout=None, intern_strings=True):
+        """
+        Args:
+            endpoint (str): A URL where the fleet API can be reached.  Supported schemes are:
+                http: A HTTP connection over a TCP socket.
+                    Example: http://127.0.0.1:49153
+                http+unix: A HTTP connection over a unix domain socket. You must escape the path (/ = %2F).
+                    Example: http+unix://%2Fvar%2Frun%2Ffleet.sock
+
+            max_connections (int): The maximum number of connections to fleet in use at once. Further requests
+            wait for a connection to become available. Defaults to 100.
+
+            max_idle_connections (int): The maximum number of idle keep-alive connections to keep, defaults to 10.
+
+            timeout (float): Give up on a request that takes longer than this many seconds, raising
+            asyncio.TimeoutError. Defaults to None (no timeout).
+
+            intern_strings (bool): Share one copy of each of the values that repeat throughout listings among the
+            objects the list_* methods return, see Client. Defaults to True.
+
+        Raises:
+            ValueError: The endpoint's scheme is not supported
+
+        """
+
+        self._endpoint = endpoint.strip('/')
+        self._timeout = timeout
+
+        parsed = urlparse.urlparse(self._endpoint)
+        if parsed.scheme not in self._SCHEMES:
+            raise ValueError('endpoint scheme must be one of: {0}'.format(self._SCHEMES))
+
+        if parsed.scheme == 'http+unix':
+            path = urlparse.unquote(parsed.netloc)
+            self._host = 'localhost'
+
+            def open_connection():
+                return asyncio.open_unix_connection(path)
+        else:
+            (host, port) = (parsed.hostname, parsed.port or 80)
+            self._host = parsed.netloc
+
+            def open_connection():
+                return asyncio.open_connection(host, port)
+
+        self._pool = AsyncConnectionPool(open_connection, max_size=max_idle_connections, max_active=max_connections)
+
+        # the engine only builds the path, the pool knows where to send it
+        self._engine = RequestEngine('', api=self._API, version=self._VERSION)
+
+        self._interner = Interner() if intern_strings else None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """Close all idle connections to fleet"""
+        self._pool.close()
+
+    def _api_error(self, status, content, uri):
+        """Convert an error response into an APIError using the error fleet included in the response
+
+        Args:
+            status (int): The response code
+            content (bytes): The response body
+            uri (str): The path that was requested
+
+        Returns:
+            fleet.v1.errors.APIError: The converted error
+        """
+        exc = googleapiclient.errors.HttpError(httplib2.Response({'status': status}), content, uri=uri)
+
+        response = json.loads(content.decode('utf-8'))['error']
+
+        return APIError(code=response['code'], message=response['message'], http_error=exc)
+
+    async def _single_request(self, method, **kwargs):
+        """Make a single request to the fleet API endpoint
+
+        Args:
+            method (str): A dot delimited string indicating the method to call.  Example: 'Machines.List'
+            **kwargs: The parameters to the method
+
+        Returns:
+            dict: The response from the method called.
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400
+            asyncio.TimeoutError: The request took longer than timeout
+        """
+
+        try:
+            route = self._engine.ROUTES[method]
+        except KeyError:
+            raise AttributeError('{0} is not a fleet v1 API method'.format(method))
+
+        (path, body) = route.build(self._engine.base_url, kwargs)
+
+        conn = await self._pool.acquire()
+        try:
+            request = conn.request(route.http_method, path, self._host, body=body, headers=RequestEngine.HEADERS)
+
+            if self._timeout is None:
+                (status, _, content) = await request
+            else:
+                (status, _, content) = await asyncio.wait_for(request, self._timeout)
+        finally:
+            # if the request failed or was cancelled part way through, the connection isn't reusable and is closed
+            self._pool.release(conn)
+
+        if status >= 300:
+            raise self._api_error(status, content, path)
+
+        if status == 204 or not content:
+            return {}
+
+        return json.loads(content.decode('utf-8'))
+
+    async def _request(self, method, **kwargs):
+        """Make a request with automatic pagination
+
+        Args:
+            method (str): A dot delimited string indicating the method to call.  Example: 'Machines.List'
+            **kwargs: The parameters to the method
+
+        Yields:
+            dict: The next page of the response
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400
+        """
+
+        next_page_token = None
+
+        while True:
+            if next_page_token:
+                kwargs['nextPageToken'] = next_page_token
+
+            response = await self._single_request(method, **kwargs)
+            yield response
+
+            next_page_token = response.get('nextPageToken')
+            if not next_page_token:
+                return
+
+    async def _list(self, method, key, intern=None, **kwargs):
+        """Make a request with automatic pagination, yielding each result from each page
+
+        Args:
+            method (str): A dot delimited string indicating the method to call.  Example: 'Machines.List'
+            key (str): The member of the response containing the list of results.  Example: 'machines'
+            intern (str): The Interner method to pass each result through if we are interning strings.
+            **kwargs: The parameters to the method
+
+        Yields:
+            dict: The next result
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400
+        """
+        if intern and self._interner is not None:
+            intern = getattr(self._interner, intern)
+        else:
+            intern = None
+
+        async for page in self._request(method, **kwargs):
+            for item in page.get(key, []):
+                yield intern(item) if intern else item
+
+    @staticmethod
+    def _unit_name(unit):
+        if isinstance(unit, Unit):
+            return unit.name
+
+        return str(unit)
+
+    async def create_unit(self, name, unit):
+        """Create a new Unit in the cluster
+
+        Args:
+            name (str): The name of the unit to create
+            unit (Unit): The unit to submit to fleet
+
+        Returns:
+            Unit: The unit that was created
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400
+
+        """
+
+        await self._single_request('Units.Set', unitName=name, body={
+            'desiredState': unit.desiredState,
+            'options': unit.options
+        })
+
+        return await self.get_unit(name)
+
+    async def set_unit_desired_state(self, unit, desired_state):
+        """Update the desired state of a unit running in the cluster
+
+        Args:
+            unit (str, Unit): The Unit, or name of the unit to update
+
+            desired_state: State the user wishes the Unit to be in
+                          ("inactive", "loaded", or "launched")
+        Returns:
+            Unit: The unit that was updated
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400
+            ValueError: An invalid value was provided for ``desired_state``
+
+        """
+
+        if desired_state not in self._STATES:
+            raise ValueError('state must be one of: {0}'.format(
+                self._STATES
+            ))
+
+        unit = self._unit_name(unit)
+
+        await self._single_request('Units.Set', unitName=unit, body={
+            'desiredState': desired_state
+        })
+
+        return await self.get_unit(unit)
+
+    async def destroy_unit(self, unit):
+        """Delete a unit from the cluster
+
+        Args:
+            unit (str, Unit): The Unit, or name of the unit to delete
+
+        Returns:
+            True: The unit was deleted
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400
+
+        """
+
+        await self._single_request('Units.Delete', unitName=self._unit_name(unit))
+        return True
+
+    async def get_unit(self, name):
+        """Retreive a specific unit from the fleet cluster by name
+
+        Units returned by AsyncClient are not bound to it; use the client's methods to modify them.
+
+        Args:
+            name (str): If specified, only this unit name is returned
+
+        Returns:
+            Unit: The unit identified by ``name`` in the fleet cluster
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400
+
+        """
+        return Unit(data=await self._single_request('Units.Get', unitName=name))
+
+    async def list_units(self):
+        """Return the current list of the Units in the fleet cluster
+
+        Yields:
+            Unit: The next Unit in the cluster
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400
+
+        """
+        async for unit in self._list('Units.List', 'units', intern='unit'):
+            yield Unit(data=unit)
+
+    async def list_unit_states(self, machine_id=None, unit_name=None):
+        """Return the current UnitState for the fleet cluster
+
+        Args:
+            machine_id (str): filter all UnitState objects to those
+                              originating from a specific machine
+
+            unit_name (str):  filter all UnitState objects to those related
+                              to a specific unit
+
+        Yields:
+            UnitState: The next UnitState in the cluster
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400
+
+        """
+        async for state in self._list('UnitState.List', 'states', intern='unit_state',
+                                      machineID=machine_id, unitName=unit_name):
+            yield UnitState(data=state)
+
+    async def list_machines(self):
+        """Retrieve a list of machines in the fleet cluster
+
+        Yields:
+            Machine: The next machine in the cluster
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400
+
+        """
+        async for machine in self._list('Machines.List', 'machines', intern='machine'):
+            yield Machine(data=machine)
@@ -0,0 +1,150 @@
+from .objects import Unit
+
+
+class ApplyPlan(object):
+    """The changes needed to bring the cluster's units in line with a desired set of units
+
+    Fleet won't change the options of a unit that already exists, so a unit whose options differ from the
+    desired ones is replaced: destroyed, then created again.  A unit whose options match but whose desiredState
+    doesn't only has it's desired state set.  Units are compared by content_hash(), so the order options are
+    given in within a section matters, just as it does to fleet.
+
+        >>> plan = fleet_client.apply(fleet.load_units('/srv/units').units, dry_run=True)
+        >>> plan
+        <ApplyPlan: 2 create, 1 replace, 3 state, 0 delete, 194 unchanged>
+
+    Attributes:
+        create (dict): name -> Unit, for units that don't exist yet
+        replace (dict): name -> Unit, for units whose options have changed
+        state (dict): name -> desired state, for units whose options match but desiredState doesn't
+        delete (list): names of units that aren't in the desired set, only filled in if prune was requested
+        unchanged (list): names of units that already match
+        results (dict): The BulkResult of each step that was run ('destroy', 'create', and 'state'), empty until the
+                        plan has been executed
+
+    """
+
+    def __init__(self):
+        self.create = {}
+        self.replace = {}
+        self.state = {}
+        self.delete = []
+        self.unchanged = []
+        self.results = {}
+
+    def __len__(self):
+        """The number of units that need changing"""
+        return len(self.create) + len(self.replace) + len(self.state) + len(self.delete)
+
+    def __repr__(self):
+        return '<{0}: {1} create, {2} replace, {3} state, {4} delete, {5} unchanged>'.format(
+            self.__class__.__name__,
+            len(self.create),
+            len(self.replace),
+            len(self.state),
+            len(self.delete),
+            len(self.unchanged)
+        )
+
+    @property
+    def errors(self):
+        """dict: name -> the exception raised, for each unit that couldn't be changed"""
+        errors = {}
+        for result in self.results.values():
+            errors.update(result.errors)
+
+        return errors
+
+    @property
+    def ok(self):
+        """True if every change that was attempted succeeded"""
+        return not self.errors
+
+
+def _desired_items(desired):
+    """Yield (name, Unit) from a dict, (name, Unit) pairs, or named Units"""
+    if isinstance(desired, dict):
+        desired = desired.items()
+
+    for item in desired:
+        if isinstance(item, Unit):
+            yield (item.name, item)
+        else:
+            yield item
+
+
+def make_plan(desired, current, prune=False):
+    """Work out the changes needed to turn current into desired
+
+    Args:
+        desired (dict, iterable): name -> Unit, (name, Unit) pairs, or Units with names
+        current (iterable): Units in the cluster, as returned by Client.list_units()
+        prune (bool): Delete units that are in current but not in desired
+
+    Returns:
+        ApplyPlan: The changes to make
+
+    Raises:
+        ValueError: A desired unit has an invalid desiredState
+    """
+    result = ApplyPlan()
+
+    # index the listing by name, units are only hashed when they're compared below
+    current = dict((unit.name, unit) for unit in current)
+
+    seen = set()
+    for (name, unit) in _desired_items(desired):
+        seen.add(name)
+
+        if unit.desiredState not in Unit._STATES:
+            raise ValueError('{0}: state must be one of: {1}'.format(name, Unit._STATES))
+
+        existing = current.get(name)
+        if existing is None:
+            result.create[name] = unit
+        elif existing.content_hash() != unit.content_hash():
+            result.replace[name] = unit
+        elif existing.desiredState != unit.desiredState:
+            result.state[name] = unit.desiredState
+        else:
+            result.unchanged.append(name)
+
+    if prune:
+        result.delete = [name for name in current if name not in seen]
+
+    return result
+
+
+def execute_plan(client, plan, concurrency=10):
+    """Carry out a plan against the cluster
+
+    Units to be replaced or deleted are destroyed first, then new and replacement units are created, then desired
+    states are set.  Each step runs concurrently.  A unit that fails to be destroyed isn't recreated.
+
+    Args:
+        client (fleet.v1.Client): The client to make requests with
+        plan (ApplyPlan): The plan to carry out, it's results are filled in
+        concurrency (int): The most requests to make at once
+
+    Returns:
+        ApplyPlan: plan
+    """
+    destroy = list(plan.replace) + plan.delete
+    if destroy:
+        plan.results['destroy'] = client.destroy_units(destroy, concurrency=concurrency)
+
+    failed = plan.results['destroy'].errors if destroy else {}
+
+    create = list(plan.create.items()) + [(name, unit) for (name, unit) in plan.replace.items() if name not in failed]
+    if create:
+        plan.results['create'] = client.create_units(create, concurrency=concurrency)
+
+    if plan.state:
+        # each unit may want a different state, so this can't go through set_units_desired_state()
+        plan.results['state'] = client._run_bulk(
+            client.set_unit_desired_state,
+            ((name, (name, state, False)) for (name, state) in plan.state.items()),
+            concurrency
+        )
+
+    return plan
@@ -0,0 +1,197 @@
+import threading
+import time
+
+import multiprocessing.pool
+
+try:  # pragma: no cover
+    # python 2
+    import Queue as queue
+except ImportError:  # pragma: no cover
+    # python 3
+    import queue
+
+
+class BulkResult(object):
+    """The outcome of a bulk operation, such as Client.create_units()
+
+    Every unit is attempted, even if some fail.
+
+        >>> result = fleet_client.create_units(units)
+        >>> result
+        <BulkResult: 1998 succeeded, 2 failed in 3.21s (623.1/s)>
+        >>> result.errors
+        {'bad.service': APIError(...), ...}
+
+    Attributes:
+        results (dict): name -> the return value of the operation, for each unit it succeeded for
+        errors (dict): name -> the exception raised, for each unit it failed for
+        elapsed (float): How long the operation took, in seconds
+
+    """
+
+    def __init__(self, results=None, errors=None, elapsed=0.0):
+        self.results = results if results is not None else {}
+        self.errors = errors if errors is not None else {}
+        self.elapsed = elapsed
+
+    def __len__(self):
+        return len(self.results) + len(self.errors)
+
+    def __repr__(self):
+        return '<{0}: {1} succeeded, {2} failed in {3:.2f}s ({4:.1f}/s)>'.format(
+            self.__class__.__name__,
+            len(self.results),
+            len(self.errors),
+            self.elapsed,
+            self.throughput
+        )
+
+    @property
+    def ok(self):
+        """True if the operation succeeded for every unit"""
+        return not self.errors
+
+    @property
+    def throughput(self):
+        """The number of units processed per second"""
+        if not self.elapsed:
+            return 0.0
+
+        return len(self) / self.elapsed
+
+
+class WorkerPool(object):
+    """Threads to run bulk operations on, kept from one operation to the next
+
+    The threads are started the first time they're needed, and more are started if an operation wants more
+    at once than there are.  Each Client has one, so repeated bulk operations don't start and stop threads
+    every time.  Call close() once it's no longer needed; Client.close() does this.
+    """
+
+    def __init__(self):
+        self._pool = None
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _threads(self, size):
+        """Return a ThreadPool of at least size threads, replacing the one we have if it's too small"""
+        with self._lock:
+            (smaller, pool) = (None, self._pool)
+
+            if pool is None or self._size < size:
+                (smaller, pool) = (pool, multiprocessing.pool.ThreadPool(size))
+                (self._pool, self._size) = (pool, size)
+
+        # it's threads exit once they finish what they're doing
+        if smaller is not None:
+            smaller.close()
+
+        return pool
+
+    def imap_unordered(self, func, items, concurrency):
+        """Call func with each item on at most concurrency threads at once, yielding results as they're ready
+
+        Args:
+            func (callable): Called with each item
+            items (iterable): The items
+            concurrency (int): The most calls to make at once
+
+        Yields:
+            The return value of each call
+        """
+        items = iter(items)
+        lock = threading.Lock()
+        results = queue.Queue()
+        done = object()
+        errors = []
+
+        def drain(_):
+            # each of these takes the next item until there are none left, so no more than concurrency run at once
+            try:
+                while True:
+                    with lock:
+                        item = next(items, done)
+
+                    if item is done:
+                        return
+
+                    results.put(func(item))
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                results.put(done)
+
+        self._threads(concurrency).map_async(drain, range(concurrency))
+
+        remaining = concurrency
+        while remaining:
+            result = results.get()
+            if result is done:
+                remaining -= 1
+            else:
+                yield result
+
+        if errors:
+            raise errors[0]
+
+    def close(self):
+        """Let the threads exit once they finish what they're doing, more are started if they're needed again"""
+        with self._lock:
+            (pool, self._pool, self._size) = (self._pool, None, 0)
+
+        if pool is not None:
+            pool.close()
+
+
+def run_bulk(operation, items, concurrency, workers=None):
+    """Call operation for each item, concurrently, collecting the results
+
+    Args:
+        operation (callable): Called with each item's arguments
+        items (iterable): (name, args) for each unit, args is a tuple
+        concurrency (int): The most operations to run at once
+        workers (WorkerPool, optional): Run the operations on these threads, rather than starting new ones
+
+    Returns:
+        BulkResult: The results keyed by name
+
+    Raises:
+        ValueError: concurrency is less than 1
+    """
+    if concurrency < 1:
+        raise ValueError('concurrency must be >= 1')
+
+    def call(item):
+        (name, args) = item
+        try:
+            return (name, operation(*args), None)
+        except Exception as exc:
+            # one unit failing shouldn't stop the rest
+            return (name, None, exc)
+
+    result = BulkResult()
+    start = time.time()
+
+    pool = None
+    if concurrency == 1:
+        outcomes = (call(item) for item in items)
+    elif workers is not None:
+        outcomes = workers.imap_unordered(call, items, concurrency)
+    else:
+        pool = multiprocessing.pool.ThreadPool(concurrency)
+        outcomes = pool.imap_unordered(call, items)
+
+    try:
+        for (name, value, error) in outcomes:
+            if error is None:
+                result.results[name] = value
+            else:
+                result.errors[name] = error
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    result.elapsed = time.time() - start
+
+    return result
@@ -0,0 +1,539 @@
+import collections, hashlib, io, json, os, tempfile, threading, time  # NOQA
+
+from fleet.v1.objects import Unit, parse_unit_file
+
+
+def _write_atomic(filename, content):
+    """Write content to filename, so that readers never see a partially written file
+
+    Args:
+        filename (str): The path to write to, it's parent directory must exist
+        content (str): The data to write
+
+    """
+
+    # write to a temporary file in the same directory, then rename it over the target
+    # rename is atomic on posix, so concurrent readers see either the old file or the new one
+    (fd, tmp_name) = tempfile.mkstemp(dir=os.path.dirname(filename), prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'w') as fh:
+            fh.write(content)
+
+        os.rename(tmp_name, filename)
+    except Exception:
+        try:
+            os.unlink(tmp_name)
+        except OSError:  # pragma: no cover
+            pass
+
+        raise
+
+
+def _entry_filename(directory, key):
+    """Return the path of the JSON file in directory that the entry for key is stored in
+
+    Args:
+        directory (str): The cache's directory
+        key (str): What the entry is for, a URL or a path
+
+    Returns:
+        str: The path to the cache entry
+    """
+    return os.path.join(directory, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+
+def _read_entry(filename, key_field, key, required):
+    """Read an entry stored by _write_entry()
+
+    Args:
+        filename (str): The path to the cache entry
+        key_field (str): The field of the entry that holds what it's for
+        key (str): What the entry must be for
+        required (str): A field the entry must have
+
+    Returns:
+        dict: The entry
+        None: There is no (readable) entry for key
+    """
+
+    try:
+        with open(filename, 'r') as fh:
+            entry = json.load(fh)
+    except (IOError, OSError, ValueError):
+        return None
+
+    # guard against hash collisions, and entries written by something else
+    if not isinstance(entry, dict) or entry.get(key_field) != key or required not in entry:
+        return None
+
+    return entry
+
+
+def _write_entry(filename, entry):
+    """Store an entry as JSON, creating the directory it's in if needed
+
+    Errors are ignored, a cache we can't write to shouldn't stop us from doing what it was meant to speed up.
+
+    Args:
+        filename (str): The path to the cache entry
+        entry (dict): The entry
+    """
+
+    try:
+        directory = os.path.dirname(filename)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        _write_atomic(filename, json.dumps(entry))
+    except (IOError, OSError):
+        pass
+
+
+class DiscoveryCache(object):
+    """An on-disk cache for fleet's discovery document
+
+    Each entry is stored as a JSON file named after the SHA1 of the discovery URL, which includes the endpoint,
+    API name and API version.  Entries younger than ``max_age`` seconds are used without touching the network;
+    older entries are revalidated with a conditional GET (If-None-Match) using the ETag fleet returned.
+
+        >>> cache = DiscoveryCache(path='/tmp/fleet-discovery', max_age=3600)
+        >>> fleet_client = Client('http://127.0.0.1:49153', discovery_cache=cache)
+
+    """
+
+    def __init__(self, path='~/.fleetctl/discovery', max_age=300, stale_while_revalidate=False):
+        """
+        Args:
+            path (str): The directory to store cached documents in, it will be created if it does not exist.
+                        Defaults to '~/.fleetctl/discovery'.
+            max_age (int): Number of seconds a cached document is used without revalidation, defaults to 300.
+            stale_while_revalidate (bool): If True, a stale document is used immediately and revalidated
+                                           in a background thread. Defaults to False.
+
+        """
+
+        self.path = os.path.expanduser(path)
+        self.max_age = max_age
+        self.stale_while_revalidate = stale_while_revalidate
+
+    def _filename(self, url):
+        """Return the path on disk for the entry for url
+
+        Args:
+            url (str): The discovery URL
+
+        Returns:
+            str: The path to the cache entry
+        """
+        return _entry_filename(self.path, url)
+
+    def get(self, url):
+        """Retrieve a cache entry
+
+        Args:
+            url (str): The discovery URL
+
+        Returns:
+            dict: The entry with the keys 'url', 'document', 'etag', and 'fetched'
+            None: There is no (readable) entry for url
+        """
+        return _read_entry(self._filename(url), 'url', url, 'document')
+
+    def set(self, url, document, etag=None):
+        """Store a discovery document
+
+        Args:
+            url (str): The discovery URL
+            document (str): The discovery document
+            etag (str, optional): The ETag returned with the document
+
+        Returns:
+            dict: The entry that was stored
+        """
+
+        entry = {
+            'url': url,
+            'document': document,
+            'etag': etag,
+            'fetched': time.time()
+        }
+
+        _write_entry(self._filename(url), entry)
+
+        return entry
+
+    def touch(self, url, entry):
+        """Mark an entry as freshly validated
+
+        Args:
+            url (str): The discovery URL
+            entry (dict): The entry returned by ``get``
+
+        Returns:
+            dict: The updated entry
+        """
+        return self.set(url, entry['document'], entry.get('etag'))
+
+    def is_fresh(self, entry):
+        """Determine if an entry can be used without revalidation
+
+        Args:
+            entry (dict): The entry returned by ``get``
+
+        Returns:
+            True: The entry is younger than ``max_age``
+            False: The entry must be revalidated
+        """
+        return (time.time() - entry.get('fetched', 0)) < self.max_age
+
+
+class _LRUDict(object):
+    """A dict that keeps track of the order it's keys were last used in
+
+    Python 2.6 has no OrderedDict, so each use of a key is appended to a queue along with a counter that's also
+    stored with the key's value.  Popping the least recently used key skips over places in the queue that a
+    later use has superseded, and the queue is rebuilt once it's mostly made up of those.  Not thread-safe.
+    """
+
+    def __init__(self):
+        # key -> (counter when it was last used, value)
+        self._values = {}
+
+        # (counter, key) for each use, oldest first
+        self._order = collections.deque()
+        self._counter = 0
+
+    def __len__(self):
+        return len(self._values)
+
+    def _use(self, key, value):
+        self._counter += 1
+        self._values[key] = (self._counter, value)
+        self._order.append((self._counter, key))
+
+        if len(self._order) > 2 * len(self._values) + 16:
+            # counters are unique, so keys are never compared
+            self._order = collections.deque(sorted((used, k) for (k, (used, _)) in self._values.items()))
+
+    def get(self, key, default=None):
+        """Return the value for key, marking it as the most recently used"""
+        try:
+            (_, value) = self._values[key]
+        except KeyError:
+            return default
+
+        self._use(key, value)
+        return value
+
+    def set(self, key, value):
+        """Store the value for key, marking it as the most recently used"""
+        self._use(key, value)
+
+    def pop(self, key, default=None):
+        """Remove key, returning it's value"""
+        try:
+            return self._values.pop(key)[1]
+        except KeyError:
+            return default
+
+    def pop_oldest(self):
+        """Remove the least recently used key
+
+        Returns:
+            tuple: (key, value)
+
+        Raises:
+            KeyError: There are no keys
+        """
+        while self._order:
+            (used, key) = self._order.popleft()
+
+            entry = self._values.get(key)
+            if entry is not None and entry[0] == used:
+                del self._values[key]
+                return (key, entry[1])
+
+        raise KeyError('pop_oldest(): dictionary is empty')
+
+    def clear(self):
+        self._values.clear()
+        self._order.clear()
+
+
+class UnitFileCache(object):
+    """A cache of parsed unit files, so files that haven't changed aren't parsed again
+
+    Each entry records the file's mtime, size, and the SHA1 of it's contents along with the options parsed from
+    it.  When a file is loaded again:
+
+        * If it's mtime and size are unchanged, the cached options are used without reading the file.
+        * Otherwise the file is read and hashed.  If the hash is unchanged (the file was only touched, or
+          rewritten with the same contents), the cached options are used without parsing it.
+        * Otherwise it is parsed, and the entry replaced.
+
+    Entries are kept in memory, least recently used first out once there are ``max_entries`` of them.  If
+    ``path`` is given, entries are also stored on disk, as a JSON file per unit file, so they survive restarts
+    and can be shared between processes.
+
+        >>> cache = UnitFileCache(max_entries=10000, path='~/.fleetctl/units')
+        >>> unit = cache.load('/srv/units/foo.service')
+        >>> cache.stats
+        {'hits': 0, 'misses': 1, 'evicted': 0}
+
+    A new Unit is returned by every call, so changes to one don't affect the cache or other callers.
+
+    Attributes:
+        stats (dict): Counters: ``hits`` (files loaded from the cache), ``misses`` (files parsed), and
+                      ``evicted`` (entries dropped from memory to make room for others)
+
+    """
+
+    def __init__(self, max_entries=1024, path=None):
+        """
+        Args:
+            max_entries (int): The most entries to keep in memory, defaults to 1024.
+            path (str, optional): A directory to also store entries in, it will be created if it does not exist.
+                                  Defaults to None, which only keeps entries in memory.
+
+        Raises:
+            ValueError: max_entries is less than 1
+
+        """
+        if max_entries < 1:
+            raise ValueError('max_entries must be >= 1')
+
+        self.max_entries = max_entries
+        self.path = os.path.expanduser(path) if path else None
+
+        self.stats = {'hits': 0, 'misses': 0, 'evicted': 0}
+
+        # absolute path -> entry
+        self._entries = _LRUDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _filename(self, path):
+        """Return the path on disk for the entry for the unit file at path"""
+        return _entry_filename(self.path, path)
+
+    def _get(self, path):
+        """Return the entry for path from memory, or disk, or None if there isn't one"""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None:
+                return entry
+
+        if self.path is None:
+            return None
+
+        return _read_entry(self._filename(path), 'path', path, 'options')
+
+    def _set(self, path, entry, persist=True):
+        """Store an entry in memory, evicting the least recently used if we're full, and on disk if persist"""
+        with self._lock:
+            self._entries.set(path, entry)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.pop_oldest()
+                self.stats['evicted'] += 1
+
+        if self.path is not None and persist:
+            _write_entry(self._filename(path), entry)
+
+    def _count(self, stat):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def options(self, path):
+        """Return the options parsed from a unit file, from the cache if the file hasn't changed
+
+        Args:
+            path (str): The path to the unit file
+
+        Returns:
+            list: A copy of the options in the unit file
+
+        Raises:
+            IOError: The file does not exist or can't be read
+            fleet.v1.errors.UnitFileError: The file is not a valid unit file.  This is a ValueError.
+        """
+        path = os.path.abspath(os.path.expanduser(path))
+
+        stat = os.stat(path)
+        entry = self._get(path)
+
+        if entry is not None and entry['mtime'] == stat.st_mtime and entry['size'] == stat.st_size:
+            self._count('hits')
+            # it may have come from disk, so make sure it's in memory
+            self._set(path, entry, persist=False)
+            return [dict(option) for option in entry['options']]
+
+        with open(path, 'rb') as fh:
+            content = fh.read()
+
+        digest = hashlib.sha1(content).hexdigest()
+
+        if entry is not None and entry['sha1'] == digest:
+            self._count('hits')
+            options = entry['options']
+        else:
+            self._count('misses')
+            # read the lines just as Unit(from_file=...) does
+            options = parse_unit_file(io.StringIO(content.decode('utf-8'), newline=None))
+
+        self._set(path, {
+            'path': path,
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            'sha1': digest,
+            'options': options
+        })
+
+        return [dict(option) for option in options]
+
+    def load(self, path, desired_state=None):
+        """Load a unit file, from the cache if it hasn't changed
+
+        This is equivalent to Unit(from_file=path).
+
+        Args:
+            path (str): The path to the unit file
+            desired_state (str, optional): The desired state for the unit, defaults to 'launched'
+
+        Returns:
+            Unit: A new unit with the options in the file
+
+        Raises:
+            IOError: The file does not exist or can't be read
+            fleet.v1.errors.UnitFileError: The file is not a valid unit file.  This is a ValueError.
+        """
+        return Unit(desired_state=desired_state, options=self.options(path))
+
+    def clear(self):
+        """Remove every entry from memory (entries on disk are kept, and revalidated when next used)"""
+        with self._lock:
+            self._entries.clear()
+
+
+class ResponseCache(object):
+    """An in-memory cache of fleet's responses, for a Client that reads the same units and machines repeatedly
+
+    Client.get_unit(), list_units() and list_machines() are answered from the cache for up to ``ttl`` seconds
+    after fleet was last asked.  Writes made through the same client (create_unit(), set_unit_desired_state(),
+    destroy_unit(), and the bulk versions of each) drop the entries for the unit they change, and the unit
+    listing, so a client always sees it's own writes.  Changes made by anything else are seen once entries expire.
+
+        >>> cache = ResponseCache(ttl=5)
+        >>> fleet_client = Client('http://127.0.0.1:49153', response_cache=cache)
+        >>> machines = list(fleet_client.list_machines())
+        >>> machines = list(fleet_client.list_machines())
+        >>> cache.stats
+        {'hits': 1, 'misses': 1, 'evicted': 0}
+
+    Entries are kept least recently used first out once there are ``max_entries`` of them.  A cache can be shared
+    by clients talking to the same cluster.
+
+    Attributes:
+        stats (dict): Counters: ``hits`` (answered from the cache), ``misses`` (not cached, or expired), and
+                      ``evicted`` (entries dropped to make room for others)
+
+    """
+
+    def __init__(self, max_entries=1024, ttl=5):
+        """
+        Args:
+            max_entries (int): The most entries to keep, defaults to 1024.  Each unit fetched with get_unit() is an
+                               entry, and each listing is one.
+            ttl (float): Seconds a response is used for, defaults to 5.
+
+        Raises:
+            ValueError: max_entries is less than 1, or ttl is negative
+
+        """
+        if max_entries < 1:
+            raise ValueError('max_entries must be >= 1')
+
+        if ttl < 0:
+            raise ValueError('ttl must be >= 0')
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        self.stats = {'hits': 0, 'misses': 0, 'evicted': 0}
+
+        # key -> (expires, value)
+        self._entries = _LRUDict()
+        self._lock = threading.Lock()
+
+        # bumped by every invalidation, so a response fetched before a write isn't cached after it
+        self._generation = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def generation(self):
+        """int: Pass to set() to only store a value if nothing has been invalidated since this was read"""
+        return self._generation
+
+    def get(self, key):
+        """Return the cached value for key
+
+        Args:
+            key (tuple): The key the value was stored under
+
+        Returns:
+            The value, or None if there isn't one or it has expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] <= time.time():
+                if entry is not None:
+                    self._entries.pop(key)
+
+                self.stats['misses'] += 1
+                return None
+
+            self.stats['hits'] += 1
+
+            return entry[1]
+
+    def set(self, key, value, generation=None):
+        """Store a value, evicting the least recently used entries if we're full
+
+        Args:
+            key (tuple): The key to store the value under
+            value: The value, it must not be modified once stored
+            generation (int, optional): The generation read before value was fetched.  If anything has been
+                                        invalidated since, value may be out of date and isn't stored.
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+
+            self._entries.set(key, (time.time() + self.ttl, value))
+
+            while len(self._entries) > self.max_entries:
+                self._entries.pop_oldest()
+                self.stats['evicted'] += 1
+
+    def invalidate(self, *keys):
+        """Drop the entries for keys
+
+        Args:
+            *keys (tuple): The keys to drop
+        """
+        with self._lock:
+            self._generation += 1
+
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove every entry"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
@@ -1,9 +1,9 @@
 #!/usr/bin/env python2.7
 
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build, build_from_document
 import googleapiclient.errors
 
-import json, socket, os  # NOQA
+import contextlib, json, socket, os, threading  # NOQA
 
 import httplib2
 
@@ -11,7 +11,22 @@ import paramiko
 
 from fleet.v1.objects import *
 from fleet.v1.errors import *
-from fleet.http.ssh_tunnel import SSHTunnelProxyInfo
+from fleet.v1.engine import RequestEngine
+from fleet.v1.streaming import JSONArrayStream
+from fleet.v1.interning import Interner
+from fleet.v1.bulk import WorkerPool, run_bulk
+from fleet.v1.apply import make_plan, execute_plan
+from fleet.v1.rollout import RollingUpdate
+from fleet.v1.watch import UnitStateWatcher
+from fleet.http.ssh_tunnel import SSHTunnelProxyInfo, ChannelPool
+from fleet.http.pool import PooledSocket, release_connections
+
+try:  # pragma: no cover
+    # python 2
+    import Queue as queue
+except ImportError:  # pragma: no cover
+    # python 3
+    import queue
 
 try:  # pragma: no cover
     # python 2
@@ -40,7 +55,10 @@ class SSHTunnel(object):
         port=22,
         timeout=10,
         known_hosts_file=None,
-        strict_host_key_checking=True
+        strict_host_key_checking=True,
+        max_channels=None,
+        max_idle_channels=10,
+        channel_idle_timeout=30
     ):
         """Connect to the SSH server, and authenticate
 
@@ -52,6 +70,12 @@ class SSHTunnel(object):
             known_hosts_file (str): A path to a known host file, ignored if strict_host_key_checking is False.
             strict_host_key_checking (bool): Verify host keys presented by remote machines before
             initiating SSH connections, defaults to True.
+            max_channels (int): The maximum number of forwarded channels in use by requests at once on this
+            transport, forward_tcp() blocks until one is released or closed. Idle channels kept for reuse (see
+            max_idle_channels) aren't counted. Defaults to None (no limit).
+            max_idle_channels (int): The maximum number of idle channels to keep open for reuse per
+            forwarded host:port, defaults to 10.
+            channel_idle_timeout (float): Close idle channels after this many seconds, defaults to 30.
 
         Raises:
             ValueError: strict_host_key_checking was true, but known_hosts_file didn't exist.
@@ -63,6 +87,13 @@ class SSHTunnel(object):
         self.client = None
         self.transport = None
 
+        # (host, port) -> ChannelPool, all sharing one limit on open channels
+        self._channel_pools = {}
+        self._channel_pools_lock = threading.Lock()
+        self._channel_limit = threading.BoundedSemaphore(max_channels) if max_channels else None
+        self._max_idle_channels = max_idle_channels
+        self._channel_idle_timeout = channel_idle_timeout
+
         # if they passed us a transport, then we don't need to make our own
         if isinstance(host, paramiko.transport.Transport):
             self.transport = host
@@ -97,15 +128,57 @@ class SSHTunnel(object):
     def forward_tcp(self, host, port):
         """Open a connection to host:port via an ssh tunnel.
 
+        An idle channel to host:port is reused if one is available.  Call release() on the result to
+        return the channel for reuse once you are finished with it, or close() to close it.
+
         Args:
             host (str): The host to connect to.
             port (int): The port to connect to.
 
         Returns:
-            A socket-like object that is connected to the provided host:port.
+            fleet.http.PooledSocket: A socket-like object that is connected to the provided host:port.
 
         """
 
+        pool = self.channel_pool(host, port)
+
+        return PooledSocket(pool.checkout(), pool)
+
+    def channel_pool(self, host, port):
+        """Return the pool of channels forwarded to host:port
+
+        Args:
+            host (str): The host
+            port (int): The port
+
+        Returns:
+            fleet.http.ChannelPool: The pool
+        """
+
+        with self._channel_pools_lock:
+            try:
+                return self._channel_pools[(host, port)]
+            except KeyError:
+                pool = ChannelPool(
+                    connect=lambda: self._open_tcp_channel(host, port),
+                    max_size=self._max_idle_channels,
+                    idle_timeout=self._channel_idle_timeout,
+                    limiter=self._channel_limit
+                )
+                self._channel_pools[(host, port)] = pool
+                return pool
+
+    def _open_tcp_channel(self, host, port):
+        """Open a new direct-tcpip channel to host:port
+
+        Args:
+            host (str): The host to connect to.
+            port (int): The port to connect to.
+
+        Returns:
+            paramiko.channel.Channel: A channel connected to the provided host:port.
+        """
+
         return self.transport.open_channel(
             'direct-tcpip',
             (host, port),
@@ -151,6 +224,13 @@ class Client(object):
     _API = 'fleet'
     _VERSION = 'v1'
     _STATES = ['inactive', 'loaded', 'launched']
+    _ENGINES = ['discovery', 'native']
+
+    # how much of a streamed response to read at once
+    _STREAM_CHUNK_SIZE = 65536
+
+    # the most idle http objects to keep for reuse, see _checkin_http()
+    _MAX_IDLE_HTTP = 10
 
     def __init__(
         self,
@@ -162,8 +242,25 @@ class Client(object):
         ssh_timeout=10,
         ssh_known_hosts_file='~/.fleetctl/known_hosts',
         ssh_strict_host_key_checking=True,
+        ssh_max_channels=None,
+
+        ssh_raw_transport=None,
 
-        ssh_raw_transport=None
+        discovery_cache=None,
+
+        lazy=False,
+
+        engine='discovery',
+
+        prefetch_pages=0,
+
+        streaming=False,
+
+        intern_strings=True,
+
+        read_back=True,
+
+        response_cache=None
     ):
 
         """Connect to the fleet API and generate a client based on it's discovery document.
@@ -177,7 +274,9 @@ class Client(object):
 
             http (httplib2.Http): An instance of httplib2.Http (or something that acts like it) that HTTP requests will
             be made through. You do not need to pass this unless you need to configure specific options for your
-            http client, or want to pass in a mock for testing.
+            http client, or want to pass in a mock for testing.  As httplib2 is not thread-safe, requests made
+            through an http object you pass in are serialized; if you don't pass one, concurrent requests each
+            borrow their own from a small pool the client keeps.
 
             ssh_tunnel (str '<host>[:<port>]'): Establish an SSH tunnel through the provided address for communication
             with fleet. Defaults to None. If specified, the following other options adjust it's behaivor:
@@ -188,12 +287,54 @@ class Client(object):
                 defaults to '~/.fleetctl/known_hosts'.  Ignored if `ssh_strict_host_key_checking` is False
                 ssh_strict_host_key_checking (bool): Verify host keys presented by remote machines before
                 initiating SSH connections, defaults to True.
+                ssh_max_channels (int): The maximum number of channels in use by requests through the tunnel at
+                once. Requests wait for a channel to become available once this many are in use. Idle channels
+                kept for reuse (up to 10 per forwarded host and port) aren't counted. Also applies to
+                ssh_raw_transport. Defaults to None (no limit).
 
             ssh_raw_transport (paramiko.transport.Transport): An active Transport on which open_channel() will be
             called to establish connections.
 
             See Advanced SSH Tunneling in docs/client.md for more information.
 
+            discovery_cache (fleet.v1.DiscoveryCache): Store the discovery document on disk and reuse it across
+            processes, revalidating it with a conditional GET once it's older than the cache's max_age.
+            Defaults to None, which fetches the discovery document every time a Client is created.
+
+            lazy (bool): If True, don't establish the ssh tunnel or perform discovery until the first API call.
+            Errors connecting to the endpoint will then be raised as ValueError from that call. Defaults to False.
+
+            engine (str): How requests are made to fleet. Supported engines are:
+                discovery: Generate a client binding from fleet's discovery document using googleapiclient.
+                native: Build requests directly from the fleet v1 API's known routes. This skips discovery
+                        entirely, and has much less overhead per request. Note that in this mode an endpoint
+                        that isn't fleet won't be detected until the first API call.
+            Defaults to 'discovery'.
+
+            prefetch_pages (int): When listing, fetch up to this many pages ahead of the page being consumed in a
+            background thread, instead of waiting to request each page until the previous one has been consumed.
+            This bounds how many pages are held in memory at once.  Defaults to 0 (no read-ahead).
+
+            streaming (bool): Decode list responses incrementally as they are read from the connection, yielding
+            each object as soon as it has arrived rather than once the whole page has.  Can't be combined with
+            ``http`` (streamed requests are made on their own connections) or ``prefetch_pages``.
+            Defaults to False.
+
+            intern_strings (bool): Share one copy of each of the values that repeat throughout listings (machine IDs,
+            unit and systemd states, unit option sections and names) among the objects list_units(),
+            list_unit_states(), and list_machines() return, rather than keeping a copy per object.  This
+            considerably reduces the memory used to hold a large cluster's units.  Defaults to True.
+
+            read_back (bool): After create_unit() and set_unit_desired_state() write a unit, fetch it again to return
+            it as fleet has it.  If False, the unit returned is built from what was written, and is only fetched
+            the first time a field fleet fills in (such as currentState or machineID) is accessed, so writes take
+            one request instead of two.  Both methods also accept read_back to override this per call.
+            Defaults to True.
+
+            response_cache (fleet.v1.ResponseCache): Answer get_unit(), list_units(), and list_machines() from this
+            cache until it's entries expire.  Units written through this client are dropped from the cache as they
+            are written.  Defaults to None, which asks fleet every time.
+
         Raises:
             ValueError: The endpoint provided was not accessible or your ssh configuration is incorrect
         """
@@ -211,60 +352,201 @@ class Client(object):
         if ssh_tunnel and ssh_raw_transport:
             raise ValueError('If ssh_tunnel is specified, ssh_raw_transport must be None')
 
+        if engine not in self._ENGINES:
+            raise ValueError('engine must be one of: {0}'.format(self._ENGINES))
+
+        if prefetch_pages < 0:
+            raise ValueError('prefetch_pages must be >= 0')
+
+        if streaming and http:
+            raise ValueError('You cannot specify your own http client, and request streaming.')
+
+        if streaming and prefetch_pages:
+            raise ValueError('streaming and prefetch_pages cannot be used together.')
+
         # see if we need to setup an ssh tunnel
+        # we validate the configuration here, but don't connect until _connect()
         self._ssh_tunnel = None
+        self._ssh_config = None
 
         # if they handed us a transport, then we either bail or are good to go
         if ssh_raw_transport:
             if not isinstance(ssh_raw_transport, paramiko.transport.Transport):
                 raise ValueError('ssh_raw_transport must be an active instance of paramiko.transport.Transport.')
 
-            self._ssh_tunnel = SSHTunnel(host=ssh_raw_transport)
+            self._ssh_config = {'host': ssh_raw_transport, 'max_channels': ssh_max_channels}
 
         # otherwise we are connecting ourselves
         elif ssh_tunnel:
             (ssh_host, ssh_port) = self._split_hostport(ssh_tunnel, default_port=22)
 
-            try:
-                self._ssh_tunnel = SSHTunnel(
-                    host=ssh_host,
-                    port=ssh_port,
-                    username=ssh_username,
-                    timeout=ssh_timeout,
-                    known_hosts_file=ssh_known_hosts_file,
-                    strict_host_key_checking=ssh_strict_host_key_checking
-                )
+            self._ssh_config = {
+                'host': ssh_host,
+                'port': ssh_port,
+                'username': ssh_username,
+                'timeout': ssh_timeout,
+                'known_hosts_file': ssh_known_hosts_file,
+                'strict_host_key_checking': ssh_strict_host_key_checking,
+                'max_channels': ssh_max_channels
+            }
 
-            except socket.gaierror as exc:
-                raise ValueError('{0} could not be resolved.'.format(ssh_host))
+        self._http = http
 
-            except socket.error as exc:
-                raise ValueError('Unable to connect to {0}:{1}: {2}'.format(
-                    ssh_host,
-                    ssh_port,
-                    exc
-                ))
+        # if they handed us an http object we have no way to make more of them
+        self._http_factory = None if http else self._new_http
 
-            except paramiko.ssh_exception.SSHException as exc:
-                raise ValueError('Unable to connect via ssh: {0}: {1}'.format(
-                    exc.__class__.__name__,
-                    exc
-                ))
+        # httplib2 is not thread-safe.  If we make our own http objects each request borrows one nobody else is
+        # using (see _borrow_http), otherwise everyone takes turns with the one we were given
+        self._idle_http = []
+        self._idle_http_lock = threading.Lock()
+        self._http_lock = threading.RLock()
+
+        self._discovery_cache = discovery_cache
+        self._service = None
+
+        self._engine_name = engine
+        self._engine = None
+
+        self._prefetch_pages = prefetch_pages
+
+        self._streaming = streaming
+        self._stream_engine = None
+
+        self._interner = Interner() if intern_strings else None
+
+        self._read_back = read_back
+
+        self._response_cache = response_cache
+
+        # threads for create_units() and friends, kept between calls
+        self._workers = WorkerPool()
+
+        # dotted method name -> method in the generated client binding, see _resolve_method()
+        self._method_cache = {}
+        self._method_cache_hits = 0
+        self._method_cache_misses = 0
+
+        # _connect() is called at most once successfully, even if many threads make their first request at once
+        self._connected = False
+        self._connect_lock = threading.Lock()
+
+        # if we've made it this far, we are ready to try to talk to fleet
+        # possibly through a proxy...
+        if not lazy:
+            self._connect()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Stop the worker threads used by bulk operations, and close the connections of idle http objects
+
+        The Client can still be used afterwards, threads and connections are created again as they're needed.
+        Called automatically when used as a ``with`` context manager.
+        """
+
+        self._workers.close()
+
+        with self._idle_http_lock:
+            (idle, self._idle_http) = (self._idle_http, [])
+
+        for http in idle:
+            self._close_http(http)
+
+    def _connect(self):
+        """Establish the ssh tunnel (if configured) and generate a client binding from the discovery document
+
+        Raises:
+            ValueError: The endpoint provided was not accessible or your ssh configuration is incorrect
+        """
+
+        if self._ssh_config and self._ssh_tunnel is None:
+            self._ssh_tunnel = self._open_ssh_tunnel(**self._ssh_config)
 
-        # did we get an ssh connection up?
-        if self._ssh_tunnel:
             # inject the SSH tunnel socketed into httplib via the proxy_info interface
-            self._http = httplib2.Http(proxy_info=self._get_proxy_info)
+            self._http = self._new_http()
 
             # preface our scheme with 'ssh+'; httplib2's SCHEME_TO_CONNECTION
             # will invoke our custom connection objects and route the HTTP
             # call across the SSH connection established or passed in above
             self._endpoint = 'ssh+' + self._endpoint
+
+        if self._engine_name == 'native':
+            # googleapiclient would make it's own http object, but we talk to it directly
+            if self._http is None:
+                self._http = self._new_http()
+
+            self._engine = RequestEngine(self._endpoint, api=self._API, version=self._VERSION)
         else:
-            self._http = http
+            self._discover()
 
-        # if we've made it this far, we are ready to try to talk to fleet
-        # possibly through a proxy...
+        # streamed requests bypass the generated bindings, even if we have them
+        if self._streaming:
+            self._stream_engine = self._engine or RequestEngine(self._endpoint, api=self._API, version=self._VERSION)
+
+        self._connected = True
+
+    def _ensure_connected(self):
+        """Call _connect() if it hasn't been called successfully yet
+
+        Raises:
+            ValueError: The endpoint provided was not accessible or your ssh configuration is incorrect
+        """
+
+        # cheap check first, so we don't contend on the lock once we are up
+        if self._connected:
+            return
+
+        with self._connect_lock:
+            if not self._connected:
+                self._connect()
+
+    def _open_ssh_tunnel(self, host, port=22, **kwargs):
+        """Connect an SSHTunnel, converting connection errors to ValueError
+
+        Args:
+            host (str or paramiko.transport.Transport): Passed directly to SSHTunnel
+            port (int): Passed directly to SSHTunnel
+            **kwargs: Passed directly to SSHTunnel
+
+        Returns:
+            SSHTunnel: The connected tunnel
+
+        Raises:
+            ValueError: Unable to establish the ssh connection
+        """
+
+        try:
+            return SSHTunnel(host=host, port=port, **kwargs)
+
+        except socket.gaierror:
+            raise ValueError('{0} could not be resolved.'.format(host))
+
+        except socket.error as exc:
+            raise ValueError('Unable to connect to {0}:{1}: {2}'.format(
+                host,
+                port,
+                exc
+            ))
+
+        except paramiko.ssh_exception.SSHException as exc:
+            raise ValueError('Unable to connect via ssh: {0}: {1}'.format(
+                exc.__class__.__name__,
+                exc
+            ))
+
+    def _discover(self):
+        """Retrieve the discovery document and generate a client binding from it
+
+        Raises:
+            ValueError: The endpoint provided was not accessible, or is not a fleet v1 API endpoint
+        """
+
+        # anything resolved from the previous binding is no longer valid
+        self._method_cache = {}
 
         # generate a client binding using the google-api-python client.
         # See https://developers.google.com/api-client-library/python/start/get_started
@@ -272,13 +554,19 @@ class Client(object):
         try:
             discovery_url = self._endpoint + '/{api}/{apiVersion}/discovery'
 
-            self._service = build(
-                self._API,
-                self._VERSION,
-                cache_discovery=False,
-                discoveryServiceUrl=discovery_url,
-                http=self._http
-            )
+            if self._discovery_cache is None:
+                self._service = build(
+                    self._API,
+                    self._VERSION,
+                    cache_discovery=False,
+                    discoveryServiceUrl=discovery_url,
+                    http=self._http
+                )
+            else:
+                self._service = build_from_document(
+                    self._get_discovery_document(discovery_url.format(api=self._API, apiVersion=self._VERSION)),
+                    http=self._http
+                )
         except socket.error as exc:  # pragma: no cover
             raise ValueError('Unable to connect to endpoint {0}: {1}'.format(
                 self._endpoint,
@@ -292,6 +580,194 @@ class Client(object):
                     self._API,
                     self._VERSION
                 ))
+        finally:
+            # give back any pooled socket the discovery request was made on
+            release_connections(self._http)
+
+    def _get_discovery_document(self, url):
+        """Return the discovery document from our cache, revalidating it if needed
+
+        Args:
+            url (str): The URL of the discovery document
+
+        Returns:
+            str: The discovery document
+
+        Raises:
+            googleapiclient.errors.UnknownApiNameOrVersion: The discovery document could not be retrieved
+        """
+
+        entry = self._discovery_cache.get(url)
+
+        # fresh enough to use without asking fleet
+        if entry and self._discovery_cache.is_fresh(entry):
+            return entry['document']
+
+        # stale, but we were told that's ok as long as we check in the background.
+        # We can only do this if we control the http object, as httplib2 is not thread-safe
+        # and we don't know how to make another one of whatever we were handed
+        if entry and self._discovery_cache.stale_while_revalidate and self._http_factory:
+            thread = threading.Thread(
+                target=self._revalidate_discovery_document_quietly,
+                args=(url, entry, self._http_factory())
+            )
+            thread.daemon = True
+            thread.start()
+
+            return entry['document']
+
+        return self._revalidate_discovery_document(url, entry, self._http or httplib2.Http())
+
+    def _revalidate_discovery_document(self, url, entry, http):
+        """Fetch the discovery document, using a conditional GET if we have a cached copy
+
+        Args:
+            url (str): The URL of the discovery document
+            entry (dict): The cached entry for url, or None
+            http (httplib2.Http): The http object to make the request with
+
+        Returns:
+            str: The discovery document
+
+        Raises:
+            googleapiclient.errors.UnknownApiNameOrVersion: The discovery document could not be retrieved
+        """
+
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+
+        response, content = http.request(url, headers=headers)
+
+        # Nothing changed, so start the max_age clock again
+        if response.status == 304 and entry:
+            self._discovery_cache.touch(url, entry)
+            return entry['document']
+
+        if response.status >= 400:
+            raise googleapiclient.errors.UnknownApiNameOrVersion(
+                'name: {0}  version: {1}'.format(self._API, self._VERSION)
+            )
+
+        if isinstance(content, bytes):
+            content = content.decode('utf-8')
+
+        self._discovery_cache.set(url, content, response.get('etag'))
+
+        return content
+
+    def _revalidate_discovery_document_quietly(self, url, entry, http):
+        """Revalidate the discovery document in the background, ignoring any errors
+
+        The stale document is already in use, so a failure here just means we'll try again next time.
+        """
+        try:
+            self._revalidate_discovery_document(url, entry, http)
+        except Exception:
+            pass
+
+    def _new_http(self):
+        """Create a new http object configured the same way as the one we created in the constructor
+
+        Returns:
+            httplib2.Http: A new http object
+        """
+
+        if self._ssh_tunnel:
+            return httplib2.Http(proxy_info=self._get_proxy_info)
+
+        return httplib2.Http()
+
+    def _checkout_http(self):
+        """Take one of our idle http objects, creating another if there are none
+
+        Returns:
+            httplib2.Http: An http object nobody else is using, give it back with _checkin_http()
+        """
+
+        with self._idle_http_lock:
+            if self._idle_http:
+                return self._idle_http.pop()
+
+        return self._http_factory()
+
+    def _checkin_http(self, http):
+        """Give back an http object from _checkout_http() once the responses made through it have been read
+
+        It's pooled sockets are released (see release_connections()), and it's kept for the next request unless
+        _MAX_IDLE_HTTP are already idle, in which case it's connections are closed.
+
+        Args:
+            http (httplib2.Http): The http object
+        """
+
+        release_connections(http)
+
+        with self._idle_http_lock:
+            keep = len(self._idle_http) < self._MAX_IDLE_HTTP
+            if keep:
+                self._idle_http.append(http)
+
+        if not keep:
+            self._close_http(http)
+
+    @staticmethod
+    def _close_http(http):
+        """Close the connections an http object is holding on to
+
+        Args:
+            http (httplib2.Http): The http object
+        """
+
+        connections = getattr(http, 'connections', None)
+        if isinstance(connections, dict):
+            for conn in list(connections.values()):
+                conn.close()
+            connections.clear()
+
+    @contextlib.contextmanager
+    def _borrow_http(self):
+        """Get an http object the calling thread can use without interference from other threads
+
+        If we created our own http objects, this is one that no other thread is using, which goes back to our
+        idle http objects once the caller is done.  Otherwise it's the one we were given, and we hold a lock until
+        the caller is done with it.  Either way, pooled sockets (http+unix, and ssh tunnels) are given back once
+        the caller is done, see release_connections().
+
+        Yields:
+            httplib2.Http: The http object to make requests with
+        """
+
+        if self._http_factory is not None:
+            http = self._checkout_http()
+            try:
+                yield http
+            finally:
+                self._checkin_http(http)
+            return
+
+        with self._http_lock:
+            try:
+                yield self._http
+            finally:
+                release_connections(self._http)
+
+    def _new_connection(self, url):
+        """Create a connection for a request to url the same way httplib2 would
+
+        Args:
+            url (str): The URL that will be requested
+
+        Returns:
+            httplib.HTTPConnection: An unconnected connection
+        """
+
+        parsed = urlparse.urlparse(url)
+
+        return httplib2.SCHEME_TO_CONNECTION[parsed.scheme](
+            parsed.netloc,
+            proxy_info=self._get_proxy_info if self._ssh_tunnel else None
+        )
 
     def _split_hostport(self, hostport, default_port=None):
         """Split a string in the format of '<host>:<port>' into it's component parts
@@ -397,26 +873,21 @@ class Client(object):
 
         Raises:
             fleet.v1.errors.APIError: Fleet returned a response code >= 400
+            ValueError: The client is lazy, and connecting to the endpoint failed
         """
 
-        # The auto generated client binding require instantiating each object you want to call a method on
-        # For example to make a request to /machines for the list of machines you would do:
-        # self._service.Machines().List(**kwargs)
-        # This code iterates through the tokens in `method` and instantiates each object
-        # Passing the `*args` and `**kwargs` to the final method listed
-
-        # Start here
-        _method = self._service
+        self._ensure_connected()
 
-        # iterate over each token in the requested method
-        for item in method.split('.'):
+        # the native engine builds the request from it's own routes, so there's nothing to instantiate
+        if self._engine is not None:
+            try:
+                with self._borrow_http() as http:
+                    return self._engine.request(http, method, *args, **kwargs)
+            except googleapiclient.errors.HttpError as exc:
+                raise self._api_error(exc)
 
-            # if it's the end of the line, pass our argument
-            if method.endswith(item):
-                _method = getattr(_method, item)(*args, **kwargs)
-            else:
-                # otherwise, just create an instance and move on
-                _method = getattr(_method, item)()
+        # resolve (or retrieve from cache) the generated method, and call it to build our request
+        _method = self._resolve_method(method)(*args, **kwargs)
 
         # Discovered endpoints look like r'$ENDPOINT/path/to/method' which isn't a valid URI
         # Per the fleet API documentation:
@@ -424,19 +895,112 @@ class Client(object):
             # clients must initialize this as appropriate."
 
         # So we follow the documentation, and replace the token with our actual endpoint
-        _method.uri = _method.uri.replace('$ENDPOINT', self._endpoint)
+        # _resolve_method has usually done this already, so this is just a safety net
+        if '$ENDPOINT' in _method.uri:
+            _method.uri = _method.uri.replace('$ENDPOINT', self._endpoint)
 
         # Execute the method and return it's output directly
         try:
-            return _method.execute(http=self._http)
+            with self._borrow_http() as http:
+                return _method.execute(http=http)
         except googleapiclient.errors.HttpError as exc:
-            response = json.loads(exc.content.decode('utf-8'))['error']
+            raise self._api_error(exc)
+
+    def _resolve_method(self, method):
+        """Find the callable in the generated client binding for a dotted method name
+
+        The result is cached for the lifetime of the client binding, so the resource chain is only walked
+        once per method.
+
+        Args:
+            method (str): A dot delimited string indicating the method to call.  Example: 'Machines.List'
+
+        Returns:
+            callable: The generated method, which returns a googleapiclient.http.HttpRequest when called
+        """
+
+        try:
+            func = self._method_cache[method]
+            self._method_cache_hits += 1
+            return func
+        except KeyError:
+            self._method_cache_misses += 1
+
+        # The auto generated client binding require instantiating each object you want to call a method on
+        # For example to make a request to /machines for the list of machines you would do:
+        # self._service.Machines().List(**kwargs)
+        # This code iterates through the tokens in `method` and instantiates each object
+        # and returns the final method listed
+        tokens = method.split('.')
+
+        # Start here
+        resource = self._service
+
+        for item in tokens[:-1]:
+            resource = getattr(resource, item)()
+
+            # Substitute our endpoint into the resource's base URL once, rather than into every request's URI
+            if '$ENDPOINT' in getattr(resource, '_baseUrl', ''):
+                resource._baseUrl = resource._baseUrl.replace('$ENDPOINT', self._endpoint)
 
-            raise APIError(code=response['code'], message=response['message'], http_error=exc)
+        func = getattr(resource, tokens[-1])
+
+        self._method_cache[method] = func
+
+        return func
+
+    def dispatch_stats(self):
+        """Report how effective the method dispatch cache is
+
+        Counters are updated without locking, so they may be slightly off when the client is used from
+        multiple threads.
+
+        Returns:
+            dict: With the keys 'hits', 'misses', 'size' (number of cached methods), and 'hit_rate' (0.0 - 1.0)
+        """
+        total = self._method_cache_hits + self._method_cache_misses
+
+        return {
+            'hits': self._method_cache_hits,
+            'misses': self._method_cache_misses,
+            'size': len(self._method_cache),
+            'hit_rate': float(self._method_cache_hits) / total if total else 0.0
+        }
+
+    def refresh_discovery(self):
+        """Retrieve the discovery document again and regenerate the client binding
+
+        Any cached method dispatch is discarded. If a DiscoveryCache is in use, it's rules still apply,
+        so a fresh entry will be reused.
+
+        Raises:
+            ValueError: The endpoint provided was not accessible, or is not a fleet v1 API endpoint
+        """
+
+        self._ensure_connected()
+
+        # the native engine doesn't use the discovery document
+        if self._engine is None:
+            self._discover()
+
+    def _api_error(self, exc):
+        """Convert an HttpError into an APIError using the error fleet included in the response
+
+        Args:
+            exc (googleapiclient.errors.HttpError): The error to convert
+
+        Returns:
+            fleet.v1.errors.APIError: The converted error
+        """
+        response = json.loads(exc.content.decode('utf-8'))['error']
+
+        return APIError(code=response['code'], message=response['message'], http_error=exc)
 
     def _request(self, method, *args, **kwargs):
         """Make a request with automatic pagination handling
 
+        Pages are read ahead in a background thread if the client was created with ``prefetch_pages``
+
         Args:
             method (str): A dot delimited string indicating the method to call.  Example: 'Machines.List'
             *args: Passed directly to the method being called.
@@ -455,6 +1019,17 @@ class Client(object):
 
         """
 
+        if self._prefetch_pages:
+            return self._prefetch_request(self._prefetch_pages, method, *args, **kwargs)
+
+        return self._serial_request(method, *args, **kwargs)
+
+    def _serial_request(self, method, *args, **kwargs):
+        """Make a request with automatic pagination handling, requesting each page once the last is consumed
+
+        See _request() for arguments.
+        """
+
         # This is set to False and not None so that the while loop below will execute at least once
         next_page_token = False
 
@@ -474,7 +1049,211 @@ class Client(object):
             # Return the current response
             yield response
 
-    def create_unit(self, name, unit):
+    def _prefetch_request(self, pages, method, *args, **kwargs):
+        """Make a request with automatic pagination handling, reading ahead in a background thread
+
+        Each page is requested as soon as the previous page's token is known, until ``pages`` pages are
+        waiting to be consumed.
+
+        Args:
+            pages (int): The maximum number of pages fetched but not yet consumed
+            method (str): See _request()
+            *args: See _request()
+            **kwargs: See _request()
+
+        Yields:
+            dict: The next page of responses from the method called.
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400
+        """
+
+        fetched = queue.Queue()
+
+        # one slot per page fetched, but not yet handed to our consumer
+        slots = threading.Semaphore(pages)
+        stop = threading.Event()
+
+        def fetch():
+            responses = self._serial_request(method, *args, **kwargs)
+
+            try:
+                while True:
+                    slots.acquire()
+
+                    # our consumer went away, don't bother with the rest
+                    if stop.is_set():
+                        return
+
+                    try:
+                        response = next(responses)
+                    except StopIteration:
+                        fetched.put((None, None))
+                        return
+
+                    fetched.put((response, None))
+            except Exception as exc:
+                fetched.put((None, exc))
+
+        thread = threading.Thread(target=fetch)
+        thread.daemon = True
+        thread.start()
+
+        try:
+            while True:
+                (response, exc) = fetched.get()
+                slots.release()
+
+                if exc is not None:
+                    raise exc
+
+                if response is None:
+                    return
+
+                yield response
+        finally:
+            # if we are closed early, the fetch thread may be waiting for a slot; give it one so it sees it's stopped
+            stop.set()
+            slots.release()
+
+    def _stream_request(self, method, key, **kwargs):
+        """Make a request with automatic pagination handling, decoding each page as it's read
+
+        Args:
+            method (str): A dot delimited string indicating the method to call.  Example: 'Machines.List'
+            key (str): The member of the response containing the list of results.  Example: 'machines'
+            **kwargs: Passed directly to the method being called.
+
+        Yields:
+            dict: The next result in ``key``, from each page in turn
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400
+        """
+
+        self._ensure_connected()
+
+        # This is set to False and not None so that the while loop below will execute at least once
+        next_page_token = False
+
+        while next_page_token is not None:
+            if next_page_token:
+                kwargs['nextPageToken'] = next_page_token
+
+            try:
+                (conn, response) = self._stream_engine.open(self._new_connection, method, **kwargs)
+            except googleapiclient.errors.HttpError as exc:
+                raise self._api_error(exc)
+
+            # if we are closed part way through the page, the connection is closed rather than reused
+            try:
+                page = JSONArrayStream(iter(lambda: response.read(self._STREAM_CHUNK_SIZE), b''), key)
+                for item in page:
+                    yield item
+
+                # finish reading whatever follows the closing brace, so the connection can be reused
+                response.read()
+            finally:
+                conn.close()
+
+            next_page_token = page.members.get('nextPageToken', None)
+
+    def _list(self, method, key, intern=None, **kwargs):
+        """Make a request with automatic pagination handling, yielding each result from each page
+
+        Args:
+            method (str): A dot delimited string indicating the method to call.  Example: 'Machines.List'
+            key (str): The member of the response containing the list of results.  Example: 'machines'
+            intern (str): The Interner method to pass each result through if we are interning strings.
+                          Example: 'machine'
+            **kwargs: Passed directly to the method being called.
+
+        Yields:
+            dict: The next result
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400
+        """
+
+        if self._streaming:
+            items = self._stream_request(method, key, **kwargs)
+        else:
+            items = (item for page in self._request(method, **kwargs) for item in page.get(key, []))
+
+        if intern and self._interner is not None:
+            intern = getattr(self._interner, intern)
+        else:
+            intern = None
+
+        for item in items:
+            yield intern(item) if intern else item
+
+    def _cached(self, key, fetch):
+        """Return the response cached under key, or call fetch() and cache what it returns
+
+        Args:
+            key (tuple): The key in the response cache
+            fetch (callable): Makes the request(s) if the response isn't cached
+
+        Returns:
+            The response, which must not be modified as it may be shared
+        """
+        cache = self._response_cache
+
+        value = cache.get(key)
+        if value is None:
+            # if a write invalidates the cache while we're fetching, what we fetched may predate it
+            generation = cache.generation
+            value = fetch()
+            cache.set(key, value, generation)
+
+        return value
+
+    def _invalidate_unit(self, name):
+        """Drop a unit we've written, and the unit listing, from the response cache"""
+        if self._response_cache is not None:
+            self._response_cache.invalidate(('unit', name), ('units',))
+
+    @staticmethod
+    def _copy_unit(data):
+        """Copy a cached unit, so changes to the Unit made from it don't change the cache"""
+        data = dict(data)
+        if data.get('options'):
+            data['options'] = [dict(option) for option in data['options']]
+
+        return data
+
+    @staticmethod
+    def _copy_machine(data):
+        """Copy a cached machine, so changes to the Machine made from it don't change the cache"""
+        data = dict(data)
+        if data.get('metadata'):
+            data['metadata'] = dict(data['metadata'])
+
+        return data
+
+    def _written_unit(self, data, read_back):
+        """Return the unit we just wrote
+
+        Args:
+            data (dict): What we wrote, including the unit's name
+            read_back (bool): Fetch the unit from fleet. If None, use the client's default
+
+        Returns:
+            Unit: The unit from fleet, or built from data and fetched on demand
+        """
+        if read_back is None:
+            read_back = self._read_back
+
+        if read_back:
+            return self.get_unit(data['name'])
+
+        unit = Unit(client=self, data=data)
+        unit._defer_fetch()
+
+        return unit
+
+    def create_unit(self, name, unit, read_back=None):
         """Create a new Unit in the cluster
 
         Create and modify Unit entities to communicate to fleet the desired state of the cluster.
@@ -486,6 +1265,9 @@ class Client(object):
         Args:
             name (str): The name of the unit to create
             unit (Unit): The unit to submit to fleet
+            read_back (bool): Fetch the unit from fleet after creating it.  If False, return a unit built from what
+                              was submitted that is fetched when fields fleet fills in are accessed.
+                              Defaults to the client's read_back.
 
         Returns:
             Unit: The unit that was created
@@ -495,14 +1277,22 @@ class Client(object):
 
         """
 
-        self._single_request('Units.Set', unitName=name, body={
+        try:
+            self._single_request('Units.Set', unitName=name, body={
+                'desiredState': unit.desiredState,
+                'options': unit.options
+            })
+        finally:
+            # even a failed write may have changed something
+            self._invalidate_unit(name)
+
+        return self._written_unit({
+            'name': name,
             'desiredState': unit.desiredState,
-            'options': unit.options
-        })
-
-        return self.get_unit(name)
+            'options': [dict(option) for option in unit.options]
+        }, read_back)
 
-    def set_unit_desired_state(self, unit, desired_state):
+    def set_unit_desired_state(self, unit, desired_state, read_back=None):
         """Update the desired state of a unit running in the cluster
 
         Args:
@@ -510,6 +1300,10 @@ class Client(object):
 
             desired_state: State the user wishes the Unit to be in
                           ("inactive", "loaded", or "launched")
+
+            read_back (bool): Fetch the unit from fleet after updating it.  If False, return a unit built from what
+                              is known that is fetched when any other field is accessed.
+                              Defaults to the client's read_back.
         Returns:
             Unit: The unit that was updated
 
@@ -524,18 +1318,29 @@ class Client(object):
                 self._STATES
             ))
 
+        written = {'desiredState': desired_state}
+
         # if we are given an object, grab it's name property
         # otherwise, convert to unicode
         if isinstance(unit, Unit):
+            # setting the desired state doesn't change the options, so we know them too
+            if 'options' in unit._data:
+                written['options'] = [dict(option) for option in unit._data['options']]
+
             unit = unit.name
         else:
             unit = str(unit)
 
-        self._single_request('Units.Set', unitName=unit, body={
-            'desiredState': desired_state
-        })
+        try:
+            self._single_request('Units.Set', unitName=unit, body={
+                'desiredState': desired_state
+            })
+        finally:
+            self._invalidate_unit(unit)
+
+        written['name'] = unit
 
-        return self.get_unit(unit)
+        return self._written_unit(written, read_back)
 
     def destroy_unit(self, unit):
         """Delete a unit from the cluster
@@ -558,9 +1363,175 @@ class Client(object):
         else:
             unit = str(unit)
 
-        self._single_request('Units.Delete', unitName=unit)
+        try:
+            self._single_request('Units.Delete', unitName=unit)
+        finally:
+            self._invalidate_unit(unit)
+
         return True
 
+    def _run_bulk(self, operation, items, concurrency):
+        """Run a bulk operation on our worker threads, see fleet.v1.bulk.run_bulk()"""
+        return run_bulk(operation, items, concurrency, workers=self._workers)
+
+    @staticmethod
+    def _bulk_name(unit):
+        """Return the name of a Unit, or a unit name, for keying bulk results"""
+        if isinstance(unit, Unit):
+            return unit.name
+
+        return str(unit)
+
+    def create_units(self, units, concurrency=10, read_back=False):
+        """Create many Units in the cluster at once
+
+        Units are created concurrently, each exactly as create_unit() would.  A unit that can't be created
+        doesn't stop the others; it's error is returned instead.
+
+            >>> result = fleet_client.create_units(fleet.load_units('/srv/units').units)
+            >>> result.errors
+            {}
+
+        Args:
+            units (dict, iterable): name -> Unit, or an iterable of (name, Unit)
+            concurrency (int): The most requests to make at once, defaults to 10
+            read_back (bool): Fetch each unit after creating it, see create_unit(). Defaults to False.
+
+        Returns:
+            BulkResult: ``results`` maps the name of each unit created to the Unit, ``errors`` maps the name of each
+                        unit that couldn't be created to the exception raised (usually APIError)
+
+        Raises:
+            ValueError: concurrency is less than 1
+        """
+        if isinstance(units, dict):
+            units = units.items()
+
+        items = ((name, (name, unit, read_back)) for (name, unit) in units)
+
+        return self._run_bulk(self.create_unit, items, concurrency)
+
+    def set_units_desired_state(self, units, desired_state, concurrency=10, read_back=False):
+        """Update the desired state of many units at once
+
+        Units are updated concurrently, each exactly as set_unit_desired_state() would.  A unit that can't be
+        updated doesn't stop the others; it's error is returned instead.
+
+        Args:
+            units (iterable): Units, or names of units, to update
+            desired_state: State the user wishes the Units to be in ("inactive", "loaded", or "launched")
+            concurrency (int): The most requests to make at once, defaults to 10
+            read_back (bool): Fetch each unit after updating it, see set_unit_desired_state(). Defaults to False.
+
+        Returns:
+            BulkResult: ``results`` maps the name of each unit updated to the Unit, ``errors`` maps the name of each
+                        unit that couldn't be updated to the exception raised (usually APIError)
+
+        Raises:
+            ValueError: An invalid value was provided for ``desired_state``, or concurrency is less than 1
+        """
+        if desired_state not in self._STATES:
+            raise ValueError('state must be one of: {0}'.format(
+                self._STATES
+            ))
+
+        items = ((self._bulk_name(unit), (unit, desired_state, read_back)) for unit in units)
+
+        return self._run_bulk(self.set_unit_desired_state, items, concurrency)
+
+    def destroy_units(self, units, concurrency=10):
+        """Delete many units from the cluster at once
+
+        Units are deleted concurrently, each exactly as destroy_unit() would.  A unit that can't be deleted
+        doesn't stop the others; it's error is returned instead.
+
+        Args:
+            units (iterable): Units, or names of units, to delete
+            concurrency (int): The most requests to make at once, defaults to 10
+
+        Returns:
+            BulkResult: ``results`` maps the name of each unit deleted to True, ``errors`` maps the name of each
+                        unit that couldn't be deleted to the exception raised (usually APIError)
+
+        Raises:
+            ValueError: concurrency is less than 1
+        """
+        items = ((self._bulk_name(unit), (unit,)) for unit in units)
+
+        return self._run_bulk(self.destroy_unit, items, concurrency)
+
+    def apply(self, desired_units, prune=False, dry_run=False, concurrency=10):
+        """Make the units in the cluster match desired_units, changing only what differs
+
+        The cluster's units are listed and compared with desired_units by their options (see Unit.content_hash())
+        and desiredState.  New units are created, units whose options changed are destroyed and created again,
+        and units whose options match but whose desiredState doesn't have it set; everything else is left alone.
+        Each step runs concurrently, and a unit that can't be changed doesn't stop the others.
+
+            >>> plan = fleet_client.apply(fleet.load_units('/srv/units').units, prune=True)
+            >>> plan
+            <ApplyPlan: 2 create, 1 replace, 3 state, 1 delete, 194 unchanged>
+            >>> plan.errors
+            {}
+
+        Args:
+            desired_units (dict, iterable): name -> Unit, (name, Unit) pairs, or Units with names
+            prune (bool): Destroy units in the cluster that aren't in desired_units. Defaults to False.
+            dry_run (bool): Only work out what would change, don't change anything. Defaults to False.
+            concurrency (int): The most requests to make at once, defaults to 10
+
+        Returns:
+            ApplyPlan: What was changed (or would be, for a dry run), and the results of each step
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400 while listing units
+            ValueError: A desired unit has an invalid desiredState, or concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError('concurrency must be >= 1')
+
+        plan = make_plan(desired_units, self.list_units(), prune=prune)
+
+        if dry_run or not plan:
+            return plan
+
+        return execute_plan(self, plan, concurrency=concurrency)
+
+    def rolling_update(self, units, max_unavailable=1, max_failures=0, timeout=300, poll_interval=2):
+        """Replace units a few at a time, waiting for each to come up before replacing the next
+
+        Each unit is destroyed and created again, then watched until every machine it's on reports the new version
+        active and running.  As each unit comes up, the next one is started, so at most max_unavailable are down at
+        once.  The units in flight are all checked with a single listing of unit states each poll_interval.
+
+            >>> result = fleet_client.rolling_update(fleet.load_units('/srv/units/web').units, max_unavailable=2)
+            >>> result
+            <RolloutResult: 10 succeeded, 0 failed, 0 skipped in 48.21s (24 polls)>
+
+        Args:
+            units (dict, iterable): name -> Unit, (name, Unit) pairs, or Units with names, in the order to replace them
+            max_unavailable (int): The most units to replace at once, defaults to 1
+            max_failures (int): The most units that may fail before no more are started, defaults to 0
+            timeout (float): Seconds each unit has to come up, defaults to 300
+            poll_interval (float): Seconds between checks on the units being replaced, defaults to 2
+
+        Returns:
+            RolloutResult: The units replaced, the errors for those that failed, and those skipped if the update was
+                           aborted
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400 while listing unit states
+            ValueError: max_unavailable is less than 1, or max_failures is negative
+        """
+        return RollingUpdate(
+            self,
+            units,
+            max_unavailable=max_unavailable,
+            max_failures=max_failures,
+            timeout=timeout,
+            poll_interval=poll_interval
+        ).run()
+
     def list_units(self):
         """Return the current list of the Units in the fleet cluster
 
@@ -571,9 +1542,13 @@ class Client(object):
             fleet.v1.errors.APIError: Fleet returned a response code >= 400
 
         """
-        for page in self._request('Units.List'):
-            for unit in page.get('units', []):
+        if self._response_cache is None:
+            for unit in self._list('Units.List', 'units', intern='unit'):
                 yield Unit(client=self, data=unit)
+            return
+
+        for unit in self._cached(('units',), lambda: list(self._list('Units.List', 'units', intern='unit'))):
+            yield Unit(client=self, data=self._copy_unit(unit))
 
     def get_unit(self, name):
         """Retreive a specifi unit from the fleet cluster by name
@@ -588,7 +1563,11 @@ class Client(object):
             fleet.v1.errors.APIError: Fleet returned a response code >= 400
 
         """
-        return Unit(client=self, data=self._single_request('Units.Get', unitName=name))
+        if self._response_cache is None:
+            return Unit(client=self, data=self._single_request('Units.Get', unitName=name))
+
+        data = self._cached(('unit', name), lambda: self._single_request('Units.Get', unitName=name))
+        return Unit(client=self, data=self._copy_unit(data))
 
     def list_unit_states(self, machine_id=None, unit_name=None):
         """Return the current UnitState for the fleet cluster
@@ -607,9 +1586,82 @@ class Client(object):
             fleet.v1.errors.APIError: Fleet returned a response code >= 400
 
         """
-        for page in self._request('UnitState.List', machineID=machine_id, unitName=unit_name):
-            for state in page.get('states', []):
-                yield UnitState(data=state)
+        states = self._list('UnitState.List', 'states', intern='unit_state', machineID=machine_id, unitName=unit_name)
+        for state in states:
+            yield UnitState(data=state)
+
+    def unit_state_table(self, machine_id=None, unit_name=None):
+        """Load the current UnitState for the fleet cluster into a column-oriented table
+
+        Use this instead of list_unit_states() to filter, count, or group large numbers of unit states.
+
+        Args:
+            machine_id (str): filter all UnitState objects to those
+                              originating from a specific machine
+
+            unit_name (str):  filter all UnitState objects to those related
+                              to a specific unit
+
+        Returns:
+            UnitStateTable: Every UnitState in the cluster
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400
+
+        """
+        return UnitStateTable(self._list('UnitState.List', 'states', machineID=machine_id, unitName=unit_name))
+
+    def watch_unit_states(
+        self,
+        callback=None,
+        machine_id=None,
+        unit_name=None,
+        min_interval=1,
+        max_interval=30,
+        initial=True
+    ):
+        """Watch the cluster's unit states, reporting each one that's added, changed, or removed
+
+        Unit states are listed repeatedly and compared by (name, machineID).  Polls start min_interval apart, back
+        off towards max_interval while nothing changes, and return to min_interval as soon as something does.
+
+            >>> for event in fleet_client.watch_unit_states(unit_name='foo.service'):
+            ...     print(event.type, event.machine_id, event.state and event.state.systemdSubState)
+            added 2901a44df0834bef935e24a0ddddcc23 running
+            changed 2901a44df0834bef935e24a0ddddcc23 failed
+
+            >>> watcher = fleet_client.watch_unit_states(callback=print)
+            >>> watcher.stop()
+
+        Args:
+            callback (callable): If given, called with each UnitStateEvent from a background thread, see
+                                 UnitStateWatcher.start()
+            machine_id (str): Only watch unit states on this machine
+            unit_name (str): Only watch unit states for this unit
+            min_interval (float): Seconds between polls while things are changing, defaults to 1
+            max_interval (float): The most seconds between polls while nothing is changing, defaults to 30
+            initial (bool): Report every unit state found by the first poll as added, defaults to True
+
+        Returns:
+            UnitStateWatcher: Iterate over it to receive each UnitStateEvent, or if callback was given, call stop()
+                              on it to stop the background thread
+
+        Raises:
+            ValueError: min_interval is not positive, or is greater than max_interval
+        """
+        watcher = UnitStateWatcher(
+            self,
+            machine_id=machine_id,
+            unit_name=unit_name,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            initial=initial
+        )
+
+        if callback is not None:
+            watcher.start(callback)
+
+        return watcher
 
     def list_machines(self):
         """Retrieve a list of machines in the fleet cluster
@@ -621,8 +1673,11 @@ class Client(object):
             fleet.v1.errors.APIError: Fleet returned a response code >= 400
 
         """
-        # loop through each page of results
-        for page in self._request('Machines.List'):
-            # return each machine in the current page
-            for machine in page.get('machines', []):
+        if self._response_cache is None:
+            for machine in self._list('Machines.List', 'machines', intern='machine'):
                 yield Machine(data=machine)
+            return
+
+        machines = self._cached(('machines',), lambda: list(self._list('Machines.List', 'machines', intern='machine')))
+        for machine in machines:
+            yield Machine(data=self._copy_machine(machine))
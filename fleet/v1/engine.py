@@ -0,0 +1,213 @@
+import json
+
+import googleapiclient.errors
+import httplib2
+
+try:  # pragma: no cover
+    # python 2
+    from urllib import quote, urlencode
+    import urlparse
+except ImportError:  # pragma: no cover
+    # python 3
+    from urllib.parse import quote, urlencode
+    import urllib.parse as urlparse
+
+
+class Route(object):
+    """A precompiled fleet v1 API method
+
+    Attributes:
+        http_method (str): The HTTP method used to call this API method
+        path (list): The path relative to the API's base URL, split into literal strings and parameter names
+        path_params (tuple): The names of the parameters that are substituted into the path
+        query_params (tuple): The names of the parameters that are sent in the query string
+        has_body (bool): True if this method accepts a request body
+
+    """
+
+    def __init__(self, http_method, path, query_params=(), has_body=False):
+        """
+        Args:
+            http_method (str): The HTTP method used to call this API method
+            path (str): The path relative to the API's base URL.  Parameters are specified as {name}
+                        Example: 'units/{unitName}'
+            query_params (tuple): The names of the parameters that are sent in the query string
+            has_body (bool): True if this method accepts a request body
+
+        """
+        self.http_method = http_method
+        self.query_params = tuple(query_params)
+        self.has_body = has_body
+
+        # split 'units/{unitName}' into ['units/', 'unitName'] once, so each request just has to join
+        # literal strings are at even indexes, parameter names at odd indexes
+        self.path = []
+        self.path_params = []
+
+        for (i, token) in enumerate(path.replace('}', '{').split('{')):
+            self.path.append(token)
+            if i % 2:
+                self.path_params.append(token)
+
+        self.path_params = tuple(self.path_params)
+
+        self._allowed = frozenset(self.path_params + self.query_params + (('body',) if has_body else ()))
+
+    def build(self, base_url, kwargs):
+        """Generate the URL and body for a call to this method
+
+        Args:
+            base_url (str): The URL of the API, including a trailing /
+            kwargs (dict): The parameters to the method
+
+        Returns:
+            two item tuple: (url, body)
+
+        Raises:
+            TypeError: A required parameter is missing, or an unknown parameter was provided
+        """
+
+        for name in kwargs:
+            if name not in self._allowed:
+                raise TypeError('Got an unexpected keyword argument "{0}"'.format(name))
+
+        url = [base_url]
+        for (i, token) in enumerate(self.path):
+            if i % 2:
+                try:
+                    url.append(quote(str(kwargs[token]), safe=''))
+                except KeyError:
+                    raise TypeError('Missing required parameter "{0}"'.format(token))
+            else:
+                url.append(token)
+
+        query = [(name, kwargs[name]) for name in self.query_params if kwargs.get(name) is not None]
+        if query:
+            url.append('?')
+            url.append(urlencode(query))
+
+        body = kwargs.get('body')
+        if body is not None:
+            body = json.dumps(body)
+
+        return (''.join(url), body)
+
+
+class RequestEngine(object):
+    """Make requests to the fleet v1 API without the generated googleapiclient bindings
+
+    The fleet v1 API only has a handful of methods, and they don't change, so rather than generating a client
+    from the discovery document, requests are built directly from the routes below and sent through an
+    httplib2.Http (or something that acts like it).
+
+    Responses and errors are the same as those from the generated bindings: a dict decoded from the JSON
+    response, or a googleapiclient.errors.HttpError for any response code >= 300.
+
+    Attributes:
+        ROUTES (dict): Dotted method name -> Route
+        HEADERS (dict): The headers sent with every request
+
+    """
+
+    ROUTES = {
+        'Machines.List': Route('GET', 'machines', ('nextPageToken',)),
+        'Units.List': Route('GET', 'units', ('nextPageToken',)),
+        'Units.Get': Route('GET', 'units/{unitName}'),
+        'Units.Delete': Route('DELETE', 'units/{unitName}'),
+        'Units.Set': Route('PUT', 'units/{unitName}', has_body=True),
+        'UnitState.List': Route('GET', 'state', ('nextPageToken', 'unitName', 'machineID')),
+    }
+
+    HEADERS = {
+        'accept': 'application/json',
+        'content-type': 'application/json',
+        'user-agent': 'python-fleet'
+    }
+
+    def __init__(self, endpoint, api='fleet', version='v1'):
+        """
+        Args:
+            endpoint (str): The URL where the fleet API can be reached, without a trailing slash
+            api (str): The name of the API, defaults to 'fleet'
+            version (str): The version of the API, defaults to 'v1'
+
+        """
+        self.base_url = '{0}/{1}/{2}/'.format(endpoint, api, version)
+
+    def request(self, http, method, **kwargs):
+        """Make a single request to the fleet API
+
+        Args:
+            http (httplib2.Http): The http object to make the request with
+            method (str): A dot delimited string indicating the method to call.  Example: 'Machines.List'
+            **kwargs: The parameters to the method
+
+        Returns:
+            dict: The response from the method called.
+
+        Raises:
+            AttributeError: ``method`` is not a fleet v1 API method
+            TypeError: A required parameter is missing, or an unknown parameter was provided
+            googleapiclient.errors.HttpError: Fleet returned a response code >= 300
+        """
+
+        try:
+            route = self.ROUTES[method]
+        except KeyError:
+            raise AttributeError('{0} is not a fleet v1 API method'.format(method))
+
+        (url, body) = route.build(self.base_url, kwargs)
+
+        response, content = http.request(url, route.http_method, body=body, headers=dict(self.HEADERS))
+
+        if response.status >= 300:
+            raise googleapiclient.errors.HttpError(response, content, uri=url)
+
+        if response.status == 204 or not content:
+            return {}
+
+        if isinstance(content, bytes):
+            content = content.decode('utf-8')
+
+        return json.loads(content)
+
+    def open(self, connect, method, **kwargs):
+        """Send a request to the fleet API, returning the response without reading it's body
+
+        Args:
+            connect (callable): Called with the request's URL, returns an unconnected httplib.HTTPConnection
+            method (str): A dot delimited string indicating the method to call.  Example: 'Machines.List'
+            **kwargs: The parameters to the method
+
+        Returns:
+            two item tuple: (connection, response).  The caller must close the connection once it's
+            done with the response.
+
+        Raises:
+            AttributeError: ``method`` is not a fleet v1 API method
+            TypeError: A required parameter is missing, or an unknown parameter was provided
+            googleapiclient.errors.HttpError: Fleet returned a response code >= 300
+        """
+
+        try:
+            route = self.ROUTES[method]
+        except KeyError:
+            raise AttributeError('{0} is not a fleet v1 API method'.format(method))
+
+        (url, body) = route.build(self.base_url, kwargs)
+
+        parsed = urlparse.urlsplit(url)
+        path = urlparse.urlunsplit(('', '', parsed.path, parsed.query, ''))
+
+        conn = connect(url)
+        try:
+            conn.request(route.http_method, path, body=body, headers=self.HEADERS)
+            response = conn.getresponse()
+
+            if response.status >= 300:
+                raise googleapiclient.errors.HttpError(httplib2.Response(response), response.read(), uri=url)
+        except Exception:
+            conn.close()
+            raise
+
+        return (conn, response)
@@ -39,3 +39,57 @@ class APIError(Exception):
             self.message
 
         )
+
+
+class UnitFileError(ValueError):
+    """Represents one or more problems parsing a unit file
+
+    This is a ValueError, as parsing errors have always been reported as ValueError.
+
+    Attributes:
+        errors (list): (line number, message) for each problem found, in the order they were found
+    """
+    def __init__(self, errors):
+        """
+        Args:
+            errors (list): (line number, message) for each problem found
+        """
+        self.errors = list(errors)
+
+        # pass errors through so we can be pickled, and so rebuilt in, other processes
+        super(UnitFileError, self).__init__(self.errors)
+
+    def __str__(self):
+        # Return a string like 'Unable to parse unit file; Malformed line in section Service: foo (line: 3)'
+        messages = ['{0} (line: {1})'.format(message, line_number) for (line_number, message) in self.errors]
+
+        if len(messages) == 1:
+            return 'Unable to parse unit file; {0}'.format(messages[0])
+
+        return 'Unable to parse unit file; {0} errors: {1}'.format(len(messages), '; '.join(messages))
+
+
+class RolloutError(Exception):
+    """Represents a unit that didn't become healthy during a rolling update
+
+    Attributes:
+        name (str): The name of the unit
+        reason (str): Why the unit is considered unhealthy
+        states (list): The UnitStates last seen for the unit, if any
+    """
+    def __init__(self, name, reason, states=None):
+        """
+        Args:
+            name (str): The name of the unit
+            reason (str): Why the unit is considered unhealthy
+            states (list, optional): The UnitStates last seen for the unit
+        """
+        self.name = name
+        self.reason = reason
+        self.states = list(states or [])
+
+        super(RolloutError, self).__init__(name, reason)
+
+    def __str__(self):
+        # Return a string like 'foo.service: timed out after 300s'
+        return '{0}: {1}'.format(self.name, self.reason)
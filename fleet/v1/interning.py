@@ -0,0 +1,122 @@
+try:  # pragma: no cover
+    # python 2
+    string_types = basestring
+except NameError:  # pragma: no cover
+    # python 3
+    string_types = str
+
+
+class Interner(object):
+    """Share a single copy of each string among the objects decoded from fleet's responses
+
+    Every string the JSON decoder returns is a new object, even if an identical string has been decoded a thousand
+    times before.  In a large cluster most of the values in a listing are repeats: each unit's desiredState and
+    currentState, the machine IDs units are scheduled to, systemd states, and the section and name of every unit
+    option.  The interner replaces each of these with the first copy it saw, so a full listing of a cluster holds
+    one copy of each distinct value rather than one per object.
+
+    Only fields known to have few distinct values are interned; unit names, hashes, and option values are left
+    alone, as interning them would mostly add entries to our table.
+
+        >>> interner = Interner()
+        >>> a = interner.unit_state({'machineID': ''.join(['ab', 'c'])})
+        >>> b = interner.unit_state({'machineID': ''.join(['a', 'bc'])})
+        >>> a['machineID'] is b['machineID']
+        True
+
+    Attributes:
+        max_size (int): The most strings to keep, once reached new strings are no longer interned
+
+    """
+
+    UNIT_FIELDS = ('desiredState', 'currentState', 'machineID')
+    UNIT_OPTION_FIELDS = ('section', 'name')
+    UNIT_STATE_FIELDS = ('machineID', 'systemdLoadState', 'systemdActiveState', 'systemdSubState')
+    MACHINE_FIELDS = ('id',)
+
+    def __init__(self, max_size=65536):
+        """
+        Args:
+            max_size (int): The most strings to keep, defaults to 65536
+
+        """
+        self.max_size = max_size
+        self._strings = {}
+
+    def __len__(self):
+        return len(self._strings)
+
+    def intern(self, value):
+        """Return the shared copy of value
+
+        Args:
+            value: The value to intern, anything other than a string is returned unchanged
+
+        Returns:
+            The first string equal to value we were given, or value itself
+        """
+        if not isinstance(value, string_types):
+            return value
+
+        try:
+            return self._strings[value]
+        except KeyError:
+            if len(self._strings) >= self.max_size:
+                return value
+
+            # setdefault so two threads interning the same new string agree on which copy wins
+            return self._strings.setdefault(value, value)
+
+    def _fields(self, data, fields):
+        """Intern fields of data in place"""
+        for field in fields:
+            if field in data:
+                data[field] = self.intern(data[field])
+
+        return data
+
+    def unit(self, data):
+        """Intern the repetitive fields of a unit, and of each of it's options, in place
+
+        Args:
+            data (dict): A unit, as returned by fleet
+
+        Returns:
+            dict: data
+        """
+        self._fields(data, self.UNIT_FIELDS)
+
+        for option in data.get('options') or []:
+            self._fields(option, self.UNIT_OPTION_FIELDS)
+
+        return data
+
+    def unit_state(self, data):
+        """Intern the repetitive fields of a unit state in place
+
+        Args:
+            data (dict): A unit state, as returned by fleet
+
+        Returns:
+            dict: data
+        """
+        return self._fields(data, self.UNIT_STATE_FIELDS)
+
+    def machine(self, data):
+        """Intern a machine's ID, and the keys and values of it's metadata, in place
+
+        Machine IDs are interned so they are shared with the machineID of units and unit states.
+
+        Args:
+            data (dict): A machine, as returned by fleet
+
+        Returns:
+            dict: data
+        """
+        self._fields(data, self.MACHINE_FIELDS)
+
+        metadata = data.get('metadata')
+        if metadata:
+            data['metadata'] = dict((self.intern(k), self.intern(v)) for (k, v) in metadata.items())
+
+        return data
@@ -0,0 +1,128 @@
+import collections, fnmatch, glob, multiprocessing, os  # NOQA
+import multiprocessing.pool
+
+from fleet.v1.objects import Unit, parse_unit_file
+
+# the unit types fleet can schedule, and template units
+UNIT_PATTERNS = ('*.service', '*.socket', '*.timer', '*.path', '*.mount', '*.automount', '*.device', '*.target')
+
+LoadResult = collections.namedtuple('LoadResult', ['units', 'errors'])
+LoadResult.__doc__ = """The result of load_units()
+
+Attributes:
+    units (dict): unit name -> Unit, for each file that was loaded
+    errors (dict): path -> exception, for each file that could not be loaded
+"""
+
+
+def _parse(path):
+    """Parse the unit file at path
+
+    This runs in the worker pool, possibly in another process, so it returns plain data rather than a Unit.
+
+    Returns:
+        tuple: (path, options, None) if the file was parsed, or (path, None, exception) if it wasn't
+    """
+    try:
+        with open(path, 'r') as fh:
+            return (path, parse_unit_file(fh), None)
+    except (IOError, OSError, ValueError) as exc:
+        return (path, None, exc)
+
+
+def find_unit_files(path_or_glob, patterns=UNIT_PATTERNS):
+    """Return the paths to the unit files in a directory tree, or matching a glob
+
+    Args:
+        path_or_glob (str): A directory, which is searched recursively for files matching ``patterns``;
+                            a single file; or a glob, every file matching which is returned
+        patterns (tuple): Patterns for the names of unit files in directories, defaults to ``UNIT_PATTERNS``
+
+    Returns:
+        list: The paths, sorted
+    """
+    path_or_glob = os.path.expanduser(path_or_glob)
+
+    if os.path.isdir(path_or_glob):
+        paths = []
+        for (dirpath, _, filenames) in os.walk(path_or_glob):
+            for filename in filenames:
+                if any(fnmatch.fnmatch(filename, pattern) for pattern in patterns):
+                    paths.append(os.path.join(dirpath, filename))
+    elif os.path.isfile(path_or_glob):
+        paths = [path_or_glob]
+    else:
+        paths = [path for path in glob.glob(path_or_glob) if os.path.isfile(path)]
+
+    return sorted(paths)
+
+
+def load_units(path_or_glob, workers=None, processes=False, desired_state=None):
+    """Load many unit files at once, in parallel
+
+    Each file is parsed as Unit(from_file=...) would, in a pool of worker threads or processes.  A file that
+    can't be read or parsed doesn't stop the others from loading; it's error is returned instead.
+
+        >>> result = load_units('/srv/units', workers=8, processes=True)
+        >>> result.units['foo@.service']
+        <Unit: {...}>
+        >>> result.errors
+        {'/srv/units/broken.service': UnitFileError(...)}
+
+    Units are named after their file.  If several files have the same name, the first (sorted by path) is loaded
+    and the others are reported as errors.
+
+    Args:
+        path_or_glob (str): A directory to search recursively for unit files, a single unit file, or a glob
+        workers (int): The number of threads or processes to parse files in, defaults to the number of CPUs.
+                       1 parses files on the calling thread.
+        processes (bool): Parse in a pool of processes rather than threads.  Parsing is CPU bound, so this is
+                          faster for large numbers of files where the cost of starting processes is worth it.
+                          Defaults to False.
+        desired_state (str): The desired state of the units, defaults to 'launched'
+
+    Returns:
+        LoadResult: ``units``, a dict of unit name -> Unit, and ``errors``, a dict of path -> exception
+
+    Raises:
+        ValueError: workers is less than 1
+    """
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+
+    if workers < 1:
+        raise ValueError('workers must be >= 1')
+
+    paths = find_unit_files(path_or_glob)
+
+    if workers == 1 or len(paths) <= 1:
+        results = [_parse(path) for path in paths]
+    else:
+        pool_class = multiprocessing.Pool if processes else multiprocessing.pool.ThreadPool
+        pool = pool_class(min(workers, len(paths)))
+        try:
+            # hand out files in batches, so workers aren't waiting on us after every file
+            results = pool.map(_parse, paths, chunksize=max(1, len(paths) // (workers * 4)))
+        finally:
+            pool.close()
+            pool.join()
+
+    units = {}
+    errors = {}
+    loaded_from = {}
+
+    for (path, options, error) in results:
+        if error is not None:
+            errors[path] = error
+            continue
+
+        name = os.path.basename(path)
+        if name in units:
+            errors[path] = ValueError('Duplicate unit name {0}, already loaded from {1}'.format(
+                name, loaded_from[name]))
+            continue
+
+        units[name] = Unit(desired_state=desired_state, options=options)
+        loaded_from[name] = path
+
+    return LoadResult(units, errors)
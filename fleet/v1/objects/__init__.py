@@ -1,4 +1,6 @@
-from .fleet_object import FleetObject  # NOQA
+from .fleet_object import FleetObject, CompactFleetObject  # NOQA
 from .machine import Machine  # NOQA
 from .unit import Unit  # NOQA
 from .unit_state import UnitState  # NOQA
+from .unit_state_table import UnitStateTable  # NOQA
+from .unit_file import parse_unit_file, serialize_unit_file, unit_hash  # NOQA
@@ -74,3 +74,98 @@ class FleetObject(object):
     def as_dict(self):
         """Return the internal data structure backing this object"""
         return dict(self._data)
+
+
+class CompactFleetObject(FleetObject):
+    """A FleetObject that stores the fields it expects in __slots__ instead of a dict
+
+    Objects that fleet returns in large numbers (UnitState, Machine) have a fixed set of fields.  Storing them
+    in slots takes much less memory than a dict per object, which adds up when listing tens of thousands of them.
+    Any fields fleet returns that aren't in ``_FIELDS`` are kept in a dict, so nothing is lost.
+
+    Access is the same as FleetObject: by attribute, by key, and via as_dict().  ``_data`` is built on demand.
+
+    Subclasses must set ``_FIELDS``, and ``__slots__`` to the same value.
+
+    FleetObject doesn't use __slots__ (so _update() can set any attribute on it, as it always could), which means
+    instances still have a ``__dict__`` slot.  It stays empty, as nothing is stored in it, but costs a pointer or
+    two per object over a class that only uses __slots__.
+    """
+
+    __slots__ = ('_client', '_extra')
+
+    _FIELDS = ()
+
+    @property
+    def _data(self):
+        """A dict of our fields, built on demand"""
+        data = {}
+
+        for field in self._FIELDS:
+            try:
+                data[field] = object.__getattribute__(self, field)
+            except AttributeError:
+                pass
+
+        if self._extra:
+            data.update(self._extra)
+
+        return data
+
+    @_data.setter
+    def _data(self, data):
+        """Unpack a dict into our fields"""
+        setattr_ = object.__setattr__
+
+        # if we've been set before, clear out the old values
+        try:
+            object.__getattribute__(self, '_extra')
+        except AttributeError:
+            pass
+        else:
+            for field in self._FIELDS:
+                try:
+                    object.__delattr__(self, field)
+                except AttributeError:
+                    pass
+
+        found = 0
+        for field in self._FIELDS:
+            if field in data:
+                setattr_(self, field, data[field])
+                found += 1
+
+        extra = None
+        if found < len(data):
+            extra = dict((name, value) for (name, value) in data.items() if name not in self._FIELDS)
+
+        setattr_(self, '_extra', extra)
+
+    def __contains__(self, name):
+        if name in self._FIELDS:
+            try:
+                object.__getattribute__(self, name)
+                return True
+            except AttributeError:
+                return False
+
+        return bool(self._extra) and name in self._extra
+
+    def __getitem__(self, name):
+        if name in self._FIELDS:
+            try:
+                return object.__getattribute__(self, name)
+            except AttributeError:
+                raise KeyError(name)
+
+        return self.__getattr__(name)
+
+    def __getattr__(self, name):
+        # only called for fields we don't have a value for, and for fields that aren't in _FIELDS
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        if self._extra is None:
+            raise KeyError(name)
+
+        return self._extra[name]
@@ -1,7 +1,7 @@
-from .fleet_object import FleetObject
+from .fleet_object import CompactFleetObject
 
 
-class Machine(FleetObject):
+class Machine(CompactFleetObject):
     """A Machine represents a host in the cluster. It uses the host's machine-id as a unique identifier.
 
     Attribues:
@@ -10,10 +10,12 @@ class Machine(FleetObject):
         metadata: dictionary of key-value data published by the machine
     """
 
+    _FIELDS = __slots__ = ('id', 'primaryIP', 'metadata')
+
     def __init__(self, client=None, data=None):
+        super(Machine, self).__init__(client=client, data=data)
+
         # fleet api doesn't return a key for metadata if there is none
         # we want to retun an empty dict in those cases for consistency
-        if 'metadata' not in data:
-            data['metadata'] = {}
-
-        super(Machine, self).__init__(client=client, data=data)
+        if 'metadata' not in self:
+            self._update('metadata', {})
@@ -1,4 +1,7 @@
+import io
+
 from .fleet_object import FleetObject
+from .unit_file import group_by_section, parse_unit_file, unit_hash
 
 try:  # pragma: no cover
     # python 2
@@ -17,7 +20,8 @@ class Unit(FleetObject):
 
     Attributes (all are readonly):
         Always available:
-            options (update with add_option, remove_option): list of UnitOption entities
+            options (update with add_option, remove_option, look up with get_option_values, has_option):
+                list of UnitOption entities
             desiredState: (update with set_desired_state): state the user wishes the Unit to be in
                           ("inactive", "loaded", or "launched")
 
@@ -92,12 +96,22 @@ class Unit(FleetObject):
                 'options': options
             }
 
+        # (options, {(section, name): [option, ...]}), see _options_by_key()
+        self._update('_option_index', None)
+
+        # (options, text), see __str__()
+        self._update('_rendered', None)
+
+        # True if we were written to fleet without reading back the result, see _defer_fetch()
+        self._update('_fetch_pending', False)
+
         # Call the parent class to configure us
         super(Unit, self).__init__(client=client, data=data)
 
         # If they asked us to load from a file, attemp to slurp it up
         if from_file:
-            with open(from_file, 'r') as fh:
+            # systemd reads unit files as UTF-8, whatever the locale; UnitFileCache reads them the same way
+            with io.open(from_file, 'r', encoding='utf-8') as fh:
                 self._set_options_from_file(fh)
 
         # If they asked us to load from a string, lie to the loader with StringIO
@@ -110,116 +124,119 @@ class Unit(FleetObject):
             self.as_dict()
         )
 
+    def __contains__(self, name):
+        if name not in self._data and self._fetch_pending:
+            self._fetch()
+
+        return name in self._data
+
+    def __getattr__(self, name):
+        try:
+            return self._data[name]
+        except KeyError:
+            if not self._fetch_pending or name.startswith('_'):
+                raise
+
+        self._fetch()
+        return self._data[name]
+
+    def _defer_fetch(self):
+        """Mark this unit as only partially known
+
+        Used by the client when it writes a unit without reading it back.  The first time a field we don't have
+        (such as currentState or machineID) is accessed, the unit is fetched from fleet.
+        """
+        self._update('_fetch_pending', True)
+
+    def _fetch(self):
+        """Replace our data with the unit as fleet has it
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400
+        """
+        self._update('_fetch_pending', False)
+        self._update('_data', self._client.get_unit(self._data['name'])._data)
+
     def __str__(self):
-        """Generate a Unit file representation of this object"""
+        """Generate a Unit file representation of this object
+
+        Sections appear in the order they first appear in options, so the same options always render the same way.
+        The text is cached until options are changed with add_option or remove_option, or replaced.  Changes made
+        to the options list in place, rather than with those methods, aren't seen by the cache.
+        """
+        text = self._cached_text()
+        if text is not None:
+            return text
 
-        # build our output here
-        output = []
+        text = u"\n".join(self._render_lines())
+        self._update('_rendered', (self.options, text))
 
-        # get a ist of sections
-        sections = set([x['section'] for x in self._data['options']])
+        return text
 
-        for section in sections:
-            # for each section, add it to our output
-            output.append(u'[{0}]'.format(section))
+    def _cached_text(self):
+        """Return the text cached by __str__(), or None if there isn't any for our current options"""
+        cached = self._rendered
+        if cached is not None and cached[0] is self.options:
+            return cached[1]
 
-            # iterate through the list of options, adding all items to this section
-            for option in self._data['options']:
-                if option['section'] == section:
-                    output.append(u'{0}={1}'.format(option['name'], option['value']))
+        return None
 
-        # join and return the output
-        return u"\n".join(output)
+    def _render_lines(self):
+        """Yield each line of the unit file for our options
+
+        Options are grouped by section in a single pass, sections in the order they are first seen.
+        """
+        for (section, options) in group_by_section(self.options):
+            yield u'[{0}]'.format(section)
+
+            for option in options:
+                yield u'{0}={1}'.format(option['name'], option['value'])
+
+    def write(self, file_handle):
+        """Write the unit file representation of this object to a file
+
+        Lines are written as they are generated, rather than building the whole unit file in memory first.
+        The output is the same as str(unit).
+
+        Args:
+            file_handle (file): a file-like object (supporting write()) opened in text mode
+
+        Returns:
+            True: The unit was written
+        """
+        text = self._cached_text()
+        if text is not None:
+            file_handle.write(text)
+            return True
+
+        for (i, line) in enumerate(self._render_lines()):
+            if i:
+                file_handle.write(u"\n")
+            file_handle.write(line)
+
+        return True
 
     def _set_options_from_file(self, file_handle):
         """Parses a unit file and updates self._data['options']
 
         Args:
-            file_handle (file): a file-like object (supporting read()) containing a unit
+            file_handle (file): a file-like object containing a unit, that yields lines when iterated
 
         Returns:
             True: The file was successfuly parsed and options were updated
 
         Raises:
             IOError: from_file was specified and it does not exist
-            ValueError: The unit contents specified in from_string or from_file is not valid
+            fleet.v1.errors.UnitFileError: The unit contents specified in from_string or from_file is not valid.
+                                           This is a ValueError.
         """
 
-        # TODO: Find a library to handle this unit file parsing
-        # Can't use configparser, it doesn't handle multiple entries for the same key in the same section
-        # This is terribly naive
-
-        # build our output here
-        options = []
-
-        # keep track of line numbers to report when parsing problems happen
-        line_number = 0
-
-        # the section we are currently in
-        section = None
-        for line in file_handle.read().splitlines():
-            line_number += 1
-
-            # clear any extra white space
-            orig_line = line
-            line = line.strip()
-
-            # ignore comments, and blank lines
-            if not line or line.startswith('#'):
-                continue
-
-            # is this a section header?  If so, update our variable and continue
-            # Section headers look like: [Section]
-            if line.startswith('[') and line.endswith(']'):
-                section = line.strip('[]')
-                continue
-
-            # We encountered a non blank line outside of a section, this is a problem
-            if not section:
-                raise ValueError(
-                    'Unable to parse unit file; '
-                    'Unexpected line outside of a section: {0} (line: {1}'.format(
-                        line,
-                        line_number
-                    ))
-
-            # Attempt to parse a line inside a section
-            # Lines should look like: name=value \
-            # continuation
-            continuation = False
-            try:
-                    # if the previous value ends with \ then we are a continuation
-                    # so remove the \, and set the flag so we'll append to this below
-                    if options[-1]['value'].endswith('\\'):
-                        options[-1]['value'] = options[-1]['value'][:-1]
-                        continuation = True
-            except IndexError:
-                    pass
-
-            try:
-                # if we are a continuation, then just append our value to the previous line
-                if continuation:
-                    options[-1]['value'] += orig_line
-                    continue
-
-                # else we are a normal line, so spit and get our name / value
-                name, value = line.split('=', 1)
-                options.append({
-                    'section': section,
-                    'name': name,
-                    'value': value
-                })
-            except ValueError:
-                raise ValueError(
-                    'Unable to parse unit file; '
-                    'Malformed line in section {0}: {1} (line: {2})'.format(
-                        section,
-                        line,
-                        line_number
-                    ))
+        options = parse_unit_file(file_handle)
 
         # update our internal structure
         self._data['options'] = options
+        self._update('_option_index', None)
+        self._update('_rendered', None)
 
         return True
 
@@ -238,6 +255,66 @@ class Unit(FleetObject):
 
         return False
 
+    def _options_by_key(self):
+        """Return our options indexed by section and name
+
+        The index is built on first use and kept up to date by add_option and remove_option.  If our options
+        have been replaced it is rebuilt.  Changes made to the options list in place, rather than with those
+        methods, aren't seen by the index.
+
+        Returns:
+            dict: (section, name) -> list of options with that section and name, in the order they appear
+        """
+        options = (self.options if 'options' in self else None) or []
+
+        cached = self._option_index
+        if cached is not None and cached[0] is options:
+            return cached[1]
+
+        index = {}
+        for option in options:
+            try:
+                index[(option['section'], option['name'])].append(option)
+            except KeyError:
+                index[(option['section'], option['name'])] = [option]
+
+        self._update('_option_index', (options, index))
+
+        return index
+
+    def get_option_values(self, section, name):
+        """Return the values of an option, in the order they appear in the unit
+
+        Args:
+            section (str): The section the option is in
+            name (str): The name of the option
+
+        Returns:
+            list: The value of each option with ``name`` in ``section``, empty if there are none
+
+        """
+        return [option['value'] for option in self._options_by_key().get((section, name), [])]
+
+    def has_option(self, section, name, value=None):
+        """Check if the unit has an option
+
+        Args:
+            section (str): The section the option is in
+            name (str): The name of the option
+            value (str, optional): If specified, the option must also have this value
+
+        Returns:
+            True: The unit has the option
+            False: It does not
+
+        """
+        options = self._options_by_key().get((section, name), [])
+
+        if value is None:
+            return len(options) > 0
+
+        return any(option['value'] == value for option in options)
+
     def add_option(self, section, name, value):
         """Add an option to a section of the unit file
 
@@ -261,8 +338,14 @@ class Unit(FleetObject):
             'value': value
         }
 
+        index = self._options_by_key()
+
         self._data['options'].append(option)
 
+        index.setdefault((section, name), []).append(option)
+        self._update('_option_index', (self._data['options'], index))
+        self._update('_rendered', None)
+
         return True
 
     def remove_option(self, section, name, value=None):
@@ -283,23 +366,49 @@ class Unit(FleetObject):
         if self._is_live():
             raise RuntimeError('Submitted units cannot update their options')
 
-        removed = 0
-        # iterate through a copy of the options
-        for option in list(self._data['options']):
-            # if it's in our section
-            if option['section'] == section:
-                # and it matches our name
-                if option['name'] == name:
-                    # and they didn't give us a value, or it macthes
-                    if value is None or option['value'] == value:
-                        # nuke it from the source
-                        self._data['options'].remove(option)
-                        removed += 1
-
-        if removed > 0:
-            return True
+        index = self._options_by_key()
+        key = (section, name)
 
-        return False
+        # find the options to remove from the index, so we don't need to search for them
+        matches = index.get(key, [])
+        if value is None:
+            (removed, kept) = (matches, [])
+        else:
+            removed = [option for option in matches if option['value'] == value]
+            kept = [option for option in matches if option['value'] != value]
+
+        if not removed:
+            return False
+
+        # then drop them from the options in a single pass, in place so anyone holding the list sees the change
+        removed_ids = set(id(option) for option in removed)
+        options = self._data['options']
+        options[:] = [option for option in options if id(option) not in removed_ids]
+
+        if kept:
+            index[key] = kept
+        else:
+            del index[key]
+
+        self._update('_option_index', (options, index))
+        self._update('_rendered', None)
+
+        return True
+
+    def content_hash(self):
+        """Return the hash fleet computes for this unit's options
+
+        This is the value fleet reports as UnitState.hash once the unit is running, so comparing the two tells you
+        if the unit in the cluster already has these options.
+
+            >>> states = dict((x.name, x.hash) for x in fleet_client.list_unit_states())
+            >>> if states.get('foo.service') != unit.content_hash():
+            ...     fleet_client.create_unit('foo.service', unit)
+
+        Returns:
+            str: The SHA1 of the unit file, as 40 hex digits
+        """
+        return unit_hash((self.options if 'options' in self else None) or [])
 
     def destroy(self):
         """Remove a unit from the fleet cluster
@@ -344,7 +453,10 @@ class Unit(FleetObject):
         # and we have a handle to an active client
         # Then update our selves on the server
         if self._is_live():
-            self._update('_data', self._client.set_unit_desired_state(self.name, self.desiredState))
+            updated = self._client.set_unit_desired_state(self, state)
+
+            self._update('_data', updated._data)
+            self._update('_fetch_pending', updated._fetch_pending)
 
         # Return the state
         return self._data['desiredState']
@@ -0,0 +1,164 @@
+import hashlib
+
+from ..errors import UnitFileError
+
+# lines starting with these are comments
+_COMMENTS = '#;'
+
+
+def parse_unit_file(file_handle, collect_errors=False):
+    """Parse a systemd unit file into a list of options
+
+    The file is read a line at a time, so it never needs to be held in memory in full.
+
+    Parsing follows systemd's rules:
+        * Blank lines, and lines starting with ``#`` or ``;`` are ignored
+        * ``[Section]`` starts a section, every option must be in one
+        * Options are ``Name=Value``, whitespace around the name and value is ignored
+        * A value ending in ``\\`` continues on the next line; the backslash is removed and the next line
+          (including it's leading whitespace) is appended.  Comment lines within a continuation are skipped, and a
+          blank line or a section header ends it
+
+        >>> parse_unit_file(open('foo.service'))
+        [{'section': 'Service', 'name': 'ExecStart', 'value': '/usr/bin/sleep 1d'}]
+
+    Args:
+        file_handle (file): a file-like object that yields lines when iterated
+        collect_errors (bool): If True, parse the entire file and report every problem found, rather than stopping
+                               at the first one. Defaults to False.
+
+    Returns:
+        list: A dict with the keys section, name, and value for each option, in the order they appear
+
+    Raises:
+        fleet.v1.errors.UnitFileError: The unit file is not valid.  This is a ValueError.
+    """
+
+    options = []
+    errors = []
+
+    # the section we are currently in
+    section = None
+
+    # the option whose value is being continued onto the next line, if any
+    continuing = None
+
+    for (line_number, raw) in enumerate(file_handle, 1):
+        line = raw.strip()
+
+        if not line or (line[0] == '[' and line[-1] == ']'):
+            # blank lines and section headers end a continued value, as they do for systemd
+            if continuing is not None:
+                continuing['value'] = continuing['value'].rstrip()
+                continuing = None
+
+            # Section headers look like: [Section]
+            if line:
+                section = line[1:-1]
+            continue
+
+        if line[0] in _COMMENTS:
+            continue
+
+        if continuing is not None:
+            # keep the line's leading whitespace, but not it's line ending
+            value = raw.rstrip()
+            if value[-1] == '\\':
+                continuing['value'] += value[:-1]
+            else:
+                continuing['value'] += value
+                continuing = None
+            continue
+
+        (name, equals, value) = line.partition('=')
+        name = name.rstrip()
+
+        if section is None:
+            errors.append((line_number, 'Unexpected line outside of a section: {0}'.format(line)))
+        elif not equals or not name:
+            errors.append((line_number, 'Malformed line in section {0}: {1}'.format(section, line)))
+        else:
+            value = value.lstrip()
+
+            if value and value[-1] == '\\':
+                continuing = {'section': section, 'name': name, 'value': value[:-1]}
+                options.append(continuing)
+            else:
+                options.append({'section': section, 'name': name, 'value': value})
+
+            continue
+
+        if not collect_errors:
+            break
+
+    if continuing is not None:
+        continuing['value'] = continuing['value'].rstrip()
+
+    if errors:
+        raise UnitFileError(errors)
+
+    return options
+
+
+def group_by_section(options):
+    """Group options by section in a single pass, sections in the order they first appear
+
+    Args:
+        options (list): A dict with the keys section, name, and value for each option
+
+    Returns:
+        list: (section, options in that section in the order they appear) for each section
+    """
+    sections = {}
+    seen = []
+    for option in options:
+        try:
+            sections[option['section']].append(option)
+        except KeyError:
+            sections[option['section']] = [option]
+            seen.append(option['section'])
+
+    return [(section, sections[section]) for section in seen]
+
+
+def serialize_unit_file(options):
+    """Return the unit file for a list of options, exactly as fleet writes it
+
+    This matches go-systemd's unit.Serialize, which fleet uses: options are grouped by section, sections in
+    the order they first appear, with a blank line between sections and a newline after every option.
+
+        >>> serialize_unit_file([{'section': 'Service', 'name': 'ExecStart', 'value': '/bin/sleep 100'}])
+        '[Service]\\nExecStart=/bin/sleep 100\\n'
+
+    Args:
+        options (list): A dict with the keys section, name, and value for each option
+
+    Returns:
+        str: The unit file
+    """
+    output = []
+    for (section, section_options) in group_by_section(options):
+        if output:
+            output.append(u'\n')
+
+        output.append(u'[{0}]\n'.format(section))
+
+        for option in section_options:
+            output.append(u'{0}={1}\n'.format(option['name'], option['value']))
+
+    return u''.join(output)
+
+
+def unit_hash(options):
+    """Return the hash fleet computes for a unit with these options
+
+    This is the value of UnitState.hash for the unit, so it can be used to tell if a unit in the cluster has
+    the same contents as a local one without fetching it.
+
+    Args:
+        options (list): A dict with the keys section, name, and value for each option
+
+    Returns:
+        str: The SHA1 of the unit file, as 40 hex digits
+    """
+    return hashlib.sha1(serialize_unit_file(options).encode('utf-8')).hexdigest()
@@ -1,7 +1,7 @@
-from .fleet_object import FleetObject
+from .fleet_object import CompactFleetObject
 
 
-class UnitState(FleetObject):
+class UnitState(CompactFleetObject):
     """Whereas Unit entities represent the desired state of units known by fleet,
     UnitStates represent the current states of units actually running in the cluster.
 
@@ -17,4 +17,5 @@ class UnitState(FleetObject):
         systemdActiveState: active state as reported by systemd
         systemdSubState: sub state as reported by systemd
     """
-    pass
+
+    _FIELDS = __slots__ = ('name', 'hash', 'machineID', 'systemdLoadState', 'systemdActiveState', 'systemdSubState')
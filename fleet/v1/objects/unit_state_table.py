@@ -0,0 +1,246 @@
+from array import array
+from itertools import chain
+
+from .unit_state import UnitState
+
+
+class UnitStateTable(object):
+    """A column-oriented table of UnitStates, for filtering and counting large numbers of them quickly
+
+    Each field is stored as an array of integer codes, one per row, and a list of the distinct values the codes
+    refer to.  Unit states have very few distinct values per field (a handful of systemd states, one machine ID
+    per machine), so filtering and counting work on small integers rather than on a Python object per state.
+
+    The first time a table is filtered on a field, an index of the rows holding each value of that field is built,
+    so filters only touch the rows they match.
+
+        >>> table = fleet_client.unit_state_table()
+        >>> table.filter(systemdSubState='failed').count('machineID')
+        {'2901a44df0834bef935e24a0ddddcc23': 3, 'b4104f4b83fd48b2acc16a085b0ec2ce': 1}
+
+    Only the fields in ``FIELDS`` are stored.
+
+    """
+
+    FIELDS = UnitState._FIELDS
+
+    def __init__(self, states=None):
+        """
+        Args:
+            states (iterable, optional): dicts (as returned by fleet) or UnitStates to load into the table
+
+        """
+
+        # field -> array of codes, one per row
+        self._codes = dict((field, array('I')) for field in self.FIELDS)
+
+        # field -> list of distinct values, indexed by code
+        self._values = dict((field, []) for field in self.FIELDS)
+
+        # field -> {value: code}
+        self._index = dict((field, {}) for field in self.FIELDS)
+
+        # field -> {code: array of rows with that code}, built on demand by _postings()
+        self._row_index = {}
+
+        if states is not None:
+            self.extend(states)
+
+    def __len__(self):
+        return len(self._codes[self.FIELDS[0]])
+
+    def __iter__(self):
+        """Yield each row as a UnitState"""
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, i):
+        """Return a row as a UnitState
+
+        Args:
+            i (int): The row number
+
+        Returns:
+            UnitState: The row
+        """
+        return UnitState(data=self._row(i))
+
+    def __repr__(self):
+        return '<{0}: {1} rows>'.format(self.__class__.__name__, len(self))
+
+    def _code(self, field, value):
+        """Return the code for value in field, adding it if it's new"""
+        index = self._index[field]
+
+        try:
+            return index[value]
+        except KeyError:
+            code = index[value] = len(self._values[field])
+            self._values[field].append(value)
+            return code
+
+    def _row(self, i):
+        """Return row i as a dict, leaving out fields that weren't in the original state"""
+        row = {}
+        for field in self.FIELDS:
+            value = self._values[field][self._codes[field][i]]
+            if value is not None:
+                row[field] = value
+
+        return row
+
+    def append(self, state):
+        """Add a row to the table
+
+        Args:
+            state (dict or UnitState): The state to add
+        """
+        for field in self.FIELDS:
+            try:
+                value = state[field]
+            except KeyError:
+                value = None
+
+            self._codes[field].append(self._code(field, value))
+
+        self._row_index = {}
+
+    def extend(self, states):
+        """Add many rows to the table
+
+        Args:
+            states (iterable): dicts or UnitStates to add
+        """
+        for state in states:
+            self.append(state)
+
+    def column(self, field):
+        """Return all the values of a field, in row order
+
+        Args:
+            field (str): The field
+
+        Returns:
+            list: The value of field for each row
+        """
+        values = self._values[field]
+        return [values[code] for code in self._codes[field]]
+
+    def values(self, field):
+        """Return the distinct values of a field
+
+        Args:
+            field (str): The field
+
+        Returns:
+            set: Each value of field that appears in the table
+        """
+        values = self._values[field]
+        return set(values[code] for code in set(self._codes[field]))
+
+    def _take(self, rows):
+        """Return a new table containing only the given rows
+
+        The new table shares our value lists, codes are only ever added to them so this is safe.
+        """
+        table = self.__class__()
+        table._values = self._values
+        table._index = self._index
+
+        for field in self.FIELDS:
+            table._codes[field] = array('I', map(self._codes[field].__getitem__, rows))
+
+        return table
+
+    def _postings(self, field):
+        """Return a dict of code -> array of the rows with that code in field, building it if needed"""
+        try:
+            return self._row_index[field]
+        except KeyError:
+            pass
+
+        postings = {}
+        for (row, code) in enumerate(self._codes[field]):
+            try:
+                postings[code].append(row)
+            except KeyError:
+                postings[code] = array('I', [row])
+
+        self._row_index[field] = postings
+        return postings
+
+    def _matching_rows(self, field, wanted):
+        """Return the rows where field has one of the wanted values, in order"""
+        if not isinstance(wanted, (list, tuple, set, frozenset)):
+            wanted = (wanted,)
+
+        index = self._index[field]
+        postings = self._postings(field)
+
+        matches = [postings[index[value]] for value in set(wanted) if value in index and index[value] in postings]
+
+        if len(matches) == 1:
+            return matches[0]
+
+        return sorted(chain.from_iterable(matches))
+
+    def filter(self, **conditions):
+        """Return a new table with only the rows matching all conditions
+
+            >>> table.filter(systemdActiveState='failed', machineID=['abc', 'def'])
+
+        Args:
+            **conditions: field=value, or field=[value, value, ...] to match any of several values
+
+        Returns:
+            UnitStateTable: The matching rows
+
+        Raises:
+            KeyError: An unknown field was specified
+        """
+        rows = None
+
+        # start with the condition that matches the fewest rows, and check the others against just those rows
+        candidates = sorted((self._matching_rows(field, wanted) for (field, wanted) in conditions.items()), key=len)
+
+        for matched in candidates:
+            if rows is None:
+                rows = matched
+            else:
+                matched = set(matched)
+                rows = [row for row in rows if row in matched]
+
+        if rows is None:
+            rows = range(len(self))
+
+        return self._take(rows)
+
+    def count(self, field):
+        """Count the rows with each value of a field
+
+        Args:
+            field (str): The field to count
+
+        Returns:
+            dict: value -> number of rows with that value
+        """
+        values = self._values[field]
+
+        # codes are indexes into values, so they can be counted in a list
+        counts = [0] * len(values)
+        for code in self._codes[field]:
+            counts[code] += 1
+
+        return dict((values[code], n) for (code, n) in enumerate(counts) if n)
+
+    def group_by(self, field):
+        """Split the table into a table per value of field
+
+        Args:
+            field (str): The field to group by
+
+        Returns:
+            dict: value -> UnitStateTable of the rows with that value
+        """
+        values = self._values[field]
+        return dict((values[code], self._take(rows)) for (code, rows) in self._postings(field).items())
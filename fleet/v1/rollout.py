@@ -0,0 +1,219 @@
+import time
+
+from collections import deque
+
+from .apply import _desired_items
+from .errors import APIError, RolloutError
+
+
+def unit_health(states, expected_hash):
+    """Decide if a unit has come up from the states fleet reports for it
+
+    A unit is healthy once every machine reporting it is running the expected version (the hash fleet reports
+    matches) and systemd has it active and running.  It has failed if any machine running the expected version
+    reports it failed.
+
+    Args:
+        states (list): The UnitStates for the unit, one per machine it's scheduled to
+        expected_hash (str): The hash of the unit's options, see Unit.content_hash()
+
+    Returns:
+        str: 'healthy', 'failed', or None if the unit is still starting
+    """
+    if not states:
+        return None
+
+    health = 'healthy'
+    for state in states:
+        # fleet leaves out fields it doesn't know yet, and missing fields raise KeyError
+        data = state.as_dict()
+
+        if data.get('hash') != expected_hash:
+            # still reporting the old version
+            health = None
+            continue
+
+        if data.get('systemdActiveState') == 'failed':
+            return 'failed'
+
+        if (data.get('systemdActiveState'), data.get('systemdSubState')) != ('active', 'running'):
+            health = None
+
+    return health
+
+
+class RolloutResult(object):
+    """The outcome of a rolling update
+
+        >>> result = fleet_client.rolling_update(units, max_unavailable=5)
+        >>> result
+        <RolloutResult: 48 succeeded, 2 failed, 0 skipped in 61.30s (31 polls)>
+
+    Attributes:
+        succeeded (list): Names of the units that were replaced and became healthy, in the order they did
+        errors (dict): name -> the exception raised (APIError), or RolloutError if the unit didn't become healthy
+        skipped (list): Names of the units that weren't replaced because the update was aborted
+        aborted (bool): True if the update stopped early because too many units failed
+        polls (int): The number of times unit states were listed
+        elapsed (float): How long the update took, in seconds
+
+    """
+
+    def __init__(self):
+        self.succeeded = []
+        self.errors = {}
+        self.skipped = []
+        self.aborted = False
+        self.polls = 0
+        self.elapsed = 0.0
+
+    def __repr__(self):
+        return '<{0}: {1} succeeded, {2} failed, {3} skipped in {4:.2f}s ({5} polls)>'.format(
+            self.__class__.__name__,
+            len(self.succeeded),
+            len(self.errors),
+            len(self.skipped),
+            self.elapsed,
+            self.polls
+        )
+
+    @property
+    def ok(self):
+        """True if every unit was replaced and became healthy"""
+        return not (self.errors or self.skipped)
+
+
+class RollingUpdate(object):
+    """Replace units a few at a time, waiting for each to come up before moving on
+
+    At most ``max_unavailable`` units are being replaced at once.  Each is destroyed and created again, then
+    watched until it's healthy (see unit_health()), at which point the next unit takes it's place.  A single
+    listing of unit states each ``poll_interval`` checks on every unit in flight, so the requests made while waiting
+    don't grow with the number of units.
+
+    Once more than ``max_failures`` units have failed (couldn't be replaced, were reported failed, or didn't become
+    healthy within ``timeout``) no more units are started; the units already in flight are still waited on.
+
+    Units should have a desiredState of 'launched', as nothing else will ever be reported active and running.
+
+    Use Client.rolling_update() rather than creating this directly.
+
+    """
+
+    def __init__(self, client, units, max_unavailable=1, max_failures=0, timeout=300, poll_interval=2):
+        """
+        Args:
+            client (fleet.v1.Client): The client to make requests with
+            units (dict, iterable): name -> Unit, (name, Unit) pairs, or Units with names, in the order to replace them
+            max_unavailable (int): The most units to replace at once
+            max_failures (int): The most units that may fail before the update is aborted
+            timeout (float): Seconds a unit has to become healthy once it's been created
+            poll_interval (float): Seconds between checks on the units in flight
+
+        Raises:
+            ValueError: max_unavailable is less than 1, or max_failures is negative
+        """
+        if max_unavailable < 1:
+            raise ValueError('max_unavailable must be >= 1')
+
+        if max_failures < 0:
+            raise ValueError('max_failures must be >= 0')
+
+        self.client = client
+        self.max_unavailable = max_unavailable
+        self.max_failures = max_failures
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+
+        self._pending = deque(_desired_items(units))
+
+        # name -> (expected hash, deadline)
+        self._in_flight = {}
+
+    def _replace(self, name, unit):
+        """Destroy a unit if it exists, and create it again"""
+        try:
+            self.client.destroy_unit(name)
+        except APIError as exc:
+            if exc.code != 404:
+                raise
+
+        self.client.create_unit(name, unit, read_back=False)
+
+        return unit.content_hash()
+
+    def _start(self, result):
+        """Start replacing units until max_unavailable are in flight"""
+        batch = []
+        while self._pending and len(self._in_flight) + len(batch) < self.max_unavailable:
+            batch.append(self._pending.popleft())
+
+        if not batch:
+            return
+
+        started = self.client._run_bulk(self._replace, ((name, (name, unit)) for (name, unit) in batch), len(batch))
+
+        deadline = time.time() + self.timeout
+        for (name, expected_hash) in started.results.items():
+            self._in_flight[name] = (expected_hash, deadline)
+
+        result.errors.update(started.errors)
+
+    def _poll(self, result):
+        """List unit states once, and retire the units in flight that have come up, failed, or timed out"""
+        # with a single unit in flight, fleet can do the filtering for us
+        unit_name = next(iter(self._in_flight)) if len(self._in_flight) == 1 else None
+
+        states = {}
+        for state in self.client.list_unit_states(unit_name=unit_name):
+            if state.name in self._in_flight:
+                states.setdefault(state.name, []).append(state)
+
+        result.polls += 1
+
+        now = time.time()
+        for (name, (expected_hash, deadline)) in list(self._in_flight.items()):
+            health = unit_health(states.get(name), expected_hash)
+
+            if health == 'healthy':
+                result.succeeded.append(name)
+            elif health == 'failed':
+                result.errors[name] = RolloutError(name, 'failed', states.get(name))
+            elif now >= deadline:
+                result.errors[name] = RolloutError(
+                    name, 'timed out after {0}s'.format(self.timeout), states.get(name)
+                )
+            else:
+                continue
+
+            del self._in_flight[name]
+
+    def run(self):
+        """Carry out the update
+
+        Returns:
+            RolloutResult: What was replaced, and what failed
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400 while listing unit states
+        """
+        result = RolloutResult()
+        start = time.time()
+
+        while self._pending or self._in_flight:
+            if self._pending and len(result.errors) > self.max_failures:
+                result.aborted = True
+                result.skipped = [name for (name, _) in self._pending]
+                self._pending.clear()
+
+            self._start(result)
+
+            if not self._in_flight:
+                continue
+
+            time.sleep(self.poll_interval)
+            self._poll(result)
+
+        result.elapsed = time.time() - start
+
+        return result
@@ -0,0 +1,169 @@
+import codecs
+import json
+
+try:  # pragma: no cover
+    # python 2
+    string_types = basestring
+except NameError:  # pragma: no cover
+    # python 3
+    string_types = str
+
+
+class JSONArrayStream(object):
+    """Incrementally decode a JSON object, yielding the elements of one of it's array members as they arrive
+
+    Fleet's list responses look like ``{"units": [{...}, {...}, ...], "nextPageToken": "..."}``.  Rather than
+    reading the whole response and decoding it in one go, this reads it a chunk at a time and yields each
+    element of the array as soon as it is complete, so only one element needs to be in memory at once.
+
+        >>> stream = JSONArrayStream(iter([b'{"units": [{"name": "a"}, {"na', b'me": "b"}], "nextPageToken": "2"}']),
+        ...                          'units')
+        >>> list(stream)
+        [{'name': 'a'}, {'name': 'b'}]
+        >>> stream.members
+        {'nextPageToken': '2'}
+
+    Attributes:
+        key (str): The name of the member whose elements are yielded
+        members (dict): The object's other members; complete once iteration has finished
+
+    """
+
+    _WHITESPACE = ' \t\n\r'
+
+    def __init__(self, chunks, key, encoding='utf-8'):
+        """
+        Args:
+            chunks (iterable): Yields the response body as bytes (or str) in pieces of any size
+            key (str): The name of the member whose elements are yielded
+            encoding (str): The encoding of the body, defaults to 'utf-8'
+
+        """
+        self.key = key
+        self.members = {}
+
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._json = json.JSONDecoder()
+
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self):
+        """Read another chunk into our buffer
+
+        Returns:
+            bool: False if there is nothing more to read
+        """
+        if self._eof:
+            return False
+
+        # throw away what we've already consumed so the buffer doesn't grow with the response
+        if self._pos:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+
+        for chunk in self._chunks:
+            if isinstance(chunk, bytes):
+                chunk = self._decoder.decode(chunk)
+
+            if chunk:
+                self._buf += chunk
+                return True
+
+        self._buf += self._decoder.decode(b'', final=True)
+        self._eof = True
+
+        return False
+
+    def _peek(self):
+        """Skip whitespace, and return the next character without consuming it
+
+        Raises:
+            ValueError: The response ended unexpectedly
+        """
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in self._WHITESPACE:
+                self._pos += 1
+
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+
+            if not self._fill():
+                raise ValueError('Unexpected end of JSON response')
+
+    def _expect(self, chars):
+        """Consume the next non-whitespace character, which must be one of chars
+
+        Returns:
+            str: The character
+
+        Raises:
+            ValueError: The next character was something else
+        """
+        char = self._peek()
+        if char not in chars:
+            raise ValueError('Expected one of {0!r} at position {1}, got {2!r}'.format(chars, self._pos, char))
+
+        self._pos += 1
+        return char
+
+    def _value(self):
+        """Decode the next complete JSON value
+
+        A value is only accepted once something follows it (or the response has ended), so a number split
+        across two chunks isn't mistaken for a shorter one.
+
+        Raises:
+            ValueError: The value is invalid
+        """
+        self._peek()
+
+        while True:
+            try:
+                (value, end) = self._json.raw_decode(self._buf, self._pos)
+            except ValueError:
+                if self._fill():
+                    continue
+                raise
+
+            if end < len(self._buf) or not self._fill():
+                self._pos = end
+                return value
+
+    def __iter__(self):
+        """Yield each element of our array member
+
+        Raises:
+            ValueError: The response is not valid JSON, or is not a JSON object
+        """
+        self._expect('{')
+
+        if self._peek() == '}':
+            self._pos += 1
+            return
+
+        while True:
+            name = self._value()
+            if not isinstance(name, string_types):
+                raise ValueError('Expected a member name at position {0}'.format(self._pos))
+
+            self._expect(':')
+
+            if name == self.key and self._peek() == '[':
+                self._pos += 1
+
+                if self._peek() == ']':
+                    self._pos += 1
+                else:
+                    while True:
+                        yield self._value()
+
+                        if self._expect(',]') == ']':
+                            break
+            else:
+                self.members[name] = self._value()
+
+            if self._expect(',}') == '}':
+                return
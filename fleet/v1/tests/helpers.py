@@ -0,0 +1,89 @@
+"""Factories and fakes shared between test modules"""
+from ..bulk import run_bulk
+from ..errors import APIError
+from ..objects import Unit, UnitState
+
+
+def unit(command, desired_state='launched', name=None):
+    """A Unit with a single ExecStart option"""
+    data = {
+        'desiredState': desired_state,
+        'options': [{'section': 'Service', 'name': 'ExecStart', 'value': command}]
+    }
+    if name:
+        data['name'] = name
+
+    return Unit(data=data)
+
+
+def unit_state_data(name='foo.service', machine='a', hash='h1', active='active', sub='running'):
+    """A unit state, as fleet returns it"""
+    return {
+        'name': name, 'machineID': machine, 'hash': hash,
+        'systemdLoadState': 'loaded', 'systemdActiveState': active, 'systemdSubState': sub
+    }
+
+
+def unit_state(**kwargs):
+    """A UnitState, takes the same arguments as unit_state_data()"""
+    return UnitState(data=unit_state_data(**kwargs))
+
+
+class FakeCluster(object):
+    """Stands in for Client, units come up a number of polls after they're created"""
+
+    def __init__(self, polls_to_start=2, failing=()):
+        self.polls_to_start = polls_to_start
+        self.failing = failing
+
+        # name -> [hash, polls until it's running]
+        self.units = {}
+        self.polls = []
+        self.peak_down = 0
+
+    def _run_bulk(self, operation, items, concurrency):
+        return run_bulk(operation, items, concurrency)
+
+    def destroy_unit(self, name):
+        if name not in self.units:
+            raise APIError(404, 'unit does not exist', None)
+
+        del self.units[name]
+        return True
+
+    def create_unit(self, name, unit, read_back=None):
+        self.units[name] = [unit.content_hash(), self.polls_to_start]
+
+    def list_unit_states(self, machine_id=None, unit_name=None):
+        self.polls.append(unit_name)
+        self.peak_down = max(self.peak_down, len([x for x in self.units.values() if x[1] > 0]))
+
+        for (name, entry) in sorted(self.units.items()):
+            entry[1] -= 1
+
+            if unit_name and name != unit_name:
+                continue
+
+            if name in self.failing:
+                (active, sub) = ('failed', 'failed')
+            elif entry[1] <= 0:
+                (active, sub) = ('active', 'running')
+            else:
+                (active, sub) = ('activating', 'start')
+
+            yield unit_state(name=name, hash=entry[0], active=active, sub=sub)
+
+
+class FakeClient(object):
+    """Stands in for Client, returns each snapshot of unit states in turn from _list(), repeating the last"""
+
+    def __init__(self, *snapshots):
+        self.snapshots = list(snapshots)
+        self.calls = []
+
+    def _list(self, method, key, intern=None, **kwargs):
+        self.calls.append((method, key, kwargs))
+
+        if len(self.snapshots) > 1:
+            return iter(self.snapshots.pop(0))
+        return iter(self.snapshots[0])
@@ -0,0 +1,328 @@
+import unittest
+
+import json, os, shutil, socket, sys, tempfile, threading  # NOQA
+
+from ..errors import APIError
+from ..objects import Unit
+
+try:  # pragma: no cover
+    # python 2
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn, UnixStreamServer
+except ImportError:  # pragma: no cover
+    # python 3
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn, UnixStreamServer
+
+try:  # pragma: no cover
+    # python 2
+    import urllib
+    quote = urllib.quote
+except AttributeError:  # pragma: no cover
+    # python 3
+    import urllib.parse
+    quote = urllib.parse.quote
+
+if sys.version_info >= (3, 6):  # pragma: no cover
+    import asyncio
+    from ..aio import AsyncClient, AsyncConnection, AsyncConnectionPool
+
+
+class CannedHandler(BaseHTTPRequestHandler):
+    """Serve the response the test queued for each path, chunked if the test asked for it"""
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _respond(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length) if length else b''
+
+        self.server.requests.append((self.command, self.path, body))
+
+        (status, content) = self.server.responses.get(self.path, (404, {'error': {'code': 404, 'message': 'nope'}}))
+        content = json.dumps(content).encode('utf-8') if content is not None else b''
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        if self.server.chunked and content:
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            for i in range(0, len(content), 7):
+                chunk = content[i:i + 7]
+                self.wfile.write('{0:x}\r\n'.format(len(chunk)).encode('ascii') + chunk + b'\r\n')
+            self.wfile.write(b'0\r\n\r\n')
+        else:
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+    do_GET = do_PUT = do_DELETE = _respond
+
+
+class CannedServerMixin(object):
+    daemon_threads = True
+
+    def setup_canned(self):
+        self.responses = {}
+        self.requests = []
+        self.chunked = False
+        self.connections = 0
+
+    def get_request(self):
+        self.connections += 1
+        return super(CannedServerMixin, self).get_request()
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+        return self
+
+
+class CannedTCPServer(CannedServerMixin, ThreadingMixIn, HTTPServer):
+    def __init__(self):
+        HTTPServer.__init__(self, ('127.0.0.1', 0), CannedHandler)
+        self.setup_canned()
+
+
+class CannedUnixServer(CannedServerMixin, ThreadingMixIn, UnixStreamServer):
+    def __init__(self, path):
+        UnixStreamServer.__init__(self, path, CannedHandler)
+        self.setup_canned()
+
+    def get_request(self):
+        # BaseHTTPRequestHandler expects an address it can index
+        (request, _) = super(CannedUnixServer, self).get_request()
+        return (request, ('unix', 0))
+
+
+def collect(agen):
+    """Consume an async generator without async syntax, so this module imports on python 2"""
+    results = []
+
+    loop = asyncio.get_event_loop()
+    while True:
+        try:
+            results.append(loop.run_until_complete(agen.__anext__()))
+        except StopAsyncIteration:
+            return results
+
+
+@unittest.skipIf(sys.version_info < (3, 6), 'AsyncClient requires python 3.6')
+class TestAsyncClient(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.server = CannedTCPServer().start()
+        self.client = AsyncClient('http://{0}:{1}'.format(*self.server.server_address))
+
+    def tearDown(self):
+        self.wait(self.client.close())
+        self.server.shutdown()
+        self.server.server_close()
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def wait(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def test_bad_scheme(self):
+        """ValueError is raised for unsupported endpoints"""
+
+        def test():
+            AsyncClient('ssh+http://198.51.100.23:9160')
+
+        self.assertRaises(ValueError, test)
+
+    def test_get_unit(self):
+        """A unit is fetched and decoded"""
+        self.server.responses['/fleet/v1/units/foo%40bar.service'] = (200, {
+            'name': 'foo@bar.service', 'desiredState': 'launched', 'options': []
+        })
+
+        unit = self.wait(self.client.get_unit('foo@bar.service'))
+
+        assert isinstance(unit, Unit)
+        assert unit.name == 'foo@bar.service'
+
+    def test_chunked(self):
+        """Chunked responses are decoded"""
+        self.server.chunked = True
+        self.server.responses['/fleet/v1/units/foo.service'] = (200, {
+            'name': 'foo.service', 'desiredState': 'launched', 'options': []
+        })
+
+        assert self.wait(self.client.get_unit('foo.service')).name == 'foo.service'
+
+    def test_api_error(self):
+        """APIError is raised for error responses"""
+
+        def test():
+            self.wait(self.client.get_unit('missing.service'))
+
+        self.assertRaises(APIError, test)
+
+    def test_list_pagination(self):
+        """Async generators follow nextPageToken"""
+        self.server.responses['/fleet/v1/machines'] = (200, {
+            'machines': [{'id': 'a', 'primaryIP': '198.51.100.1'}], 'nextPageToken': 'foo'
+        })
+        self.server.responses['/fleet/v1/machines?nextPageToken=foo'] = (200, {
+            'machines': [{'id': 'b', 'primaryIP': '198.51.100.2'}]
+        })
+
+        machines = collect(self.client.list_machines())
+
+        assert [x.id for x in machines] == ['a', 'b']
+
+    def test_list_unit_states_filter(self):
+        """Filters are sent as query parameters"""
+        self.server.responses['/fleet/v1/state?machineID=a'] = (200, {
+            'states': [{'name': 'foo.service', 'machineID': 'a'}]
+        })
+
+        states = collect(self.client.list_unit_states(machine_id='a'))
+
+        assert [x.name for x in states] == ['foo.service']
+
+    def test_set_and_destroy(self):
+        """Writes send the right method and body"""
+        self.server.responses['/fleet/v1/units/foo.service'] = (204, None)
+
+        def test():
+            self.wait(self.client.set_unit_desired_state('foo.service', 'running'))
+
+        self.assertRaises(ValueError, test)
+
+        assert self.wait(self.client.destroy_unit('foo.service')) is True
+        assert self.server.requests[-1][:2] == ('DELETE', '/fleet/v1/units/foo.service')
+
+    def test_create_unit(self):
+        """create_unit submits the unit then fetches it"""
+        self.server.responses['/fleet/v1/units/foo.service'] = (200, {
+            'name': 'foo.service', 'desiredState': 'launched', 'options': []
+        })
+
+        unit = Unit(options=[{'section': 'Service', 'name': 'ExecStart', 'value': '/bin/true'}])
+        self.wait(self.client.create_unit('foo.service', unit))
+
+        (method, path, body) = self.server.requests[0]
+
+        assert method == 'PUT'
+        assert json.loads(body.decode('utf-8'))['options'][0]['value'] == '/bin/true'
+
+    def test_keep_alive(self):
+        """Sequential requests reuse one connection"""
+        self.server.responses['/fleet/v1/units/foo.service'] = (200, {'name': 'foo.service', 'options': []})
+
+        for _ in range(3):
+            self.wait(self.client.get_unit('foo.service'))
+
+        assert self.server.connections == 1
+        assert self.client._pool.stats['reused'] == 2
+
+    def test_idle_health(self):
+        """Idle connections the server closed, or sent something unasked on, aren't healthy"""
+
+        async def check(send=None, close=False):
+            (ours, theirs) = socket.socketpair()
+            (reader, writer) = await asyncio.open_connection(sock=ours)
+            conn = AsyncConnection(reader, writer)
+
+            conn.idle()
+            if send:
+                theirs.sendall(send)
+            if close:
+                theirs.close()
+            await asyncio.sleep(0.05)
+
+            try:
+                return await conn.is_healthy()
+            finally:
+                conn.close()
+                theirs.close()
+
+        assert self.wait(check()) is True
+        assert self.wait(check(send=b'junk')) is False
+        assert self.wait(check(close=True)) is False
+
+    def test_cancelled_health_check(self):
+        """Cancelling a task while it checks an idle connection cancels it, and gives up it's connection"""
+        (ours, theirs) = socket.socketpair()
+
+        async def test():
+            pool = AsyncConnectionPool(lambda: asyncio.open_connection(sock=ours), max_active=1)
+
+            conn = await pool.acquire()
+            conn.reusable = True
+            pool.release(conn)
+
+            task = asyncio.ensure_future(pool.acquire())
+            await asyncio.sleep(0)
+            task.cancel()
+
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            else:
+                self.fail('CancelledError not raised')
+
+            # the slot was given back
+            await asyncio.wait_for(pool._active.acquire(), 1)
+
+            return (conn, len(pool))
+
+        try:
+            (conn, idle) = self.wait(test())
+        finally:
+            theirs.close()
+
+        assert idle == 0
+        assert conn.writer.transport.is_closing()
+
+    def test_concurrent(self):
+        """Many concurrent requests are limited to max_connections"""
+        self.server.responses['/fleet/v1/units/foo.service'] = (200, {'name': 'foo.service', 'options': []})
+
+        client = AsyncClient('http://{0}:{1}'.format(*self.server.server_address), max_connections=4)
+
+        units = self.wait(asyncio.gather(*[client.get_unit('foo.service') for _ in range(50)]))
+        self.wait(client.close())
+
+        assert len(units) == 50
+        assert client._pool.stats['created'] <= 4
+
+
+@unittest.skipIf(sys.version_info < (3, 6), 'AsyncClient requires python 3.6')
+class TestAsyncClientUnix(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.tmpdir = tempfile.mkdtemp()
+        path = os.path.join(self.tmpdir, 'fleet.sock')
+
+        self.server = CannedUnixServer(path).start()
+        self.client = AsyncClient('http+unix://' + quote(path, safe=''))
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.client.close())
+        self.server.shutdown()
+        self.server.server_close()
+        self.loop.close()
+        asyncio.set_event_loop(None)
+        shutil.rmtree(self.tmpdir)
+
+    def test_list_units(self):
+        """Requests work over unix domain sockets"""
+        self.server.responses['/fleet/v1/units'] = (200, {
+            'units': [{'name': 'foo.service', 'desiredState': 'launched', 'options': []}]
+        })
+
+        units = collect(self.client.list_units())
+
+        assert [x.name for x in units] == ['foo.service']
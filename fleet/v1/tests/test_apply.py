@@ -0,0 +1,87 @@
+import unittest
+
+import mock
+
+from ..apply import ApplyPlan, execute_plan, make_plan
+from ..bulk import BulkResult, run_bulk
+from ..errors import APIError
+from .helpers import unit
+
+
+class TestMakePlan(unittest.TestCase):
+    def setUp(self):
+        self.current = [
+            unit('/bin/a', name='same.service'),
+            unit('/bin/b', name='changed.service'),
+            unit('/bin/c', name='stopped.service', desired_state='loaded'),
+            unit('/bin/d', name='extra.service'),
+        ]
+
+        self.desired = {
+            'same.service': unit('/bin/a'),
+            'changed.service': unit('/bin/b2'),
+            'stopped.service': unit('/bin/c'),
+            'new.service': unit('/bin/e'),
+        }
+
+    def test_plan(self):
+        """Units are sorted into create, replace, state, and unchanged"""
+        plan = make_plan(self.desired, self.current)
+
+        assert list(plan.create) == ['new.service']
+        assert list(plan.replace) == ['changed.service']
+        assert plan.state == {'stopped.service': 'launched'}
+        assert plan.unchanged == ['same.service']
+        assert plan.delete == []
+
+        assert len(plan) == 3
+        assert repr(plan) == '<ApplyPlan: 1 create, 1 replace, 1 state, 0 delete, 1 unchanged>'
+
+    def test_prune(self):
+        """Units missing from the desired set are only deleted if prune is requested"""
+        plan = make_plan(self.desired, self.current, prune=True)
+
+        assert plan.delete == ['extra.service']
+
+    def test_pairs_and_named_units(self):
+        """Desired units can be given as (name, Unit) pairs, or as Units with names"""
+        plan = make_plan([('same.service', unit('/bin/a')), unit('/bin/x', name='other.service')], self.current)
+
+        assert plan.unchanged == ['same.service']
+        assert list(plan.create) == ['other.service']
+
+    def test_bad_state(self):
+        """ValueError is raised for an invalid desiredState"""
+
+        def test():
+            make_plan({'foo.service': unit('/bin/a', desired_state='running')}, [])
+
+        self.assertRaises(ValueError, test)
+
+
+class TestExecutePlan(unittest.TestCase):
+    def test_execute(self):
+        """Replacements are destroyed before they're created, and failed destroys aren't recreated"""
+        plan = ApplyPlan()
+        plan.create = {'new.service': unit('/bin/a')}
+        plan.replace = {'changed.service': unit('/bin/b'), 'stuck.service': unit('/bin/c')}
+        plan.state = {'stopped.service': 'inactive'}
+        plan.delete = ['extra.service']
+
+        client = mock.Mock()
+        client._run_bulk.side_effect = run_bulk
+        client.destroy_units.return_value = BulkResult(
+            results={'changed.service': True, 'extra.service': True},
+            errors={'stuck.service': APIError(500, 'nope', None)}
+        )
+        client.create_units.return_value = BulkResult(results={'new.service': None, 'changed.service': None})
+
+        execute_plan(client, plan, concurrency=2)
+
+        assert sorted(client.destroy_units.call_args[0][0]) == ['changed.service', 'extra.service', 'stuck.service']
+        assert sorted(name for (name, _) in client.create_units.call_args[0][0]) == ['changed.service', 'new.service']
+        client.set_unit_desired_state.assert_called_once_with('stopped.service', 'inactive', False)
+
+        assert sorted(plan.results) == ['create', 'destroy', 'state']
+        assert list(plan.errors) == ['stuck.service']
+        assert not plan.ok
@@ -0,0 +1,125 @@
+import unittest
+
+import threading, time  # NOQA
+
+from ..bulk import BulkResult, WorkerPool, run_bulk
+
+
+class TestBulkResult(unittest.TestCase):
+    def test_counts(self):
+        """Results and errors are counted, and throughput is derived from elapsed"""
+        result = BulkResult(results={'a': 1, 'b': 2}, errors={'c': ValueError()}, elapsed=1.5)
+
+        assert len(result) == 3
+        assert not result.ok
+        assert result.throughput == 2.0
+        assert repr(result) == '<BulkResult: 2 succeeded, 1 failed in 1.50s (2.0/s)>'
+
+    def test_empty(self):
+        """An empty result is ok, with no throughput"""
+        result = BulkResult()
+
+        assert result.ok
+        assert result.throughput == 0.0
+
+
+class TestRunBulk(unittest.TestCase):
+    workers = None
+
+    def operation(self, value):
+        if value < 0:
+            raise ValueError('negative')
+        return value * 2
+
+    def items(self):
+        return ((str(x), (x,)) for x in [1, 2, -3, 4])
+
+    def check(self, result):
+        assert result.results == {'1': 2, '2': 4, '4': 8}
+        assert list(result.errors) == ['-3']
+        assert isinstance(result.errors['-3'], ValueError)
+        assert result.elapsed > 0
+
+    def test_serial(self):
+        """With a concurrency of 1 items run on the calling thread, and errors are collected"""
+        self.check(run_bulk(self.operation, self.items(), 1, workers=self.workers))
+
+    def test_concurrent(self):
+        """Items run concurrently, and errors are collected"""
+        self.check(run_bulk(self.operation, self.items(), 4, workers=self.workers))
+
+    def test_bounded(self):
+        """No more than concurrency operations run at once"""
+        lock = threading.Lock()
+        state = {'running': 0, 'peak': 0}
+
+        def operation(value):
+            with lock:
+                state['running'] += 1
+                state['peak'] = max(state['peak'], state['running'])
+
+            time.sleep(0.01)
+
+            with lock:
+                state['running'] -= 1
+
+            return value
+
+        result = run_bulk(operation, ((str(x), (x,)) for x in range(20)), 3, workers=self.workers)
+
+        assert len(result.results) == 20
+        assert 1 < state['peak'] <= 3
+
+    def test_bad_concurrency(self):
+        """ValueError is raised for concurrency < 1"""
+        self.assertRaises(ValueError, run_bulk, self.operation, self.items(), 0)
+
+
+class TestWorkerPool(TestRunBulk):
+    """run_bulk() behaves the same on a WorkerPool"""
+
+    def setUp(self):
+        self.workers = WorkerPool()
+
+    def tearDown(self):
+        self.workers.close()
+
+    def threads(self):
+        result = set()
+
+        def operation(value):
+            result.add(threading.current_thread())
+            time.sleep(0.01)
+
+        run_bulk(operation, ((str(x), (x,)) for x in range(8)), 4, workers=self.workers)
+
+        return result
+
+    def test_reused(self):
+        """The same threads run one operation after another"""
+        first = self.threads()
+
+        assert 1 < len(first) <= 4
+        assert self.threads() <= first
+
+    def test_smaller(self):
+        """An operation wanting fewer threads than there are is still bounded"""
+        self.threads()
+        self.test_bounded()
+
+    def test_grows(self):
+        """More threads are started when an operation wants more than there are"""
+        self.threads()
+
+        result = run_bulk(self.operation, ((str(x), (x,)) for x in range(10)), 8, workers=self.workers)
+
+        assert len(result.results) == 10
+        assert self.workers._size == 8
+
+    def test_bad_items(self):
+        """An error from the items is raised rather than lost"""
+        def items():
+            yield ('1', (1,))
+            raise KeyError('bad')
+
+        self.assertRaises(KeyError, run_bulk, self.operation, items(), 2, workers=self.workers)
@@ -0,0 +1,387 @@
+import unittest
+import mock
+
+import os, shutil, tempfile, time  # NOQA
+
+from apiclient.http import HttpMockSequence
+
+from ..cache import DiscoveryCache, ResponseCache, UnitFileCache, _LRUDict
+from ..client import Client
+from ..errors import UnitFileError
+from ..objects import Unit
+
+
+class RecordingHttpMockSequence(HttpMockSequence):
+    """A HttpMockSequence that remembers the headers sent with each request"""
+    def __init__(self, iterable):
+        super(RecordingHttpMockSequence, self).__init__(iterable)
+        self.sent_headers = []
+
+    def request(self, uri, method='GET', body=None, headers=None, *args, **kwargs):
+        self.sent_headers.append(headers or {})
+        return super(RecordingHttpMockSequence, self).request(uri, method, body, headers, *args, **kwargs)
+
+
+class TestDiscoveryCache(unittest.TestCase):
+    def setUp(self):
+        self._BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+        self.tmpdir = tempfile.mkdtemp()
+
+        self.cache = DiscoveryCache(path=os.path.join(self.tmpdir, 'discovery'))
+        self.url = 'http://198.51.100.23:9160/fleet/v1/discovery'
+
+        self.endpoint = 'http://198.51.100.23:9160'
+
+        with open(os.path.join(self._BASE_DIR, 'fixtures/fleet_v1.json')) as fh:
+            self.discovery = fh.read()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_get_missing(self):
+        """get returns None when there is no entry"""
+        assert self.cache.get(self.url) is None
+
+    def test_set_get(self):
+        """Stored entries can be retrieved"""
+        self.cache.set(self.url, 'document', '"etag"')
+
+        entry = self.cache.get(self.url)
+
+        assert entry['document'] == 'document'
+        assert entry['etag'] == '"etag"'
+
+    def test_keyed_by_url(self):
+        """Entries for different endpoints do not collide"""
+        self.cache.set(self.url, 'document')
+
+        assert self.cache.get('http+unix://%2Fvar%2Frun%2Ffleet.sock/fleet/v1/discovery') is None
+
+    def test_corrupt_entry(self):
+        """A corrupt entry is treated as missing"""
+        self.cache.set(self.url, 'document')
+
+        with open(self.cache._filename(self.url), 'w') as fh:
+            fh.write('{not json')
+
+        assert self.cache.get(self.url) is None
+
+    def test_is_fresh(self):
+        """Entries older than max_age are not fresh"""
+        entry = self.cache.set(self.url, 'document')
+
+        assert self.cache.is_fresh(entry)
+
+        entry['fetched'] = time.time() - self.cache.max_age - 1
+
+        assert self.cache.is_fresh(entry) is False
+
+    def test_client_cold(self):
+        """A client with an empty cache fetches and stores the discovery document"""
+        http = HttpMockSequence([
+            ({'status': '200', 'etag': '"v1"'}, self.discovery)
+        ])
+
+        Client(self.endpoint, http=http, discovery_cache=self.cache)
+
+        entry = self.cache.get(self.url)
+
+        assert entry['etag'] == '"v1"'
+        assert entry['document'] == self.discovery
+
+    def test_client_warm(self):
+        """A client with a fresh cache entry makes no requests"""
+        self.cache.set(self.url, self.discovery, '"v1"')
+
+        # an empty sequence will raise if any request is made
+        Client(self.endpoint, http=HttpMockSequence([]), discovery_cache=self.cache)
+
+    def test_client_revalidate_not_modified(self):
+        """A stale entry is revalidated with If-None-Match, and a 304 keeps it"""
+        self.cache.max_age = 0
+        self.cache.set(self.url, self.discovery, '"v1"')
+
+        http = RecordingHttpMockSequence([
+            ({'status': '304'}, '')
+        ])
+
+        Client(self.endpoint, http=http, discovery_cache=self.cache)
+
+        assert http.sent_headers[0]['If-None-Match'] == '"v1"'
+        assert self.cache.get(self.url)['document'] == self.discovery
+
+    def test_client_revalidate_modified(self):
+        """A stale entry is replaced when the document changed"""
+        self.cache.max_age = 0
+        self.cache.set(self.url, 'old document', '"v1"')
+
+        http = HttpMockSequence([
+            ({'status': '200', 'etag': '"v2"'}, self.discovery)
+        ])
+
+        Client(self.endpoint, http=http, discovery_cache=self.cache)
+
+        entry = self.cache.get(self.url)
+
+        assert entry['etag'] == '"v2"'
+        assert entry['document'] == self.discovery
+
+    def test_client_not_fleet(self):
+        """ValueError is raised if the discovery document can not be retrieved"""
+
+        def test():
+            http = HttpMockSequence([
+                ({'status': '404'}, '')
+            ])
+
+            Client(self.endpoint, http=http, discovery_cache=self.cache)
+
+        self.assertRaises(ValueError, test)
+
+        assert self.cache.get(self.url) is None
+
+    def test_client_stale_while_revalidate(self):
+        """A stale entry is used immediately, and revalidated in the background"""
+        self.cache.max_age = 0
+        self.cache.stale_while_revalidate = True
+        entry = self.cache.set(self.url, self.discovery, '"v1"')
+
+        http = RecordingHttpMockSequence([
+            ({'status': '304'}, '')
+        ])
+
+        with mock.patch.object(Client, '_new_http', return_value=http):
+            Client(self.endpoint, discovery_cache=self.cache)
+
+        # wait for the background thread to revalidate the entry
+        for _ in range(100):
+            if self.cache.get(self.url)['fetched'] > entry['fetched']:
+                break
+            time.sleep(0.01)
+
+        assert http.sent_headers[0]['If-None-Match'] == '"v1"'
+
+
+class TestLRUDict(unittest.TestCase):
+    def test_order(self):
+        """Keys are popped least recently used first, whether they were set or read"""
+        lru = _LRUDict()
+        for key in 'abcd':
+            lru.set(key, key.upper())
+
+        assert lru.get('a') == 'A'
+        lru.set('b', 'B2')
+        assert lru.pop('c') == 'C'
+        assert lru.get('c') is None
+
+        assert [lru.pop_oldest() for _ in range(3)] == [('d', 'D'), ('a', 'A'), ('b', 'B2')]
+        assert len(lru) == 0
+        self.assertRaises(KeyError, lru.pop_oldest)
+
+    def test_compacted(self):
+        """The queue of uses doesn't grow without bound while the number of keys doesn't"""
+        lru = _LRUDict()
+        for i in range(1000):
+            lru.set(i % 10, i)
+            lru.get((i + 5) % 10)
+
+        assert len(lru) == 10
+        assert len(lru._order) <= 2 * 10 + 16
+        assert lru.pop_oldest() == (5, 995)
+
+
+class TestUnitFileCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.cache = UnitFileCache()
+
+        self.unit_file = self.write('foo.service', '[Service]\nExecStart=/usr/bin/sleep 1d\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write(self, name, content, mtime=None):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, 'w') as fh:
+            fh.write(content)
+
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+
+        return path
+
+    def test_load(self):
+        """Loading gives the same unit as from_file"""
+        unit = self.cache.load(self.unit_file)
+
+        assert isinstance(unit, Unit)
+        assert unit.options == Unit(from_file=self.unit_file).options
+        assert unit.desiredState == 'launched'
+        assert self.cache.stats == {'hits': 0, 'misses': 1, 'evicted': 0}
+
+    def test_load_same_lines(self):
+        """Files are decoded and split into lines just as from_file does"""
+        path = os.path.join(self.tmpdir, 'bar.service')
+        with open(path, 'wb') as fh:
+            content = u'[Unit]\r\nDescription=caf\u00e9\x0cbar\u2028baz\r\n[Service]\rExecStart=/bin/true\n'
+            fh.write(content.encode('utf-8'))
+
+        unit = self.cache.load(path)
+
+        assert unit.options == Unit(from_file=path).options
+        assert unit.options[0]['value'] == u'caf\u00e9\x0cbar\u2028baz'
+        assert len(unit.options) == 2
+
+    def test_hit(self):
+        """Unchanged files aren't parsed again"""
+        self.cache.load(self.unit_file)
+
+        with mock.patch('fleet.v1.cache.parse_unit_file') as parse:
+            unit = self.cache.load(self.unit_file, desired_state='loaded')
+
+        assert not parse.called
+        assert unit.options[0]['value'] == '/usr/bin/sleep 1d'
+        assert unit.desiredState == 'loaded'
+        assert self.cache.stats['hits'] == 1
+
+    def test_fresh_units(self):
+        """Changing a loaded unit doesn't change the cache"""
+        self.cache.load(self.unit_file).options[0]['value'] = 'changed'
+        self.cache.load(self.unit_file).add_option('Service', 'ExecStop', '/bin/true')
+
+        assert self.cache.load(self.unit_file).options == [
+            {'section': 'Service', 'name': 'ExecStart', 'value': '/usr/bin/sleep 1d'}
+        ]
+
+    def test_changed(self):
+        """Changed files are parsed again"""
+        self.cache.load(self.unit_file)
+        self.write('foo.service', '[Service]\nExecStart=/usr/bin/sleep 2d\n', mtime=time.time() + 10)
+
+        assert self.cache.load(self.unit_file).options[0]['value'] == '/usr/bin/sleep 2d'
+        assert self.cache.stats['misses'] == 2
+
+    def test_touched(self):
+        """Files with a new mtime but the same contents aren't parsed again"""
+        self.cache.load(self.unit_file)
+        os.utime(self.unit_file, (time.time() + 10, time.time() + 10))
+
+        with mock.patch('fleet.v1.cache.parse_unit_file') as parse:
+            self.cache.load(self.unit_file)
+
+        assert not parse.called
+        assert self.cache.stats == {'hits': 1, 'misses': 1, 'evicted': 0}
+
+    def test_lru(self):
+        """The least recently used entry is evicted once we're full"""
+        cache = UnitFileCache(max_entries=2)
+
+        paths = [self.write('{0}.service'.format(x), '[Service]\nExecStart=/bin/true\n') for x in 'abc']
+
+        cache.load(paths[0])
+        cache.load(paths[1])
+        cache.load(paths[0])
+        cache.load(paths[2])
+
+        assert len(cache) == 2
+        assert cache.stats['evicted'] == 1
+
+        # b was least recently used
+        cache.load(paths[0])
+        cache.load(paths[1])
+
+        assert cache.stats['hits'] == 2
+        assert cache.stats['misses'] == 4
+
+    def test_persistent(self):
+        """Entries on disk are used by other caches"""
+        path = os.path.join(self.tmpdir, 'cache')
+
+        UnitFileCache(path=path).load(self.unit_file)
+
+        cache = UnitFileCache(path=path)
+        with mock.patch('fleet.v1.cache.parse_unit_file') as parse:
+            unit = cache.load(self.unit_file)
+
+        assert not parse.called
+        assert unit.options[0]['value'] == '/usr/bin/sleep 1d'
+        assert cache.stats['hits'] == 1
+
+    def test_persistent_corrupt(self):
+        """Unreadable entries on disk are ignored"""
+        cache = UnitFileCache(path=os.path.join(self.tmpdir, 'cache'))
+        cache.load(self.unit_file)
+
+        with open(cache._filename(os.path.abspath(self.unit_file)), 'w') as fh:
+            fh.write('not json')
+
+        cache.clear()
+
+        assert cache.load(self.unit_file).options[0]['value'] == '/usr/bin/sleep 1d'
+        assert cache.stats['misses'] == 2
+
+    def test_errors(self):
+        """Missing and invalid files raise, and aren't cached"""
+        bad = self.write('bad.service', '[Service]\nExecStart\n')
+
+        self.assertRaises(UnitFileError, self.cache.load, bad)
+        self.assertRaises((IOError, OSError), self.cache.load, os.path.join(self.tmpdir, 'missing.service'))
+
+        assert len(self.cache) == 0
+
+    def test_bad_max_entries(self):
+        """ValueError is raised for max_entries < 1"""
+        self.assertRaises(ValueError, UnitFileCache, max_entries=0)
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResponseCache(max_entries=2, ttl=5)
+
+    def test_get_set(self):
+        """Values are returned until they expire"""
+        with mock.patch('fleet.v1.cache.time.time', return_value=100):
+            self.cache.set(('unit', 'foo'), {'name': 'foo'})
+
+        with mock.patch('fleet.v1.cache.time.time', return_value=104):
+            assert self.cache.get(('unit', 'foo')) == {'name': 'foo'}
+
+        with mock.patch('fleet.v1.cache.time.time', return_value=105):
+            assert self.cache.get(('unit', 'foo')) is None
+            assert self.cache.get(('unit', 'bar')) is None
+
+        assert self.cache.stats == {'hits': 1, 'misses': 2, 'evicted': 0}
+
+    def test_lru(self):
+        """The least recently used entry is evicted once we're full"""
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        self.cache.get('a')
+        self.cache.set('c', 3)
+
+        assert len(self.cache) == 2
+        assert self.cache.get('b') is None
+        assert self.cache.get('a') == 1
+        assert self.cache.stats['evicted'] == 1
+
+    def test_invalidate(self):
+        """Invalidated entries are dropped, and values fetched before an invalidation aren't stored"""
+        self.cache.set('a', 1)
+        generation = self.cache.generation
+
+        self.cache.invalidate('a', 'missing')
+        assert self.cache.get('a') is None
+
+        self.cache.set('a', 1, generation)
+        assert self.cache.get('a') is None
+
+        self.cache.set('a', 2, self.cache.generation)
+        assert self.cache.get('a') == 2
+
+        self.cache.clear()
+        assert len(self.cache) == 0
+
+    def test_bad_args(self):
+        """ValueError is raised for max_entries < 1 or a negative ttl"""
+        self.assertRaises(ValueError, ResponseCache, max_entries=0)
+        self.assertRaises(ValueError, ResponseCache, ttl=-1)
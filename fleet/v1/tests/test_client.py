@@ -1,15 +1,19 @@
 import unittest
 import mock
 
-import os, socket, tempfile  # NOQA
+import json, os, select, socket, tempfile, threading, time  # NOQA
 
 from apiclient.http import HttpMock, HttpMockSequence
 
+import httplib2
 import paramiko
 
+from ..cache import ResponseCache
 from ..client import Client, SSHTunnel
+from ...http import HTTPOverSSHTunnel, SSHTunnelProxyInfo
 from ..errors import APIError
 from ..objects import Unit
+from .test_http_pool import serve_keep_alive
 
 
 class ForwardChecker(object):
@@ -24,6 +28,52 @@ class ForwardChecker(object):
         return path
 
 
+class FakeChannel(object):
+    """One end of a socket pair dressed up as a paramiko channel, with a keep-alive HTTP server on the other"""
+    def __init__(self, transport):
+        (self._sock, theirs) = socket.socketpair()
+        self._transport = transport
+
+        self.closed = False
+        self.eof_received = False
+        self.eof_sent = False
+
+        thread = threading.Thread(target=serve_keep_alive, args=(theirs,))
+        thread.daemon = True
+        thread.start()
+
+    def __getattr__(self, name):
+        return getattr(self._sock, name)
+
+    def recv_ready(self):
+        return bool(select.select([self._sock], [], [], 0)[0])
+
+    def get_transport(self):
+        return self._transport
+
+    def close(self):
+        self.closed = True
+        self._sock.close()
+
+
+class RoutingHttp(object):
+    """A mock http object that responds based on the method and the last component of the requested path"""
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests = []
+
+    def request(self, uri, method='GET', body=None, headers=None, *args, **kwargs):
+        name = uri.split('?')[0].rsplit('/', 1)[-1]
+        self.requests.append((method, name))
+
+        (status, content) = self.routes.get(
+            (method, name),
+            ('404', '{"error": {"code": 404, "message": "unit does not exist"}}')
+        )
+
+        return httplib2.Response({'status': status}), (content or '').encode('utf-8')
+
+
 class TestSSHTunnel(unittest.TestCase):
     def test_good_raw_transport(self):
         """Passing a raw transport to ssh tunnel skips other configuration"""
@@ -65,6 +115,108 @@ class TestSSHTunnel(unittest.TestCase):
             s = SSHTunnel(host='foo', strict_host_key_checking=False)
             assert id(s.client.get_transport()) == id(s.transport)
 
+    def test_forward_tcp_reuses_channels(self):
+        """Channels released after use are handed out again by forward_tcp"""
+        t = mock.Mock(spec=paramiko.transport.Transport)
+        channel = t.open_channel.return_value
+        channel.configure_mock(closed=False, eof_received=False, eof_sent=False)
+        channel.recv_ready.return_value = False
+
+        s = SSHTunnel(host=t)
+
+        s.forward_tcp('127.0.0.1', 49153).release()
+        s.forward_tcp('127.0.0.1', 49153).release()
+
+        assert t.open_channel.call_count == 1
+        assert s.channel_pool('127.0.0.1', 49153).stats['reused'] == 1
+
+    def test_forward_tcp_max_channels(self):
+        """forward_tcp blocks once max_channels are in use"""
+        t = mock.Mock(spec=paramiko.transport.Transport)
+        t.open_channel.side_effect = lambda *args: mock.Mock()
+
+        s = SSHTunnel(host=t, max_channels=1)
+        sock = s.forward_tcp('127.0.0.1', 49153)
+
+        result = []
+        thread = threading.Thread(target=lambda: result.append(s.forward_tcp('127.0.0.1', 49153)))
+        thread.daemon = True
+        thread.start()
+        thread.join(0.1)
+
+        assert result == []
+
+        sock.close()
+        thread.join(1)
+
+        assert len(result) == 1
+
+    def test_client_max_channels(self):
+        """More threads than max_channels can make requests through a Client, again and again"""
+        t = mock.Mock(spec=paramiko.transport.Transport)
+        t.is_active.return_value = True
+
+        channels = []
+
+        def open_channel(*args):
+            channels.append(FakeChannel(t))
+            return channels[-1]
+
+        t.open_channel.side_effect = open_channel
+
+        client = Client('http://198.51.100.23:9160', ssh_raw_transport=t, ssh_max_channels=3, engine='native')
+
+        errors = []
+
+        def list_units():
+            try:
+                for _ in range(3):
+                    assert list(client.list_units()) == []
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=list_units) for _ in range(5)]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert not any(thread.is_alive() for thread in threads)
+        assert errors == []
+
+        units = [('{0}.service'.format(i), Unit(options=[{'section': 'Service', 'name': 'ExecStart', 'value': 'a'}]))
+                 for i in range(8)]
+
+        for concurrency in (3, 4, 3):
+            result = client.create_units(units, concurrency=concurrency)
+            assert result.ok, result.errors
+
+        # the bulk calls shared one set of worker threads
+        assert client._workers._size == 4
+
+        assert len(channels) <= 3
+        assert client._ssh_tunnel.channel_pool('198.51.100.23', 9160).stats['reused'] > 0
+
+    def test_reconnect_from_pool(self):
+        """A closed tunnel connection without a proxy_info callable checks another channel out of it's pool"""
+        t = mock.Mock(spec=paramiko.transport.Transport)
+        t.is_active.return_value = True
+        t.open_channel.side_effect = lambda *args: FakeChannel(t)
+
+        s = SSHTunnel(host=t, max_channels=1)
+
+        conn = HTTPOverSSHTunnel('198.51.100.23', proxy_info=SSHTunnelProxyInfo(sock=s.forward_tcp('127.0.0.1', 80)))
+        conn.close()
+        conn.connect()
+
+        # nothing was read from the first channel, so it's closed rather than reused, freeing it's slot
+        assert conn.sock.pool is s.channel_pool('127.0.0.1', 80)
+        assert s.channel_pool('127.0.0.1', 80).stats['discarded'] == 1
+        assert s.channel_pool('127.0.0.1', 80).stats['created'] == 2
+
+        conn.close()
+
 
 class TestFleetClient(unittest.TestCase):
     def setUp(self):
@@ -104,6 +256,171 @@ class TestFleetClient(unittest.TestCase):
 
         self.assertRaises(ValueError, test)
 
+    def test_init_lazy(self):
+        """A lazy client does not make any requests until the first API call"""
+
+        # an empty sequence will raise if any request is made
+        client = Client(self.endpoint, http=HttpMockSequence([]), lazy=True)
+
+        assert client._service is None
+        assert client._connected is False
+
+    def test_lazy_first_request(self):
+        """A lazy client performs discovery on the first API call"""
+
+        with open(os.path.join(self._BASE_DIR, 'fixtures/fleet_v1.json')) as fh:
+            discovery = fh.read()
+
+        client = Client(self.endpoint, http=HttpMockSequence([
+            ({'status': '200'}, discovery),
+            ({'status': '200'}, '{"machines":[{"id":"b4104f4b83fd48b2acc16a085b0ec2ce","primaryIP":"198.51.100.99"}]}')
+        ]), lazy=True)
+
+        assert len(list(client.list_machines())) == 1
+        assert client._connected
+
+    def test_lazy_bad_endpoint(self):
+        """A lazy client raises ValueError from the first API call if discovery fails"""
+
+        client = Client(self.endpoint, http=HttpMock(
+            os.path.join(self._BASE_DIR, 'fixtures/empty_response.txt'),
+            {'status': '404'},
+        ), lazy=True)
+
+        def test():
+            client.get_unit('test.service')
+
+        self.assertRaises(ValueError, test)
+
+    def test_lazy_ssh_not_connected(self):
+        """A lazy client doesn't connect to ssh in the constructor"""
+
+        with mock.patch('paramiko.SSHClient', side_effect=socket.error):
+            client = Client(endpoint=self.endpoint, ssh_tunnel='unknown_host:2222', lazy=True)
+
+            self.assertRaises(ValueError, client._ensure_connected)
+
+    def test_lazy_connects_once(self):
+        """Concurrent first requests only connect once"""
+
+        client = Client(self.endpoint, http=self.discovery, lazy=True)
+
+        def connect():
+            time.sleep(0.01)
+            client._connected = True
+
+        with mock.patch.object(client, '_connect', side_effect=connect) as mocked:
+            threads = [threading.Thread(target=client._ensure_connected) for _ in range(10)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mocked.call_count == 1
+
+    def test_http_pool(self):
+        """A client that makes it's own http objects never lends one to two requests at once, and reuses them"""
+
+        with mock.patch.object(Client, '_new_http', side_effect=lambda: mock.Mock()):
+            client = Client(self.endpoint, engine='native')
+
+            seen = []
+            in_use = set()
+            lock = threading.Lock()
+            barrier = threading.Event()
+
+            def borrow():
+                with client._borrow_http() as http:
+                    with lock:
+                        assert http not in in_use
+                        in_use.add(http)
+                        seen.append(http)
+
+                    barrier.wait(1)
+
+                    with lock:
+                        in_use.remove(http)
+
+            threads = [threading.Thread(target=borrow) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(0.1)
+
+            barrier.set()
+            for thread in threads:
+                thread.join()
+
+            # once given back, they are reused rather than making more
+            with client._borrow_http() as again:
+                pass
+
+        assert len(set(id(http) for http in seen)) == 4
+        assert again in seen
+        assert client._http not in seen
+
+    def test_http_pool_bounded(self):
+        """Only _MAX_IDLE_HTTP http objects are kept, the connections of any others are closed"""
+
+        client = Client(self.endpoint, engine='native')
+        client._MAX_IDLE_HTTP = 1
+
+        first = httplib2.Http()
+        second = httplib2.Http()
+        conn = mock.Mock()
+        second.connections['http:example'] = conn
+
+        client._checkin_http(first)
+        client._checkin_http(second)
+
+        assert client._idle_http == [first]
+        assert conn.close.called
+        assert second.connections == {}
+
+    def test_close(self):
+        """Closing stops the bulk worker threads and closes idle http objects, a closed Client still works"""
+
+        with Client(self.endpoint, engine='native') as client:
+            client._run_bulk(lambda: None, [('foo.service', ())], 2)
+            assert client._workers._pool is not None
+
+            http = httplib2.Http()
+            conn = mock.Mock()
+            http.connections['http:example'] = conn
+            client._checkin_http(http)
+
+        assert client._workers._pool is None
+        assert client._idle_http == []
+        assert conn.close.called
+
+        assert client._run_bulk(lambda: True, [('foo.service', ())], 2).results == {'foo.service': True}
+        client.close()
+
+    def test_http_provided_serialized(self):
+        """Requests through an http object we were given are made one at a time"""
+
+        active = []
+        overlapped = []
+
+        class SlowHttp(object):
+            def request(self, *args, **kwargs):
+                active.append(True)
+                if len(active) > 1:
+                    overlapped.append(True)
+                time.sleep(0.01)
+                active.pop()
+                return (httplib2.Response({'status': '200'}), b'{"machines": []}')
+
+        client = Client(self.endpoint, http=SlowHttp(), engine='native')
+
+        threads = [threading.Thread(target=client._single_request, args=('Machines.List',)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert overlapped == []
+
     def test_init_ssh_tunnel_conflicting_params(self):
         """Providing conflicting parameters raises ValueError"""
 
@@ -268,6 +585,38 @@ class TestFleetClient(unittest.TestCase):
 
         self.assertRaises(APIError, test)
 
+    def test_dispatch_cache(self):
+        """Methods are resolved once, and then served from the dispatch cache"""
+        self.mock(HttpMockSequence([
+            ({'status': '200'}, '{"machines": []}'),
+            ({'status': '200'}, '{"machines": []}')
+        ]))
+
+        self.client._single_request('Machines.List')
+        self.client._single_request('Machines.List')
+
+        stats = self.client.dispatch_stats()
+
+        assert stats['misses'] == 1
+        assert stats['hits'] == 1
+        assert stats['size'] == 1
+        assert stats['hit_rate'] == 0.5
+
+    def test_dispatch_cache_endpoint(self):
+        """Cached methods build URIs with the endpoint already substituted"""
+        request = self.client._resolve_method('Units.Get')(unitName='test.service')
+
+        assert request.uri.startswith(self.endpoint + '/fleet/v1/units/test.service')
+
+    def test_refresh_discovery(self):
+        """Refreshing discovery invalidates the dispatch cache"""
+        self.client._resolve_method('Units.Get')
+
+        self.mock(self._get_discovery())
+        self.client.refresh_discovery()
+
+        assert self.client.dispatch_stats()['size'] == 0
+
     def test_request_with_no_pagination(self):
         """A paging request with no second page works"""
         self.mock(HttpMock(
@@ -297,6 +646,71 @@ class TestFleetClient(unittest.TestCase):
         assert 'machines' in output[0]
         assert 'machines' in output[1]
 
+    def _machine_pages(self, count):
+        pages = []
+        for i in range(count):
+            page = {'machines': [{'id': str(i), 'primaryIP': '198.51.100.99'}]}
+            if i < count - 1:
+                page['nextPageToken'] = str(i + 1)
+            pages.append(({'status': '200'}, json.dumps(page)))
+
+        return HttpMockSequence(pages)
+
+    def test_prefetch_bad_value(self):
+        """A negative prefetch_pages raises ValueError"""
+
+        def test():
+            Client(self.endpoint, http=self.discovery, prefetch_pages=-1)
+
+        self.assertRaises(ValueError, test)
+
+    def test_prefetch_pages(self):
+        """Prefetched pages are yielded in order"""
+        client = Client(self.endpoint, http=self._machine_pages(5), engine='native', prefetch_pages=2)
+
+        assert [x.id for x in client.list_machines()] == ['0', '1', '2', '3', '4']
+
+    def test_prefetch_error(self):
+        """Errors fetching a page in the background are raised to the consumer"""
+        http = HttpMockSequence([
+            ({'status': '200'}, '{"machines":[{"id":"a","primaryIP":"198.51.100.99"}],"nextPageToken": "foo"}'),
+            ({'status': '500'}, '{"error":{"code":500,"message":"oops"}}')
+        ])
+        client = Client(self.endpoint, http=http, engine='native', prefetch_pages=1)
+
+        machines = client.list_machines()
+        assert next(machines).id == 'a'
+
+        self.assertRaises(APIError, lambda: next(machines))
+
+    def test_prefetch_bounded(self):
+        """At most prefetch_pages pages are fetched ahead, and closing the generator stops fetching"""
+        http = self._machine_pages(10)
+        client = Client(self.endpoint, http=http, engine='native', prefetch_pages=2)
+
+        pages = client._request('Machines.List')
+        next(pages)
+
+        # the page we hold, and two read ahead; the fetch thread waits for us before fetching another
+        time.sleep(0.1)
+        assert len(http.request_sequence) == 3
+
+        pages.close()
+        time.sleep(0.1)
+        assert len(http.request_sequence) == 3
+
+    def test_unit_state_table(self):
+        """unit_state_table loads every page"""
+        self.mock(HttpMockSequence([
+            ({'status': '200'}, '{"states":[{"name":"a.service","machineID":"m1"}],"nextPageToken": "foo"}'),
+            ({'status': '200'}, '{"states":[{"name":"b.service","machineID":"m2"}]}')
+        ]))
+
+        table = self.client.unit_state_table()
+
+        assert table.column('name') == ['a.service', 'b.service']
+        assert table.count('machineID') == {'m1': 1, 'm2': 1}
+
     def test_create_unit(self):
         """Create a unit"""
         self.mock(HttpMockSequence([
@@ -314,6 +728,236 @@ class TestFleetClient(unittest.TestCase):
         assert unit
         assert unit.name == 'test.service'
 
+    def _written_unit_http(self, desired_state='launched'):
+        return HttpMockSequence([
+            ({'status': '204'}, None),
+            ({'status': '200'}, '{"currentState":"launched","desiredState":"%s","machineID":'
+                                '"b4104f4b83fd48b2acc16a085b0ec2ce","name":"test.service","options":'
+                                '[{"name":"ExecStart","section":"Service","value":"/usr/bin/sleep 1d"}]}'
+                                % desired_state)
+        ])
+
+    def test_create_unit_no_read_back(self):
+        """With read_back=False the unit isn't fetched until a field fleet fills in is accessed"""
+        http = self._written_unit_http()
+        self.mock(http)
+
+        unit = self.client.create_unit(
+            'test.service',
+            Unit(from_file=os.path.join(self._BASE_DIR, 'fixtures/test.service')),
+            read_back=False
+        )
+
+        assert unit.name == 'test.service'
+        assert unit.desiredState == 'launched'
+        assert unit.options == [{'section': 'Service', 'name': 'ExecStart', 'value': '/usr/bin/sleep 1d'}]
+        assert len(http._iterable) == 1
+
+        assert unit.currentState == 'launched'
+        assert 'machineID' in unit
+        assert len(http._iterable) == 0
+
+    def test_read_back_client_default(self):
+        """read_back can be turned off for the client, and back on per call"""
+        client = Client(self.endpoint, http=self._get_discovery(), read_back=False)
+
+        http = client._http = self._written_unit_http('inactive')
+        unit = client.set_unit_desired_state('test.service', 'inactive')
+
+        assert unit.desiredState == 'inactive'
+        assert len(http._iterable) == 1
+
+        # we didn't know the options, so asking for them fetches the unit
+        assert str(unit) == '[Service]\nExecStart=/usr/bin/sleep 1d'
+        assert len(http._iterable) == 0
+
+        http = client._http = self._written_unit_http('inactive')
+        client.set_unit_desired_state('test.service', 'inactive', read_back=True)
+
+        assert len(http._iterable) == 0
+
+    def test_no_read_back_missing_field(self):
+        """Fields fleet doesn't have still raise once the unit is fetched"""
+        http = HttpMockSequence([
+            ({'status': '204'}, None),
+            ({'status': '200'}, '{"desiredState":"inactive","name":"test.service","options":[]}')
+        ])
+        self.mock(http)
+
+        unit = self.client.set_unit_desired_state('test.service', 'inactive', read_back=False)
+
+        self.assertRaises(KeyError, lambda: unit.machineID)
+        self.assertRaises(KeyError, lambda: unit.currentState)
+        assert len(http._iterable) == 0
+
+    def test_create_units(self):
+        """Units are created concurrently, and failures don't stop the batch"""
+        http = RoutingHttp({
+            ('PUT', 'a.service'): ('204', None),
+            ('PUT', 'b.service'): ('204', None),
+            ('PUT', 'bad.service'): ('409', '{"error": {"code": 409, "message": "options field empty"}}'),
+        })
+        self.mock(http)
+
+        unit = Unit(from_file=os.path.join(self._BASE_DIR, 'fixtures/test.service'))
+
+        result = self.client.create_units(
+            {'a.service': unit, 'b.service': unit, 'bad.service': unit},
+            concurrency=3
+        )
+
+        assert sorted(result.results) == ['a.service', 'b.service']
+        assert result.results['a.service'].name == 'a.service'
+        assert result.results['a.service'].options == unit.options
+
+        assert list(result.errors) == ['bad.service']
+        assert isinstance(result.errors['bad.service'], APIError)
+        assert result.errors['bad.service'].code == 409
+
+        # no read back by default
+        assert sorted(http.requests) == [('PUT', 'a.service'), ('PUT', 'b.service'), ('PUT', 'bad.service')]
+
+    def test_create_units_pairs(self):
+        """create_units accepts (name, unit) pairs"""
+        self.mock(RoutingHttp({('PUT', 'a.service'): ('204', None)}))
+
+        result = self.client.create_units([('a.service', Unit())], concurrency=1)
+
+        assert result.ok
+        assert list(result.results) == ['a.service']
+
+    def test_set_units_desired_state(self):
+        """Units are updated by name or object"""
+        self.mock(RoutingHttp({
+            ('PUT', 'a.service'): ('204', None),
+            ('PUT', 'b.service'): ('204', None),
+        }))
+
+        result = self.client.set_units_desired_state(
+            ['a.service', Unit(client=self.client, data={'name': 'b.service', 'options': []}), 'missing.service'],
+            'inactive'
+        )
+
+        assert sorted(result.results) == ['a.service', 'b.service']
+        assert result.results['b.service'].desiredState == 'inactive'
+        assert list(result.errors) == ['missing.service']
+
+    def test_set_units_desired_state_bad(self):
+        """ValueError is raised for an invalid state before anything is sent"""
+        http = RoutingHttp({})
+        self.mock(http)
+
+        def test():
+            self.client.set_units_desired_state(['a.service'], 'invalid-state')
+
+        self.assertRaises(ValueError, test)
+        assert http.requests == []
+
+    def test_destroy_units(self):
+        """Units are deleted, and missing ones reported"""
+        self.mock(RoutingHttp({('DELETE', 'a.service'): ('204', None)}))
+
+        result = self.client.destroy_units(['a.service', 'missing.service'])
+
+        assert result.results == {'a.service': True}
+        assert result.errors['missing.service'].code == 404
+
+    def test_apply(self):
+        """apply() only sends the changes needed"""
+        http = RoutingHttp({
+            ('GET', 'units'): ('200', '{"units": ['
+                                      '{"name": "same.service", "desiredState": "launched", "options": '
+                                      '[{"section": "Service", "name": "ExecStart", "value": "/bin/a"}]}, '
+                                      '{"name": "changed.service", "desiredState": "launched", "options": '
+                                      '[{"section": "Service", "name": "ExecStart", "value": "/bin/b"}]}]}'),
+            ('DELETE', 'changed.service'): ('204', None),
+            ('PUT', 'changed.service'): ('204', None),
+            ('PUT', 'new.service'): ('204', None),
+        })
+        self.mock(http)
+
+        commands = {'same.service': '/bin/a', 'changed.service': '/bin/b2', 'new.service': '/bin/c'}
+        desired = dict(
+            (name, Unit(options=[{'section': 'Service', 'name': 'ExecStart', 'value': command}]))
+            for (name, command) in commands.items()
+        )
+
+        plan = self.client.apply(desired, dry_run=True)
+
+        assert repr(plan) == '<ApplyPlan: 1 create, 1 replace, 0 state, 0 delete, 1 unchanged>'
+        assert http.requests == [('GET', 'units')]
+
+        plan = self.client.apply(desired, concurrency=2)
+
+        assert plan.ok
+        assert sorted(http.requests[2:]) == [
+            ('DELETE', 'changed.service'), ('PUT', 'changed.service'), ('PUT', 'new.service')
+        ]
+        assert http.requests.index(('DELETE', 'changed.service')) < http.requests.index(('PUT', 'changed.service'))
+
+    def test_response_cache(self):
+        """Reads are cached, and writes through the client invalidate them"""
+        unit = '{"name": "foo.service", "desiredState": "launched", "options": ' \
+               '[{"section": "Service", "name": "ExecStart", "value": "/bin/a"}]}'
+
+        http = RoutingHttp({
+            ('GET', 'foo.service'): ('200', unit),
+            ('GET', 'units'): ('200', '{"units": [' + unit + ']}'),
+            ('GET', 'machines'): ('200', '{"machines": [{"id": "a", "metadata": {"role": "web"}}]}'),
+            ('PUT', 'foo.service'): ('204', None),
+        })
+        self.mock(http)
+        self.client._response_cache = ResponseCache()
+
+        for _ in range(2):
+            assert self.client.get_unit('foo.service').name == 'foo.service'
+            assert [x.name for x in self.client.list_units()] == ['foo.service']
+            assert [x.id for x in self.client.list_machines()] == ['a']
+
+        assert http.requests == [('GET', 'foo.service'), ('GET', 'units'), ('GET', 'machines')]
+
+        # objects are copies, changing one doesn't change the cache
+        self.client.get_unit('foo.service').options[0]['value'] = '/bin/b'
+        next(self.client.list_machines()).metadata['role'] = 'db'
+
+        assert self.client.get_unit('foo.service').options[0]['value'] == '/bin/a'
+        assert next(self.client.list_machines()).metadata == {'role': 'web'}
+
+        self.client.set_unit_desired_state('foo.service', 'launched', read_back=True)
+
+        assert http.requests[3:] == [('PUT', 'foo.service'), ('GET', 'foo.service')]
+
+        # the read back was cached, the listing wasn't but is now
+        self.client.get_unit('foo.service')
+        list(self.client.list_units())
+        list(self.client.list_units())
+
+        assert http.requests[5:] == [('GET', 'units')]
+
+        # failed writes invalidate too
+        def test():
+            self.client.destroy_unit('foo.service')
+
+        self.assertRaises(APIError, test)
+        self.client.get_unit('foo.service')
+
+        assert http.requests[6:] == [('DELETE', 'foo.service'), ('GET', 'foo.service')]
+
+    def test_watch_unit_states(self):
+        """watch_unit_states() lists unit states and reports them as events"""
+        self.mock(RoutingHttp({
+            ('GET', 'state'): ('200', '{"states": [{"name": "foo.service", "machineID": "a", "hash": "h", '
+                                      '"systemdActiveState": "active", "systemdSubState": "running"}]}'),
+        }))
+
+        watcher = self.client.watch_unit_states(machine_id='a')
+
+        (event,) = watcher.poll()
+
+        assert (event.type, event.name, event.machine_id) == ('added', 'foo.service', 'a')
+        assert event.state.systemdSubState == 'running'
+        assert watcher.poll() == []
+
     def test_set_unit_desired_state_bad(self):
         """ValueError is raised when an invalid state is passed"""
 
@@ -425,6 +1069,37 @@ class TestFleetClient(unittest.TestCase):
         assert 'hash' in unitstates[0]
         assert 'hash' in unitstates[1]
 
+    def _unit_pages(self):
+        page = ('{"units":[{"currentState":"launched","desiredState":"launched","machineID":'
+                '"b4104f4b83fd48b2acc16a085b0ec2ce","name":"%s","options":'
+                '[{"name":"ExecStart","section":"Service","value":"/usr/bin/sleep 1d"}]}]%s}')
+
+        return HttpMockSequence([
+            ({'status': '200'}, page % ('foo.service', ', "nextPageToken": "foo"')),
+            ({'status': '200'}, page % ('bar.service', ''))
+        ])
+
+    def test_list_units_interned(self):
+        """Repeated values in listings are shared between objects"""
+        self.mock(self._unit_pages())
+
+        (foo, bar) = list(self.client.list_units())
+
+        assert foo.machineID is bar.machineID
+        assert foo.desiredState is foo.currentState
+        assert foo.options[0]['section'] is bar.options[0]['section']
+        assert foo.options[0]['name'] is bar.options[0]['name']
+
+    def test_list_units_not_interned(self):
+        """intern_strings=False leaves decoded values alone"""
+        client = Client(self.endpoint, http=self._get_discovery(), intern_strings=False)
+        client._http = self._unit_pages()
+
+        (foo, bar) = list(client.list_units())
+
+        assert foo.machineID == bar.machineID
+        assert foo.machineID is not bar.machineID
+
     def test_list_machines(self):
         """List Machines"""
         self.mock(HttpMock(
@@ -0,0 +1,159 @@
+import unittest
+
+import json
+
+from apiclient.http import HttpMockSequence
+import googleapiclient.errors
+
+from ..client import Client
+from ..engine import RequestEngine, Route
+from ..errors import APIError
+
+
+class TestRoute(unittest.TestCase):
+    def test_path_params(self):
+        """Path parameters are parsed from the template"""
+        route = Route('GET', 'units/{unitName}')
+
+        assert route.path_params == ('unitName',)
+
+    def test_build_quotes_path(self):
+        """Path parameters are escaped"""
+        route = Route('GET', 'units/{unitName}')
+
+        (url, body) = route.build('http://foo/fleet/v1/', {'unitName': 'foo@1.service'})
+
+        assert url == 'http://foo/fleet/v1/units/foo%401.service'
+        assert body is None
+
+    def test_build_query(self):
+        """Query parameters with a value of None are not sent"""
+        route = Route('GET', 'state', ('nextPageToken', 'unitName', 'machineID'))
+
+        (url, body) = route.build('http://foo/fleet/v1/', {'unitName': 'foo.service', 'machineID': None})
+
+        assert url == 'http://foo/fleet/v1/state?unitName=foo.service'
+
+    def test_build_body(self):
+        """The body is serialized as JSON"""
+        route = Route('PUT', 'units/{unitName}', has_body=True)
+
+        (url, body) = route.build('http://foo/fleet/v1/', {'unitName': 'foo.service', 'body': {'a': 'b'}})
+
+        assert json.loads(body) == {'a': 'b'}
+
+    def test_build_missing_param(self):
+        """TypeError is raised if a path parameter is missing"""
+        route = Route('GET', 'units/{unitName}')
+
+        def test():
+            route.build('http://foo/fleet/v1/', {})
+
+        self.assertRaises(TypeError, test)
+
+    def test_build_unknown_param(self):
+        """TypeError is raised for unknown parameters"""
+        route = Route('GET', 'machines', ('nextPageToken',))
+
+        def test():
+            route.build('http://foo/fleet/v1/', {'foo': 'bar'})
+
+        self.assertRaises(TypeError, test)
+
+
+class TestRequestEngine(unittest.TestCase):
+    def setUp(self):
+        self.engine = RequestEngine('http://198.51.100.23:9160')
+
+    def test_request(self):
+        """Requests are sent to the right URL with the right method, and the response is decoded"""
+        http = HttpMockSequence([
+            ({'status': '200'}, '{"machines": []}')
+        ])
+
+        assert self.engine.request(http, 'Machines.List') == {'machines': []}
+
+        (uri, method, body, headers) = http.request_sequence[0]
+
+        assert uri == 'http://198.51.100.23:9160/fleet/v1/machines'
+        assert method == 'GET'
+
+    def test_no_content(self):
+        """A 204 returns an empty dict"""
+        http = HttpMockSequence([
+            ({'status': '204'}, None)
+        ])
+
+        assert self.engine.request(http, 'Units.Delete', unitName='foo.service') == {}
+
+        (uri, method, body, headers) = http.request_sequence[0]
+
+        assert method == 'DELETE'
+
+    def test_error(self):
+        """HttpError is raised for error responses"""
+        http = HttpMockSequence([
+            ({'status': '404'}, '{"error":{"code":404,"message":"unit does not exist"}}')
+        ])
+
+        def test():
+            self.engine.request(http, 'Units.Get', unitName='foo.service')
+
+        self.assertRaises(googleapiclient.errors.HttpError, test)
+
+    def test_unknown_method(self):
+        """AttributeError is raised for methods fleet doesn't have"""
+
+        def test():
+            self.engine.request(HttpMockSequence([]), 'Units.Frobnicate')
+
+        self.assertRaises(AttributeError, test)
+
+
+class TestNativeClient(unittest.TestCase):
+    def setUp(self):
+        self.endpoint = 'http://198.51.100.23:9160'
+
+    def test_bad_engine(self):
+        """ValueError is raised for unknown engines"""
+
+        def test():
+            Client(self.endpoint, http=HttpMockSequence([]), engine='magic')
+
+        self.assertRaises(ValueError, test)
+
+    def test_no_discovery(self):
+        """The native engine does not fetch the discovery document"""
+
+        # an empty sequence will raise if any request is made
+        client = Client(self.endpoint, http=HttpMockSequence([]), engine='native')
+
+        assert client._service is None
+
+    def test_list_units(self):
+        """Pagination works with the native engine"""
+        http = HttpMockSequence([
+            ({'status': '200'}, '{"units":[{"desiredState":"launched","name":"foo.service","options":[]}], '
+                                '"nextPageToken": "foo"}'),
+            ({'status': '200'}, '{"units":[{"desiredState":"launched","name":"bar.service","options":[]}]}')
+        ])
+
+        client = Client(self.endpoint, http=http, engine='native')
+
+        units = list(client.list_units())
+
+        assert [x.name for x in units] == ['foo.service', 'bar.service']
+        assert http.request_sequence[1][0].endswith('/fleet/v1/units?nextPageToken=foo')
+
+    def test_api_error(self):
+        """APIError is raised for error responses"""
+        http = HttpMockSequence([
+            ({'status': '404'}, '{"error":{"code":404,"message":"unit does not exist"}}')
+        ])
+
+        client = Client(self.endpoint, http=http, engine='native')
+
+        def test():
+            client.get_unit('foo.service')
+
+        self.assertRaises(APIError, test)
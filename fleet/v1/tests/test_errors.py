@@ -1,7 +1,7 @@
 import unittest
 import uuid, random
 
-from ..errors import APIError
+from ..errors import APIError, UnitFileError
 
 
 class TestAPIError(unittest.TestCase):
@@ -24,3 +24,22 @@ class TestAPIError(unittest.TestCase):
 
         assert str(test_code) in repr(ae)
         assert test_message in repr(ae)
+
+
+class TestUnitFileError(unittest.TestCase):
+
+    def test_single(self):
+        """A single error is reported with it's line number"""
+        ufe = UnitFileError([(3, 'Malformed line in section Service: foo')])
+
+        assert isinstance(ufe, ValueError)
+        assert str(ufe) == 'Unable to parse unit file; Malformed line in section Service: foo (line: 3)'
+
+    def test_multiple(self):
+        """Every error is included"""
+        ufe = UnitFileError([(1, 'first'), (7, 'second')])
+
+        assert ufe.errors == [(1, 'first'), (7, 'second')]
+        assert '2 errors' in str(ufe)
+        assert 'first (line: 1)' in str(ufe)
+        assert 'second (line: 7)' in str(ufe)
@@ -2,7 +2,7 @@ import unittest
 
 import uuid, json
 
-from ..objects import FleetObject
+from ..objects import FleetObject, CompactFleetObject, UnitState
 
 
 class TestFleetObject(unittest.TestCase):
@@ -99,3 +99,64 @@ class TestFleetObject(unittest.TestCase):
         fo = FleetObject(data=test_data)
 
         assert test_data == fo.as_dict()
+
+
+class Compact(CompactFleetObject):
+    _FIELDS = __slots__ = ('foo', 'bar')
+
+
+class TestCompactFleetObject(unittest.TestCase):
+    """CompactFleetObject stores known fields in slots, but behaves like FleetObject"""
+
+    def test_access(self):
+        """Fields are available as attributes and keys"""
+        co = Compact(data={'foo': 1, 'baz': 2})
+
+        assert co.foo == 1
+        assert co['foo'] == 1
+        assert co.baz == 2
+        assert co['baz'] == 2
+
+        assert 'foo' in co
+        assert 'baz' in co
+        assert 'bar' not in co
+
+    def test_missing(self):
+        """Missing fields raise KeyError, as they do for FleetObject"""
+        co = Compact(data={'foo': 1})
+
+        self.assertRaises(KeyError, lambda: co.bar)
+        self.assertRaises(KeyError, lambda: co['bar'])
+        self.assertRaises(KeyError, lambda: co.baz)
+
+    def test_as_dict(self):
+        """as_dict includes known and unknown fields"""
+        data = {'foo': 1, 'bar': 2, 'baz': 3}
+
+        co = Compact(data=data)
+
+        assert co.as_dict() == data
+        assert json.loads(str(co)) == data
+
+    def test_update_data(self):
+        """Replacing _data replaces all fields"""
+        co = Compact(data={'foo': 1, 'baz': 2})
+        co._update('_data', {'bar': 3})
+
+        assert co.as_dict() == {'bar': 3}
+
+    def test_read_only(self):
+        """Fields can't be modified"""
+        co = Compact(data={'foo': 1})
+
+        def test():
+            co.foo = 2
+
+        self.assertRaises(AttributeError, test)
+
+    def test_compact(self):
+        """No per-instance dict is created"""
+        state = UnitState(data={'name': 'foo.service', 'hash': 'abc', 'machineID': 'm1'})
+
+        assert isinstance(state, FleetObject)
+        assert state.__dict__ == {}
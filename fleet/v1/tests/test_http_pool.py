@@ -0,0 +1,254 @@
+import unittest
+import mock
+
+import os, shutil, socket, tempfile, threading  # NOQA
+
+import httplib2
+
+from ...http import SocketPool, PooledUnixConnection, get_unix_socket_pool, release_connections
+from ..client import Client
+
+try:  # pragma: no cover
+    # python 2
+    import urllib
+    quote = urllib.quote
+except AttributeError:  # pragma: no cover
+    # python 3
+    import urllib.parse
+    quote = urllib.parse.quote
+
+
+class SocketPairFactory(object):
+    """Create connected socket pairs, keeping the far end so tests can poke at it"""
+    def __init__(self):
+        self.peers = []
+
+    def __call__(self):
+        (ours, theirs) = socket.socketpair()
+        self.peers.append(theirs)
+        return ours
+
+
+def serve_keep_alive(conn):
+    """Answer every request made on conn with an empty JSON object, until it's closed"""
+    buf = b''
+    while True:
+        try:
+            data = conn.recv(4096)
+        except socket.error:
+            return
+        if not data:
+            return
+
+        buf += data
+        while b'\r\n\r\n' in buf:
+            (_, buf) = buf.split(b'\r\n\r\n', 1)
+            conn.sendall(b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 2\r\n\r\n{}')
+
+
+class KeepAliveUnixServer(object):
+    """A tiny HTTP/1.1 server on a unix domain socket that counts connections"""
+    def __init__(self, path):
+        self.accepted = 0
+
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.bind(path)
+        self.sock.listen(5)
+
+        thread = threading.Thread(target=self._accept)
+        thread.daemon = True
+        thread.start()
+
+    def _accept(self):
+        while True:
+            try:
+                (conn, _) = self.sock.accept()
+            except socket.error:
+                return
+
+            self.accepted += 1
+
+            thread = threading.Thread(target=serve_keep_alive, args=(conn,))
+            thread.daemon = True
+            thread.start()
+
+    def close(self):
+        self.sock.close()
+
+
+class TestSocketPool(unittest.TestCase):
+    def setUp(self):
+        self.factory = SocketPairFactory()
+        self.pool = SocketPool(connect=self.factory)
+
+    def tearDown(self):
+        self.pool.close()
+        for peer in self.factory.peers:
+            peer.close()
+
+    def test_reuse(self):
+        """A socket that is checked in is reused"""
+        sock = self.pool.checkout()
+        self.pool.checkin(sock)
+
+        assert self.pool.checkout() is sock
+        assert self.pool.stats['created'] == 1
+        assert self.pool.stats['reused'] == 1
+
+    def test_peer_closed(self):
+        """A socket closed by the other end fails it's health check and is replaced"""
+        sock = self.pool.checkout()
+        self.pool.checkin(sock)
+
+        self.factory.peers[0].close()
+
+        assert self.pool.checkout() is not sock
+        assert self.pool.stats['discarded'] == 1
+        assert self.pool.stats['created'] == 2
+
+    def test_unexpected_data(self):
+        """A socket with unread data fails it's health check"""
+        sock = self.pool.checkout()
+        self.pool.checkin(sock)
+
+        self.factory.peers[0].sendall(b'garbage')
+
+        assert self.pool.checkout() is not sock
+
+    def test_idle_timeout(self):
+        """Sockets idle for longer than idle_timeout are evicted"""
+        self.pool.idle_timeout = 0
+
+        sock = self.pool.checkout()
+        self.pool.checkin(sock)
+
+        assert self.pool.checkout() is not sock
+        assert self.pool.stats['evicted'] == 1
+
+    def test_max_size(self):
+        """Sockets that don't fit in the pool are closed"""
+        self.pool.max_size = 1
+
+        socks = [self.pool.checkout(), self.pool.checkout()]
+        for sock in socks:
+            self.pool.checkin(sock)
+
+        assert len(self.pool) == 1
+
+    def test_max_active(self):
+        """checkout blocks when max_active sockets are checked out"""
+        pool = SocketPool(connect=self.factory, max_active=1)
+        sock = pool.checkout()
+
+        result = []
+        thread = threading.Thread(target=lambda: result.append(pool.checkout()))
+        thread.daemon = True
+        thread.start()
+        thread.join(0.1)
+
+        assert result == []
+
+        pool.checkin(sock)
+        thread.join(1)
+
+        assert result == [sock]
+
+    def test_checkout_connect(self):
+        """A connect passed to checkout is used instead of the pool's"""
+        other = SocketPairFactory()
+
+        sock = self.pool.checkout(connect=other)
+
+        assert len(other.peers) == 1
+        assert len(self.factory.peers) == 0
+        assert self.pool.stats['created'] == 1
+
+        sock.close()
+        other.peers[0].close()
+
+    def test_discard(self):
+        """Discarded sockets are not reused"""
+        sock = self.pool.checkout()
+        self.pool.discard(sock)
+
+        assert len(self.pool) == 0
+
+
+class TestPooledUnixConnection(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'fleet.sock')
+        self.server = KeepAliveUnixServer(self.path)
+        self.endpoint = 'http+unix://' + quote(self.path, safe='')
+
+    def tearDown(self):
+        self.server.close()
+        get_unix_socket_pool(self.path).close()
+        shutil.rmtree(self.tmpdir)
+
+    def test_registered(self):
+        """http+unix URLs use the pooled connection"""
+        assert httplib2.SCHEME_TO_CONNECTION['http+unix'] is PooledUnixConnection
+
+    def test_keep_alive_across_http_objects(self):
+        """Connections are shared between http objects through the pool"""
+        for _ in range(3):
+            http = httplib2.Http()
+
+            (response, content) = http.request(self.endpoint + '/fleet/v1/machines')
+            assert response.status == 200
+
+            http.close()
+
+        assert self.server.accepted == 1
+        assert get_unix_socket_pool(self.path).stats['reused'] == 2
+
+    def test_release_connections(self):
+        """release_connections checks sockets back in once responses have been read"""
+        http = httplib2.Http()
+
+        for _ in range(3):
+            (response, content) = http.request(self.endpoint + '/fleet/v1/machines')
+            assert response.status == 200
+
+            release_connections(http)
+            assert len(get_unix_socket_pool(self.path)) == 1
+
+        assert self.server.accepted == 1
+        assert get_unix_socket_pool(self.path).stats['reused'] == 2
+
+    def test_timeout_before_connect(self):
+        """New sockets have their timeout set before they connect"""
+        conn = PooledUnixConnection(quote(self.path, safe=''), timeout=5)
+
+        with mock.patch('socket.socket') as mocked:
+            conn.connect()
+
+        calls = [name for (name, _, _) in mocked.return_value.mock_calls]
+        assert calls == ['settimeout', 'connect', 'settimeout']
+        assert mocked.return_value.settimeout.call_args_list[0] == mock.call(5)
+
+    def test_client_reuses_sockets(self):
+        """Requests made through a Client from many threads share a few sockets"""
+        client = Client(self.endpoint, engine='native')
+
+        errors = []
+
+        def list_machines():
+            try:
+                for _ in range(3):
+                    assert list(client.list_machines()) == []
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=list_machines) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = get_unix_socket_pool(self.path).stats
+
+        assert errors == []
+        assert stats['created'] <= 8
+        assert stats['reused'] >= 24 - stats['created']
@@ -1,6 +1,7 @@
 import unittest
+import mock
 
-from ...http import HTTPOverSSHTunnel, SSHTunnelProxyInfo
+from ...http import HTTPOverSSHTunnel, SSHTunnelProxyInfo, ChannelPool
 
 
 class TestHttpSSHTunnel(unittest.TestCase):
@@ -29,3 +30,77 @@ class TestHttpSSHTunnel(unittest.TestCase):
             HTTPOverSSHTunnel('foo', proxy_info='lolz')
 
         self.assertRaises(ValueError, test)
+
+    def test_release_reusable(self):
+        """A socket that can be reused is released back to it's pool on close"""
+        sock = mock.Mock()
+
+        h = HTTPOverSSHTunnel('foo', proxy_info=SSHTunnelProxyInfo(sock))
+        h._reusable = True
+        h.close()
+
+        assert sock.release.called
+        assert not sock.close.called
+        assert h.sock is None
+
+    def test_close_not_reusable(self):
+        """A socket in an unknown state is closed rather than released"""
+        sock = mock.Mock()
+
+        h = HTTPOverSSHTunnel('foo', proxy_info=SSHTunnelProxyInfo(sock))
+        h.close()
+
+        assert sock.close.called
+        assert not sock.release.called
+
+    def test_reconnect(self):
+        """connect() asks a callable proxy_info for a new socket after close"""
+        socks = [mock.Mock(), mock.Mock()]
+
+        def test(_):
+            return SSHTunnelProxyInfo(socks.pop(0))
+
+        h = HTTPOverSSHTunnel('foo', proxy_info=test)
+        h.close()
+        h.connect()
+
+        assert h.sock is not None
+        assert socks == []
+
+
+class TestChannelPool(unittest.TestCase):
+    def _channel(self, **kwargs):
+        channel = mock.Mock(closed=False, eof_received=False, eof_sent=False)
+        channel.recv_ready.return_value = False
+        channel.get_transport.return_value.is_active.return_value = True
+
+        for key, value in kwargs.items():
+            setattr(channel, key, value)
+
+        return channel
+
+    def test_healthy(self):
+        """An open, idle channel on an active transport can be reused"""
+        assert ChannelPool(connect=None).is_healthy(self._channel())
+
+    def test_closed(self):
+        """Closed channels can't be reused"""
+        assert not ChannelPool(connect=None).is_healthy(self._channel(closed=True))
+
+    def test_eof_received(self):
+        """Channels the remote end has half-closed can't be reused"""
+        assert not ChannelPool(connect=None).is_healthy(self._channel(eof_received=True))
+
+    def test_unexpected_data(self):
+        """Channels with unread data can't be reused"""
+        channel = self._channel()
+        channel.recv_ready.return_value = True
+
+        assert not ChannelPool(connect=None).is_healthy(channel)
+
+    def test_transport_inactive(self):
+        """Channels on a dead transport can't be reused"""
+        channel = self._channel()
+        channel.get_transport.return_value.is_active.return_value = False
+
+        assert not ChannelPool(connect=None).is_healthy(channel)
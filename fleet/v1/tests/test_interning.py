@@ -0,0 +1,99 @@
+import unittest
+
+from ..interning import Interner
+
+
+def fresh(value):
+    """Return a copy of value that is not the same object"""
+    return ''.join(list(value))
+
+
+class TestInterner(unittest.TestCase):
+    def setUp(self):
+        self.interner = Interner()
+
+    def test_intern(self):
+        """Equal strings are replaced with the first copy seen"""
+        first = fresh('launched')
+
+        assert self.interner.intern(first) is first
+        assert self.interner.intern(fresh('launched')) is first
+        assert len(self.interner) == 1
+
+    def test_intern_non_string(self):
+        """Values other than strings are returned unchanged"""
+        assert self.interner.intern(None) is None
+        assert self.interner.intern(42) == 42
+        assert len(self.interner) == 0
+
+    def test_max_size(self):
+        """Once full, new strings are returned as is"""
+        interner = Interner(max_size=1)
+
+        a = interner.intern(fresh('a'))
+        b = fresh('b')
+
+        assert interner.intern(b) is b
+        assert interner.intern(fresh('a')) is a
+        assert len(interner) == 1
+
+    def test_unit(self):
+        """A unit's states, machine ID, and option sections and names are interned"""
+        def unit():
+            return {
+                'name': fresh('foo.service'),
+                'desiredState': fresh('launched'),
+                'currentState': fresh('launched'),
+                'machineID': fresh('abc'),
+                'options': [{'section': fresh('Service'), 'name': fresh('ExecStart'), 'value': fresh('/bin/true')}]
+            }
+
+        (a, b) = (self.interner.unit(unit()), self.interner.unit(unit()))
+
+        for field in ('desiredState', 'currentState', 'machineID'):
+            assert a[field] is b[field]
+
+        assert a['options'][0]['section'] is b['options'][0]['section']
+        assert a['options'][0]['name'] is b['options'][0]['name']
+
+        # these are mostly unique, we leave them be
+        assert a['name'] is not b['name']
+        assert a['options'][0]['value'] is not b['options'][0]['value']
+
+    def test_unit_without_options(self):
+        """Units missing fields are handled"""
+        assert self.interner.unit({'name': 'foo.service'}) == {'name': 'foo.service'}
+
+    def test_unit_state(self):
+        """A unit state's machine ID and systemd states are interned"""
+        def state():
+            return {
+                'name': fresh('foo.service'),
+                'hash': fresh('dd401fa7'),
+                'machineID': fresh('abc'),
+                'systemdLoadState': fresh('loaded'),
+                'systemdActiveState': fresh('active'),
+                'systemdSubState': fresh('running')
+            }
+
+        (a, b) = (self.interner.unit_state(state()), self.interner.unit_state(state()))
+
+        for field in Interner.UNIT_STATE_FIELDS:
+            assert a[field] is b[field]
+
+        assert a['name'] is not b['name']
+
+    def test_machine(self):
+        """Machine IDs are shared with unit states, and metadata is interned"""
+        state = self.interner.unit_state({'machineID': fresh('abc')})
+
+        machine = self.interner.machine({
+            'id': fresh('abc'),
+            'primaryIP': '198.51.100.23',
+            'metadata': {fresh('region'): fresh('us-east')}
+        })
+        other = self.interner.machine({'id': fresh('def'), 'metadata': {fresh('region'): fresh('us-east')}})
+
+        assert machine['id'] is state['machineID']
+        assert machine['metadata']['region'] is other['metadata']['region']
+        assert [k for k in machine['metadata']][0] is [k for k in other['metadata']][0]
@@ -0,0 +1,112 @@
+import unittest
+
+import os, shutil, tempfile  # NOQA
+
+from ..errors import UnitFileError
+from ..loader import find_unit_files, load_units
+from ..objects import Unit
+
+
+class TestLoadUnits(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+        self.write('foo.service', '[Service]\nExecStart=/usr/bin/sleep 1d\n')
+        self.write('bar@.service', '[Service]\nExecStart=/usr/bin/sleep %i\n')
+        self.write('nested/baz.timer', '[Timer]\nOnCalendar=daily\n')
+        self.write('nested/broken.service', '[Service]\nExecStart\n')
+        self.write('README.md', 'not a unit\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write(self, name, content):
+        path = os.path.join(self.tmpdir, name)
+
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+
+        with open(path, 'w') as fh:
+            fh.write(content)
+
+        return path
+
+    def path(self, name):
+        return os.path.join(self.tmpdir, name)
+
+    def check(self, result):
+        assert sorted(result.units) == ['bar@.service', 'baz.timer', 'foo.service']
+        assert isinstance(result.units['foo.service'], Unit)
+        assert result.units['bar@.service'].options == [
+            {'section': 'Service', 'name': 'ExecStart', 'value': '/usr/bin/sleep %i'}
+        ]
+
+        assert list(result.errors) == [self.path('nested/broken.service')]
+        assert isinstance(result.errors[self.path('nested/broken.service')], UnitFileError)
+        assert result.errors[self.path('nested/broken.service')].errors[0][0] == 2
+
+    def test_find_unit_files(self):
+        """Directories are searched recursively for unit files"""
+        assert find_unit_files(self.tmpdir) == [
+            self.path('bar@.service'), self.path('foo.service'),
+            self.path('nested/baz.timer'), self.path('nested/broken.service')
+        ]
+
+    def test_find_unit_files_glob(self):
+        """Globs and single files are supported"""
+        assert find_unit_files(os.path.join(self.tmpdir, '*.service')) == [
+            self.path('bar@.service'), self.path('foo.service')
+        ]
+        assert find_unit_files(self.path('README.md')) == [self.path('README.md')]
+        assert find_unit_files(self.path('missing.service')) == []
+
+    def test_load_serial(self):
+        """Units load on the calling thread with one worker"""
+        self.check(load_units(self.tmpdir, workers=1))
+
+    def test_load_threads(self):
+        """Units load in a thread pool"""
+        self.check(load_units(self.tmpdir, workers=3))
+
+    def test_load_processes(self):
+        """Units load in a process pool, and errors survive the trip back"""
+        self.check(load_units(self.tmpdir, workers=2, processes=True))
+
+    def test_desired_state(self):
+        """desired_state is applied to every unit"""
+        result = load_units(os.path.join(self.tmpdir, '*.service'), workers=1, desired_state='loaded')
+
+        assert set(x.desiredState for x in result.units.values()) == set(['loaded'])
+
+    def test_duplicate_names(self):
+        """The first file with a name wins, the rest are errors"""
+        self.write('other/foo.service', '[Service]\nExecStart=/bin/true\n')
+
+        result = load_units(self.tmpdir, workers=2)
+
+        assert result.units['foo.service'].options[0]['value'] == '/usr/bin/sleep 1d'
+        assert isinstance(result.errors[self.path('other/foo.service')], ValueError)
+
+    def test_unreadable(self):
+        """Files that can't be read are reported as errors"""
+        self.write('gone.service', '')
+
+        os.chmod(self.path('gone.service'), 0)
+        try:
+            if os.access(self.path('gone.service'), os.R_OK):
+                # root can read anything
+                raise unittest.SkipTest('file is still readable')
+
+            result = load_units(self.path('gone.service'), workers=1)
+        finally:
+            os.chmod(self.path('gone.service'), 0o644)
+
+        assert isinstance(result.errors[self.path('gone.service')], (IOError, OSError))
+
+    def test_bad_workers(self):
+        """ValueError is raised for less than one worker"""
+
+        def test():
+            load_units(self.tmpdir, workers=0)
+
+        self.assertRaises(ValueError, test)
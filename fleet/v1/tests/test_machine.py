@@ -80,3 +80,16 @@ class TestMachine(unittest.TestCase):
 
         assert m.metadata == {"foo": "bar"}
         assert m['metadata'] == {"foo": "bar"}
+
+    def test_data_not_modified(self):
+        """The dict passed to the constructor is not modified"""
+
+        test_obj = {
+            "id": self._id,
+            "primaryIP": self._ip
+        }
+
+        m = Machine(data=test_obj)
+
+        assert m.metadata == {}
+        assert 'metadata' not in test_obj
@@ -0,0 +1,103 @@
+import unittest
+
+from ..errors import RolloutError
+from ..objects import UnitState
+from ..rollout import RollingUpdate, unit_health
+from .helpers import FakeCluster, unit, unit_state
+
+
+class TestUnitHealth(unittest.TestCase):
+    def test_healthy(self):
+        """A unit is healthy when every machine runs the expected version"""
+        assert unit_health([unit_state(hash='a'), unit_state(hash='a', machine='b')], 'a') == 'healthy'
+
+    def test_starting(self):
+        """A unit is starting if it isn't reported, is reporting the old version, or isn't running yet"""
+        assert unit_health([], 'a') is None
+        assert unit_health([unit_state(hash='old')], 'a') is None
+
+        starting = unit_state(hash='a', active='activating', sub='start', machine='b')
+        assert unit_health([unit_state(hash='a'), starting], 'a') is None
+
+    def test_failed(self):
+        """A unit has failed if the expected version failed anywhere, but not if the old version did"""
+        failed = unit_state(hash='a', active='failed', sub='failed', machine='b')
+        assert unit_health([unit_state(hash='a'), failed], 'a') == 'failed'
+        assert unit_health([unit_state(hash='old', active='failed', sub='failed')], 'a') is None
+
+    def test_partial(self):
+        """States missing fields fleet hasn't filled in yet are still starting"""
+        partial = UnitState(data={'name': 'foo.service', 'machineID': 'm', 'hash': 'a'})
+
+        assert unit_health([partial], 'a') is None
+        assert unit_health([UnitState(data={'name': 'foo.service', 'machineID': 'm'})], 'a') is None
+
+
+class TestRollingUpdate(unittest.TestCase):
+    def units(self, count=5):
+        return [('app-{0}.service'.format(i), unit('/bin/app {0}'.format(i))) for i in range(count)]
+
+    def test_rollout(self):
+        """Every unit is replaced, no more than max_unavailable at a time, with shared polls"""
+        cluster = FakeCluster()
+        cluster.units['app-0.service'] = ['old', 0]
+
+        result = RollingUpdate(cluster, self.units(), max_unavailable=2, poll_interval=0).run()
+
+        assert result.ok
+        assert not result.aborted
+        assert sorted(result.succeeded) == ['app-{0}.service'.format(i) for i in range(5)]
+
+        assert cluster.peak_down == 2
+
+        # a poll per unit would take 10
+        assert result.polls == len(cluster.polls) == 6
+        assert repr(result).startswith('<RolloutResult: 5 succeeded, 0 failed, 0 skipped in ')
+
+    def test_single_unit_filtered(self):
+        """With one unit in flight, states are only listed for that unit"""
+        cluster = FakeCluster(polls_to_start=1)
+
+        RollingUpdate(cluster, self.units(2), poll_interval=0).run()
+
+        assert cluster.polls == ['app-0.service', 'app-1.service']
+
+    def test_abort(self):
+        """No more units are started once more than max_failures have failed"""
+        cluster = FakeCluster(failing=('app-1.service',))
+
+        result = RollingUpdate(cluster, self.units(), max_unavailable=2, poll_interval=0).run()
+
+        assert result.aborted
+        assert not result.ok
+        assert list(result.errors) == ['app-1.service']
+        assert isinstance(result.errors['app-1.service'], RolloutError)
+        assert str(result.errors['app-1.service']) == 'app-1.service: failed'
+
+        # app-0 was already in flight so it was seen through
+        assert result.succeeded == ['app-0.service']
+        assert result.skipped == ['app-2.service', 'app-3.service', 'app-4.service']
+
+    def test_max_failures(self):
+        """Failures up to max_failures are tolerated"""
+        cluster = FakeCluster(failing=('app-1.service',))
+
+        result = RollingUpdate(cluster, self.units(), max_failures=1, poll_interval=0).run()
+
+        assert not result.aborted
+        assert len(result.succeeded) == 4
+        assert list(result.errors) == ['app-1.service']
+
+    def test_timeout(self):
+        """Units that don't come up in time are failed"""
+        cluster = FakeCluster(polls_to_start=100)
+
+        result = RollingUpdate(cluster, self.units(1), timeout=0, poll_interval=0).run()
+
+        assert str(result.errors['app-0.service']) == 'app-0.service: timed out after 0s'
+        assert result.errors['app-0.service'].states[0].systemdActiveState == 'activating'
+
+    def test_bad_args(self):
+        """ValueError is raised for invalid limits"""
+        self.assertRaises(ValueError, RollingUpdate, FakeCluster(), [], max_unavailable=0)
+        self.assertRaises(ValueError, RollingUpdate, FakeCluster(), [], max_failures=-1)
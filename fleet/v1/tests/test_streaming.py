@@ -0,0 +1,179 @@
+import unittest
+
+import json, os, shutil, tempfile  # NOQA
+
+from ..client import Client
+from ..errors import APIError
+from ..streaming import JSONArrayStream
+from ...http import get_unix_socket_pool
+
+from .test_aio import CannedTCPServer, CannedUnixServer, quote
+
+
+def chunked(data, size):
+    """Split data into pieces of size bytes"""
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestJSONArrayStream(unittest.TestCase):
+    def setUp(self):
+        self.page = {
+            'units': [{'name': 'a.service', 'options': [{'value': '[x]'}]}, {'name': 'bé.service'}, 12345],
+            'nextPageToken': 'foo'
+        }
+        self.data = json.dumps(self.page).encode('utf-8')
+
+    def test_any_chunk_size(self):
+        """Elements and other members are decoded no matter where the chunks split"""
+        for size in (1, 2, 3, 7, len(self.data)):
+            stream = JSONArrayStream(chunked(self.data, size), 'units')
+
+            assert list(stream) == self.page['units']
+            assert stream.members == {'nextPageToken': 'foo'}
+
+    def test_members_before_array(self):
+        """Members before the array are collected too"""
+        stream = JSONArrayStream([b'{"nextPageToken": "foo", "units": [1, 2]}\n'], 'units')
+
+        assert list(stream) == [1, 2]
+        assert stream.members == {'nextPageToken': 'foo'}
+
+    def test_empty(self):
+        """Empty arrays and objects yield nothing"""
+        assert list(JSONArrayStream([b'{"units": []}'], 'units')) == []
+        assert list(JSONArrayStream([b'{}'], 'units')) == []
+
+    def test_missing_key(self):
+        """A response without the array yields nothing"""
+        stream = JSONArrayStream([b'{"machines": [1]}'], 'units')
+
+        assert list(stream) == []
+        assert stream.members == {'machines': [1]}
+
+    def test_incremental(self):
+        """Elements are yielded before the rest of the response is read"""
+        reads = []
+
+        def chunks():
+            for chunk in [b'{"units": [{"a": 1},', b' {"b": 2}]}']:
+                reads.append(chunk)
+                yield chunk
+
+        stream = iter(JSONArrayStream(chunks(), 'units'))
+
+        assert next(stream) == {'a': 1}
+        assert len(reads) == 1
+
+    def test_truncated(self):
+        """ValueError is raised if the response ends early"""
+
+        def test():
+            list(JSONArrayStream(chunked(self.data[:-5], 4), 'units'))
+
+        self.assertRaises(ValueError, test)
+
+    def test_not_an_object(self):
+        """ValueError is raised if the response isn't a JSON object"""
+
+        def test():
+            list(JSONArrayStream([b'[1, 2]'], 'units'))
+
+        self.assertRaises(ValueError, test)
+
+
+class TestStreamingClient(unittest.TestCase):
+    def setUp(self):
+        self.server = CannedTCPServer().start()
+        self.endpoint = 'http://{0}:{1}'.format(*self.server.server_address)
+
+        self.server.responses['/fleet/v1/units'] = (200, {
+            'units': [{'name': 'a.service', 'options': []}], 'nextPageToken': '2'
+        })
+        self.server.responses['/fleet/v1/units?nextPageToken=2'] = (200, {
+            'units': [{'name': 'b.service', 'options': []}]
+        })
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_bad_options(self):
+        """streaming can't be combined with http or prefetch_pages"""
+
+        def test_http():
+            Client(self.endpoint, http=True, streaming=True)
+
+        def test_prefetch():
+            Client(self.endpoint, engine='native', streaming=True, prefetch_pages=1)
+
+        self.assertRaises(ValueError, test_http)
+        self.assertRaises(ValueError, test_prefetch)
+
+    def test_list_units(self):
+        """Streamed listings follow pagination"""
+        client = Client(self.endpoint, engine='native', streaming=True)
+
+        assert [x.name for x in client.list_units()] == ['a.service', 'b.service']
+
+    def test_chunked(self):
+        """Chunked responses are streamed"""
+        self.server.chunked = True
+        client = Client(self.endpoint, engine='native', streaming=True)
+
+        assert [x.name for x in client.list_units()] == ['a.service', 'b.service']
+
+    def test_query_params(self):
+        """Filters are sent with streamed requests"""
+        self.server.responses['/fleet/v1/state?machineID=m1'] = (200, {
+            'states': [{'name': 'a.service', 'machineID': 'm1'}]
+        })
+        client = Client(self.endpoint, engine='native', streaming=True)
+
+        assert [x.name for x in client.list_unit_states(machine_id='m1')] == ['a.service']
+
+    def test_api_error(self):
+        """APIError is raised for error responses"""
+        client = Client(self.endpoint, engine='native', streaming=True)
+
+        def test():
+            list(client.list_machines())
+
+        self.assertRaises(APIError, test)
+
+
+class TestStreamingUnixClient(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'fleet.sock')
+
+        self.server = CannedUnixServer(self.path).start()
+        self.server.responses['/fleet/v1/machines'] = (200, {
+            'machines': [{'id': str(i), 'primaryIP': '198.51.100.1'} for i in range(3)]
+        })
+
+        self.client = Client('http+unix://' + quote(self.path, safe=''), engine='native', streaming=True)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        get_unix_socket_pool(self.path).close()
+        shutil.rmtree(self.tmpdir)
+
+    def test_keep_alive(self):
+        """Connections are reused once a streamed page has been read completely"""
+        for _ in range(3):
+            assert len(list(self.client.list_machines())) == 3
+
+        assert self.server.connections == 1
+
+    def test_abandoned(self):
+        """Connections are not reused if the page wasn't read completely"""
+        # make sure the first element arrives before the rest of the response has been read
+        self.client._STREAM_CHUNK_SIZE = 8
+
+        machines = self.client.list_machines()
+        next(machines)
+        machines.close()
+
+        assert len(list(self.client.list_machines())) == 3
+        assert self.server.connections == 2
@@ -8,6 +8,13 @@ from ..errors import APIError
 
 from apiclient.http import HttpMockSequence
 
+try:  # pragma: no cover
+    # python 2
+    from StringIO import StringIO
+except ImportError:  # pragma: no cover
+    # python 3
+    from io import StringIO
+
 
 class TestUnit(unittest.TestCase):
     def setUp(self):
@@ -116,6 +123,15 @@ class TestUnit(unittest.TestCase):
 
         assert unit.options == test_options
 
+    def test_from_string_continuation_blank_line(self):
+        """A trailing backslash followed by a blank line doesn't swallow the next section header"""
+        unit = Unit(from_string="[Service]\nExecStart=/bin/foo \\\n\n[Install]\nWantedBy=multi-user.target\n")
+
+        assert unit.options == [
+            {'section': 'Service', 'name': 'ExecStart', 'value': '/bin/foo'},
+            {'section': 'Install', 'name': 'WantedBy', 'value': 'multi-user.target'},
+        ]
+
     def test_options_no_desired_state(self):
         """Setting options explicitly works"""
         test_options = [{'section': 'Service', 'name': 'ExecStart', 'value': '/usr/bin/sleep 1d'}]
@@ -156,6 +172,55 @@ class TestUnit(unittest.TestCase):
 
         assert test_string == str(unit)
 
+    def test_str_section_order(self):
+        """Sections are rendered in the order they first appear, with their options in order"""
+        unit = Unit()
+
+        unit.add_option('X-Fleet', 'Conflicts', 'foo*.service')
+        unit.add_option('Unit', 'Description', 'foo')
+        unit.add_option('Service', 'ExecStartPre', '/bin/true')
+        unit.add_option('Unit', 'After', 'docker.service')
+        unit.add_option('Service', 'ExecStart', '/usr/bin/sleep 1d')
+
+        assert str(unit) == ("[X-Fleet]\nConflicts=foo*.service\n"
+                             "[Unit]\nDescription=foo\nAfter=docker.service\n"
+                             "[Service]\nExecStartPre=/bin/true\nExecStart=/usr/bin/sleep 1d")
+
+    def test_str_cached(self):
+        """The rendered unit is cached until options change"""
+        unit = Unit(from_string="[Service]\nExecStart=/usr/bin/sleep 1d")
+
+        assert unit.__str__() is unit.__str__()
+
+        unit.add_option('Service', 'ExecStop', '/bin/true')
+        assert str(unit) == "[Service]\nExecStart=/usr/bin/sleep 1d\nExecStop=/bin/true"
+
+        unit.remove_option('Service', 'ExecStart')
+        assert str(unit) == "[Service]\nExecStop=/bin/true"
+
+        unit.add_option('Service', 'ExecStop', '/bin/false')
+        unit.remove_option('Service', 'ExecStop', '/bin/true')
+        assert str(unit) == "[Service]\nExecStop=/bin/false"
+
+        unit._set_options_from_file(StringIO("[Unit]\nDescription=foo"))
+        assert str(unit) == "[Unit]\nDescription=foo"
+
+    def test_write(self):
+        """write() produces the same output as str(), cached or not"""
+        unit = Unit(from_string="[Unit]\nDescription=foo\n[Service]\nExecStart=/usr/bin/sleep 1d")
+
+        for _ in range(2):
+            fh = StringIO()
+            assert unit.write(fh)
+            assert fh.getvalue() == str(unit)
+
+    def test_write_empty(self):
+        """Writing a unit without options writes nothing"""
+        fh = StringIO()
+        Unit().write(fh)
+
+        assert fh.getvalue() == ''
+
     def test_is_live(self):
         """A unit is live if it as a client and data with a name key"""
 
@@ -244,6 +309,127 @@ class TestUnit(unittest.TestCase):
 
         assert test_options == unit.options
 
+    def test_get_option_values(self):
+        """All values for a section and name are returned in order"""
+        unit = Unit(from_string='[Service]\nEnvironment=A=1\nExecStart=/bin/true\nEnvironment=B=2\n'
+                                '[X-Fleet]\nEnvironment=C=3')
+
+        assert unit.get_option_values('Service', 'Environment') == ['A=1', 'B=2']
+        assert unit.get_option_values('X-Fleet', 'Environment') == ['C=3']
+        assert unit.get_option_values('Service', 'ExecStop') == []
+
+    def test_has_option(self):
+        """has_option checks section, name, and optionally value"""
+        unit = Unit(options=[{'section': 'Service', 'name': 'ExecStart', 'value': '/bin/true'}])
+
+        assert unit.has_option('Service', 'ExecStart')
+        assert unit.has_option('Service', 'ExecStart', '/bin/true')
+        assert not unit.has_option('Service', 'ExecStart', '/bin/false')
+        assert not unit.has_option('Unit', 'ExecStart')
+
+    def test_option_index_maintained(self):
+        """Lookups reflect add_option and remove_option"""
+        unit = Unit()
+
+        for i in range(5):
+            unit.add_option('Service', 'Environment', 'N={0}'.format(i))
+
+        assert unit.get_option_values('Service', 'Environment') == ['N=0', 'N=1', 'N=2', 'N=3', 'N=4']
+
+        unit.remove_option('Service', 'Environment', 'N=2')
+        unit.add_option('Service', 'Environment', 'N=5')
+
+        assert unit.get_option_values('Service', 'Environment') == ['N=0', 'N=1', 'N=3', 'N=4', 'N=5']
+
+        unit.remove_option('Service', 'Environment')
+
+        assert not unit.has_option('Service', 'Environment')
+        assert unit.options == []
+
+    def test_option_index_replaced(self):
+        """Lookups reflect options that have been replaced"""
+        unit = Unit()
+        unit.add_option('Service', 'ExecStart', '/bin/true')
+
+        assert unit.has_option('Service', 'ExecStart')
+
+        unit._set_options_from_file(StringIO('[Service]\nExecStop=/bin/false'))
+
+        assert not unit.has_option('Service', 'ExecStart')
+        assert unit.get_option_values('Service', 'ExecStop') == ['/bin/false']
+
+        unit._data['options'] = []
+
+        assert not unit.has_option('Service', 'ExecStop')
+
+    def test_option_index_same_length(self):
+        """Lookups reflect an add and a remove that leave the same number of options"""
+        unit = Unit()
+        unit.add_option('Service', 'ExecStart', '/bin/true')
+
+        assert unit.get_option_values('Service', 'ExecStart') == ['/bin/true']
+
+        unit.add_option('Service', 'ExecStart', '/bin/false')
+        unit.remove_option('Service', 'ExecStart', '/bin/true')
+
+        assert unit.get_option_values('Service', 'ExecStart') == ['/bin/false']
+
+    def test_remove_option_in_place(self):
+        """remove_option updates the options list rather than replacing it"""
+        unit = Unit()
+        unit.add_option('Service', 'ExecStart', '/bin/true')
+
+        options = unit.options
+        unit.remove_option('Service', 'ExecStart')
+
+        assert options is unit.options
+        assert options == []
+
+    def test_option_lookup_live(self):
+        """Live units can be looked up, even without options"""
+        unit = Unit(client=True, data={'name': 'test'})
+
+        assert unit.get_option_values('Service', 'ExecStart') == []
+        assert not unit.has_option('Service', 'ExecStart')
+
+    def test_content_hash(self):
+        """content_hash matches fleet's UnitState.hash, and follows changes to options"""
+        unit = Unit(from_string='[Service]\nExecStart=/bin/sleep 100')
+
+        assert unit.content_hash() == '1c6fb6f3684bafb0c173d8b8b957ceff031180c1'
+
+        unit.add_option('Service', 'ExecStop', '/bin/true')
+
+        assert unit.content_hash() != '1c6fb6f3684bafb0c173d8b8b957ceff031180c1'
+
+    def test_content_hash_no_options(self):
+        """Units without options hash the empty file"""
+        assert Unit(client=True, data={'name': 'test'}).content_hash() == 'da39a3ee5e6b4b0d3255bfef95601890afd80709'
+
+    def test_desired_state_live_no_read_back(self):
+        """set_desired_state on a live unit makes one request without read back, and fetches on demand"""
+
+        http = HttpMockSequence([
+            ({'status': '200'}, self._load_disccovery_fixture()),
+            ({'status': '204'}, None),
+            ({'status': '200'}, '{"currentState":"inactive","desiredState":"inactive","machineID":'
+                                '"2901a44df0834bef935e24a0ddddcc23","name":"test.service","options"'
+                                ':[{"name":"ExecStart","section":"Service","value":"/usr/bin/sleep 1d"}]}')
+        ])
+
+        client = Client('http://198.51.100.23:9160', http=http, read_back=False)
+
+        unit = Unit(client=client, data={'name': 'test.service', 'desiredState': 'launched', 'options': [
+            {'name': 'ExecStart', 'section': 'Service', 'value': '/usr/bin/sleep 1d'}
+        ]})
+
+        assert unit.set_desired_state('inactive') == 'inactive'
+        assert unit.options[0]['value'] == '/usr/bin/sleep 1d'
+        assert len(http._iterable) == 1
+
+        assert unit.currentState == 'inactive'
+        assert len(http._iterable) == 0
+
     def test_destroy_not_live(self):
         """Non live units cannot be destroyed"""
 
@@ -321,3 +507,4 @@ class TestUnit(unittest.TestCase):
         assert unit.set_desired_state('inactive') == 'inactive'
 
         assert unit.desiredState == 'inactive'
+        assert unit.machineID == '2901a44df0834bef935e24a0ddddcc23'
@@ -0,0 +1,140 @@
+import unittest
+
+import hashlib
+
+from ..errors import UnitFileError
+from ..objects import parse_unit_file, serialize_unit_file, unit_hash
+
+try:  # pragma: no cover
+    # python 2
+    from StringIO import StringIO
+except ImportError:  # pragma: no cover
+    # python 3
+    from io import StringIO
+
+
+def parse(text, **kwargs):
+    return parse_unit_file(StringIO(text), **kwargs)
+
+
+class TestParseUnitFile(unittest.TestCase):
+    def test_simple(self):
+        """Options are returned in order with their sections"""
+        assert parse("[Unit]\nDescription=foo\n[Service]\nExecStart=/bin/true\nExecStop=/bin/false\n") == [
+            {'section': 'Unit', 'name': 'Description', 'value': 'foo'},
+            {'section': 'Service', 'name': 'ExecStart', 'value': '/bin/true'},
+            {'section': 'Service', 'name': 'ExecStop', 'value': '/bin/false'},
+        ]
+
+    def test_empty(self):
+        """An empty file has no options"""
+        assert parse('') == []
+        assert parse('\n\n# nothing here\n') == []
+
+    def test_comments(self):
+        """Lines starting with # or ; are ignored, anywhere"""
+        assert parse("; header comment\n[Service]\n# a comment\n  ; indented\nExecStart=/bin/true # not a comment") == [
+            {'section': 'Service', 'name': 'ExecStart', 'value': '/bin/true # not a comment'}
+        ]
+
+    def test_whitespace(self):
+        """Whitespace around names and values is ignored, line endings are stripped"""
+        assert parse("[Service]\r\n  ExecStart = /bin/true  \r\nEnvironment=A=1\r\n") == [
+            {'section': 'Service', 'name': 'ExecStart', 'value': '/bin/true'},
+            {'section': 'Service', 'name': 'Environment', 'value': 'A=1'},
+        ]
+
+    def test_empty_value(self):
+        """Options can be assigned an empty value"""
+        assert parse("[Service]\nExecStartPre=") == [{'section': 'Service', 'name': 'ExecStartPre', 'value': ''}]
+
+    def test_continuation(self):
+        """Trailing backslashes continue values, skipping comments"""
+        options = parse("[Service]\nExecStart=/bin/foo \\\n  --bar \\\n# a comment\n  --baz\nExecStop=/bin/true")
+
+        assert options == [
+            {'section': 'Service', 'name': 'ExecStart', 'value': '/bin/foo   --bar   --baz'},
+            {'section': 'Service', 'name': 'ExecStop', 'value': '/bin/true'},
+        ]
+
+    def test_continuation_blank(self):
+        """A blank line ends a continued value"""
+        assert parse("[Service]\nExecStart=/bin/foo \\\n\nExecStop=/bin/true") == [
+            {'section': 'Service', 'name': 'ExecStart', 'value': '/bin/foo'},
+            {'section': 'Service', 'name': 'ExecStop', 'value': '/bin/true'},
+        ]
+
+    def test_continuation_header(self):
+        """A section header ends a continued value"""
+        assert parse("[Service]\nExecStart=/bin/foo \\\n[Install]\nWantedBy=multi-user.target") == [
+            {'section': 'Service', 'name': 'ExecStart', 'value': '/bin/foo'},
+            {'section': 'Install', 'name': 'WantedBy', 'value': 'multi-user.target'},
+        ]
+
+    def test_continuation_eof(self):
+        """A trailing backslash on the last line is dropped"""
+        assert parse("[Service]\nExecStart=/bin/foo\\") == [
+            {'section': 'Service', 'name': 'ExecStart', 'value': '/bin/foo'}
+        ]
+
+    def test_iterable(self):
+        """Any iterable of lines can be parsed"""
+        lines = iter(['[Service]\n', 'ExecStart=/bin/true\n'])
+
+        assert parse_unit_file(lines) == [{'section': 'Service', 'name': 'ExecStart', 'value': '/bin/true'}]
+
+    def test_first_error(self):
+        """By default parsing stops at the first error"""
+        try:
+            parse("Outside=1\n[Service]\nNoEquals\n")
+        except UnitFileError as exc:
+            assert exc.errors == [(1, 'Unexpected line outside of a section: Outside=1')]
+            assert isinstance(exc, ValueError)
+        else:
+            self.fail('UnitFileError not raised')
+
+    def test_collect_errors(self):
+        """With collect_errors every problem is reported"""
+        try:
+            parse("Outside=1\n[Service]\nExecStart=/bin/true\nNoEquals\n=nameless\n", collect_errors=True)
+        except UnitFileError as exc:
+            assert [x[0] for x in exc.errors] == [1, 4, 5]
+            assert 'Malformed line in section Service: NoEquals' in str(exc)
+        else:
+            self.fail('UnitFileError not raised')
+
+
+class TestSerializeUnitFile(unittest.TestCase):
+    def test_serialize(self):
+        """Options are grouped by first-seen section, with blank lines between sections"""
+        options = [
+            {'section': 'Unit', 'name': 'Description', 'value': 'foo'},
+            {'section': 'Service', 'name': 'ExecStart', 'value': '/bin/true'},
+            {'section': 'Unit', 'name': 'After', 'value': 'docker.service'},
+        ]
+
+        assert serialize_unit_file(options) == (
+            '[Unit]\nDescription=foo\nAfter=docker.service\n\n[Service]\nExecStart=/bin/true\n'
+        )
+
+    def test_serialize_empty(self):
+        """No options is an empty file"""
+        assert serialize_unit_file([]) == ''
+
+    def test_roundtrip(self):
+        """Serialized units parse back to the same options"""
+        options = parse("[Unit]\nDescription=foo\n[Service]\nExecStart=/bin/true\nEnvironment=A=1")
+
+        assert parse(serialize_unit_file(options)) == options
+
+    def test_hash(self):
+        """The hash matches fleet's (from fleet's unit tests)"""
+        options = [{'section': 'Service', 'name': 'ExecStart', 'value': '/bin/sleep 100'}]
+
+        assert unit_hash(options) == '1c6fb6f3684bafb0c173d8b8b957ceff031180c1'
+
+    def test_hash_unicode(self):
+        """Values are hashed as UTF-8"""
+        options = [{'section': 'Unit', 'name': 'Description', 'value': u'caf\xe9'}]
+
+        assert unit_hash(options) == hashlib.sha1(u'[Unit]\nDescription=caf\xe9\n'.encode('utf-8')).hexdigest()
@@ -0,0 +1,75 @@
+import unittest
+
+from ..objects import UnitState, UnitStateTable
+
+
+class TestUnitStateTable(unittest.TestCase):
+    def setUp(self):
+        self.states = [
+            {'name': 'a.service', 'hash': '1', 'machineID': 'm1', 'systemdLoadState': 'loaded',
+             'systemdActiveState': 'active', 'systemdSubState': 'running'},
+            {'name': 'b.service', 'hash': '2', 'machineID': 'm1', 'systemdLoadState': 'loaded',
+             'systemdActiveState': 'failed', 'systemdSubState': 'failed'},
+            {'name': 'c.service', 'hash': '3', 'machineID': 'm2', 'systemdLoadState': 'loaded',
+             'systemdActiveState': 'failed', 'systemdSubState': 'failed'},
+            {'name': 'd.service', 'hash': '4', 'machineID': 'm2', 'systemdLoadState': 'loaded',
+             'systemdActiveState': 'active', 'systemdSubState': 'running'},
+        ]
+
+        self.table = UnitStateTable(self.states)
+
+    def test_rows(self):
+        """Rows are returned as UnitStates, in order"""
+        assert len(self.table) == 4
+
+        assert isinstance(self.table[0], UnitState)
+        assert [x.as_dict() for x in self.table] == self.states
+
+    def test_missing_fields(self):
+        """Fields missing from a state are missing from it's row"""
+        table = UnitStateTable([{'name': 'a.service'}])
+
+        assert table[0].as_dict() == {'name': 'a.service'}
+
+    def test_from_unit_states(self):
+        """UnitStates can be loaded too"""
+        table = UnitStateTable(UnitState(data=x) for x in self.states)
+
+        assert table.column('name') == ['a.service', 'b.service', 'c.service', 'd.service']
+
+    def test_values(self):
+        """values returns the distinct values of a field"""
+        assert self.table.values('machineID') == set(['m1', 'm2'])
+        assert self.table.filter(machineID='m1').values('machineID') == set(['m1'])
+
+    def test_filter(self):
+        """filter returns the rows matching every condition"""
+        failed = self.table.filter(systemdSubState='failed')
+
+        assert failed.column('name') == ['b.service', 'c.service']
+
+        assert self.table.filter(systemdSubState='failed', machineID='m2').column('name') == ['c.service']
+        assert self.table.filter(machineID=['m1', 'm2']).column('name') == self.table.column('name')
+        assert len(self.table.filter(machineID='m3')) == 0
+        assert len(self.table.filter()) == 4
+
+    def test_count(self):
+        """count counts rows per value"""
+        assert self.table.filter(systemdSubState='failed').count('machineID') == {'m1': 1, 'm2': 1}
+        assert self.table.count('systemdActiveState') == {'active': 2, 'failed': 2}
+
+    def test_group_by(self):
+        """group_by splits the table per value"""
+        groups = self.table.group_by('machineID')
+
+        assert sorted(groups) == ['m1', 'm2']
+        assert groups['m2'].column('name') == ['c.service', 'd.service']
+
+    def test_filtered_append(self):
+        """Appending to a filtered table doesn't affect the original"""
+        failed = self.table.filter(systemdSubState='failed')
+        failed.append({'name': 'e.service', 'machineID': 'm3', 'systemdSubState': 'failed'})
+
+        assert len(failed) == 3
+        assert len(self.table) == 4
+        assert self.table.values('machineID') == set(['m1', 'm2'])
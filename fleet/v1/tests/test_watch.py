@@ -0,0 +1,153 @@
+import unittest
+
+import threading  # NOQA
+
+import mock
+
+from ..watch import UnitStateWatcher, diff_unit_states, snapshot_unit_states
+from .helpers import FakeClient, unit_state_data
+
+
+class TestDiff(unittest.TestCase):
+    def test_diff(self):
+        """States are matched by name and machine, and compared by hash and systemd state"""
+        previous = snapshot_unit_states([
+            unit_state_data('same.service'),
+            unit_state_data('changed.service'),
+            unit_state_data('upgraded.service'),
+            unit_state_data('moved.service', machine='a'),
+            unit_state_data('gone.service'),
+        ])
+        current = snapshot_unit_states([
+            unit_state_data('same.service'),
+            unit_state_data('changed.service', sub='failed'),
+            unit_state_data('upgraded.service', hash='h2'),
+            unit_state_data('moved.service', machine='b'),
+            unit_state_data('new.service'),
+        ])
+
+        events = sorted((e.type, e.name, e.machine_id) for e in diff_unit_states(previous, current))
+
+        assert events == [
+            ('added', 'moved.service', 'b'),
+            ('added', 'new.service', 'a'),
+            ('changed', 'changed.service', 'a'),
+            ('changed', 'upgraded.service', 'a'),
+            ('removed', 'gone.service', 'a'),
+            ('removed', 'moved.service', 'a'),
+        ]
+
+    def test_event_states(self):
+        """Events carry the states before and after"""
+        (event,) = diff_unit_states(
+            snapshot_unit_states([unit_state_data('foo.service')]),
+            snapshot_unit_states([unit_state_data('foo.service', sub='failed')])
+        )
+
+        assert event.state.systemdSubState == 'failed'
+        assert event.previous.systemdSubState == 'running'
+
+        (event,) = diff_unit_states(snapshot_unit_states([unit_state_data('foo.service')]), {})
+
+        assert event.type == 'removed'
+        assert event.state is None
+        assert event.previous.name == 'foo.service'
+
+    def test_unchanged(self):
+        """Identical snapshots have no events"""
+        states = [unit_state_data('foo.service'), unit_state_data('foo.service', machine='b')]
+
+        assert diff_unit_states(snapshot_unit_states(states), snapshot_unit_states(states)) == []
+
+
+class TestUnitStateWatcher(unittest.TestCase):
+    def test_initial(self):
+        """The first poll reports everything as added, unless initial is False"""
+        client = FakeClient([unit_state_data('foo.service')])
+
+        assert [e.type for e in UnitStateWatcher(client).poll()] == ['added']
+        assert UnitStateWatcher(client, initial=False).poll() == []
+
+    def test_filters(self):
+        """Filters are passed to the listing"""
+        client = FakeClient([])
+
+        UnitStateWatcher(client, machine_id='a', unit_name='foo.service').poll()
+
+        assert client.calls == [
+            ('UnitState.List', 'states', {'machineID': 'a', 'unitName': 'foo.service'})
+        ]
+
+    def test_adaptive_interval(self):
+        """Quiet polls back off up to max_interval, and a change resets to min_interval"""
+        quiet = [unit_state_data('foo.service')]
+        client = FakeClient(quiet, quiet, quiet, quiet, quiet, [unit_state_data('foo.service', sub='failed')])
+        watcher = UnitStateWatcher(client, min_interval=1, max_interval=5)
+
+        intervals = []
+        for _ in range(6):
+            watcher.poll()
+            intervals.append(watcher.interval)
+
+        assert intervals == [1, 2, 4, 5, 5, 1]
+        assert watcher.polls == 6
+
+    def test_iterate(self):
+        """Iterating polls until stopped, waiting interval between polls"""
+        client = FakeClient(
+            [unit_state_data('foo.service')], [unit_state_data('foo.service'), unit_state_data('bar.service')]
+        )
+        watcher = UnitStateWatcher(client, min_interval=0.001, max_interval=0.001)
+
+        events = []
+        for event in watcher:
+            events.append((event.type, event.name))
+            if len(events) == 2:
+                watcher.stop()
+
+        assert events == [('added', 'foo.service'), ('added', 'bar.service')]
+
+        # the wait after each poll uses the interval that poll chose
+        watcher = UnitStateWatcher(client, min_interval=2, max_interval=3)
+        with mock.patch.object(watcher._stopped, 'wait', return_value=True) as wait:
+            assert len(list(watcher)) == 2
+
+        wait.assert_called_once_with(2)
+
+    def test_callback(self):
+        """start() calls callback from a background thread until stopped"""
+        client = FakeClient([unit_state_data('foo.service')])
+        watcher = UnitStateWatcher(client, min_interval=0.01, max_interval=0.01)
+
+        seen = threading.Event()
+        events = []
+
+        def callback(event):
+            events.append(event)
+            seen.set()
+
+        watcher.start(callback)
+        assert seen.wait(5)
+
+        watcher.stop()
+        watcher.join(5)
+
+        assert [e.name for e in events] == ['foo.service']
+        assert watcher.error is None
+        self.assertRaises(RuntimeError, watcher.start, callback)
+
+    def test_callback_error(self):
+        """Errors stop the background thread and are stored"""
+        client = mock.Mock()
+        client._list.side_effect = ValueError('boom')
+
+        watcher = UnitStateWatcher(client).start(lambda event: None)
+        watcher.join(5)
+
+        assert isinstance(watcher.error, ValueError)
+
+    def test_bad_intervals(self):
+        """ValueError is raised for invalid intervals"""
+        self.assertRaises(ValueError, UnitStateWatcher, FakeClient([]), min_interval=-1)
+        self.assertRaises(ValueError, UnitStateWatcher, FakeClient([]), min_interval=0)
+        self.assertRaises(ValueError, UnitStateWatcher, FakeClient([]), min_interval=10, max_interval=5)
@@ -0,0 +1,216 @@
+import threading
+
+from collections import namedtuple
+
+from .objects import UnitState
+
+# fields that are compared to decide if a unit state has changed, name and machineID are the key
+COMPARED_FIELDS = ('hash', 'systemdLoadState', 'systemdActiveState', 'systemdSubState')
+
+
+class UnitStateEvent(namedtuple('UnitStateEvent', ['type', 'name', 'machine_id', 'state', 'previous'])):
+    """A change to the state of a unit on a machine
+
+    Attributes:
+        type (str): 'added', 'changed', or 'removed'
+        name (str): The name of the unit
+        machine_id (str): The ID of the machine the unit is on
+        state (UnitState): The state now, None if it was removed
+        previous (UnitState): The state before, None if it was added
+    """
+    __slots__ = ()
+
+
+def snapshot_unit_states(states):
+    """Index unit states by (name, machineID) for diff_unit_states()
+
+    Each state is stored with a tuple of the fields in ``COMPARED_FIELDS``, so comparing two snapshots compares a
+    few (usually interned) strings per state rather than whole objects.
+
+    Args:
+        states (iterable): dicts, as returned by fleet
+
+    Returns:
+        dict: (name, machineID) -> (fields compared, dict)
+    """
+    snapshot = {}
+    for data in states:
+        key = (data.get('name'), data.get('machineID'))
+        snapshot[key] = (tuple([data.get(field) for field in COMPARED_FIELDS]), data)
+
+    return snapshot
+
+
+def diff_unit_states(previous, current):
+    """Compare two snapshots from snapshot_unit_states()
+
+    Args:
+        previous (dict): The older snapshot
+        current (dict): The newer snapshot
+
+    Returns:
+        list: A UnitStateEvent for each state added, changed, or removed
+    """
+    events = []
+    added = 0
+
+    for (key, (fields, data)) in current.items():
+        before = previous.get(key)
+
+        if before is None:
+            events.append(UnitStateEvent('added', key[0], key[1], UnitState(data=data), None))
+            added += 1
+        elif before[0] != fields:
+            events.append(UnitStateEvent('changed', key[0], key[1], UnitState(data=data), UnitState(data=before[1])))
+
+    # only look for removals if fewer keys are shared than there were before
+    if len(current) - added < len(previous):
+        for (key, (_, data)) in previous.items():
+            if key not in current:
+                events.append(UnitStateEvent('removed', key[0], key[1], None, UnitState(data=data)))
+
+    return events
+
+
+class UnitStateWatcher(object):
+    """Poll fleet's unit states, and report what changed between polls
+
+    Iterate over a watcher to receive UnitStateEvents as they're seen, or call start() to have a callback called for
+    each one from a background thread.  Polls start ``min_interval`` apart.  Each poll that sees no changes doubles
+    the interval, up to ``max_interval``, and any change brings it straight back to ``min_interval``, so a quiet
+    cluster is asked less often and a busy one is followed closely.
+
+        >>> for event in fleet_client.watch_unit_states():
+        ...     print(event.type, event.name, event.machine_id, event.state and event.state.systemdSubState)
+        added foo.service 2901a44df0834bef935e24a0ddddcc23 running
+        changed foo.service 2901a44df0834bef935e24a0ddddcc23 failed
+
+    Use Client.watch_unit_states() rather than creating this directly.
+
+    Attributes:
+        interval (float): Seconds until the next poll
+        polls (int): The number of times unit states have been listed
+        error (Exception): What stopped a watcher running in the background, if anything did
+
+    """
+
+    def __init__(self, client, machine_id=None, unit_name=None, min_interval=1, max_interval=30, initial=True):
+        """
+        Args:
+            client (fleet.v1.Client): The client to poll with
+            machine_id (str): Only watch unit states on this machine
+            unit_name (str): Only watch unit states for this unit
+            min_interval (float): Seconds between polls while things are changing
+            max_interval (float): The most seconds between polls while nothing is changing
+            initial (bool): Report every unit state found by the first poll as added. If False, the first poll is
+                            only used to compare the next one with.
+
+        Raises:
+            ValueError: min_interval is not positive, or is greater than max_interval
+        """
+        # with no interval at all, a quiet cluster would be polled as fast as it can answer
+        if min_interval <= 0 or min_interval > max_interval:
+            raise ValueError('min_interval must be > 0 and <= max_interval')
+
+        self.client = client
+        self.machine_id = machine_id
+        self.unit_name = unit_name
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+        self.interval = min_interval
+        self.polls = 0
+        self.error = None
+
+        # None until the first poll, unless that should report everything as added
+        self._snapshot = {} if initial else None
+
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def __iter__(self):
+        """Poll until stopped, yielding each change as it's seen
+
+        Yields:
+            UnitStateEvent: The next change
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400
+        """
+        while not self._stopped.is_set():
+            for event in self.poll():
+                yield event
+
+            if self._stopped.wait(self.interval):
+                return
+
+    def poll(self):
+        """List unit states once, and compare them to the last poll
+
+        Returns:
+            list: A UnitStateEvent for each change since the last poll
+
+        Raises:
+            fleet.v1.errors.APIError: Fleet returned a response code >= 400
+        """
+        snapshot = snapshot_unit_states(self.client._list(
+            'UnitState.List', 'states', intern='unit_state', machineID=self.machine_id, unitName=self.unit_name
+        ))
+        self.polls += 1
+
+        if self._snapshot is None:
+            events = []
+        else:
+            events = diff_unit_states(self._snapshot, snapshot)
+
+        self._snapshot = snapshot
+
+        if events:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(max(self.interval * 2, self.min_interval), self.max_interval)
+
+        return events
+
+    def _run(self, callback):
+        try:
+            for event in self:
+                callback(event)
+        except Exception as exc:
+            self.error = exc
+
+    def start(self, callback):
+        """Call callback with each change, from a background thread, until stopped
+
+        If polling or the callback raises an exception, the thread stops and the exception is stored in ``error``.
+
+        Args:
+            callback (callable): Called with each UnitStateEvent
+
+        Returns:
+            UnitStateWatcher: self
+
+        Raises:
+            RuntimeError: The watcher has already been started
+        """
+        if self._thread is not None:
+            raise RuntimeError('This watcher has already been started')
+
+        self._thread = threading.Thread(target=self._run, args=(callback,))
+        self._thread.daemon = True
+        self._thread.start()
+
+        return self
+
+    def stop(self):
+        """Stop watching, once the poll in progress (if any) has finished"""
+        self._stopped.set()
+
+    def join(self, timeout=None):
+        """Wait for the background thread started by start() to finish
+
+        Args:
+            timeout (float, optional): The most seconds to wait
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)